@@ -9,7 +9,8 @@ from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, asdict
 import asyncio
 from datetime import datetime
-import requests
+from services import http_client
+from services.county_resolver import resolve_county
 from functools import lru_cache
 
 
@@ -53,7 +54,7 @@ class LocationResolver:
             }
             headers = {'User-Agent': 'EnvironmentalForecastEnhancer/1.0'}
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = http_client.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -75,7 +76,7 @@ class LocationResolver:
         # In production, use a proper zip code database
         try:
             url = f"https://api.zippopotam.us/{country}/{zip_code}"
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -90,15 +91,24 @@ class LocationResolver:
         return None
     
     @staticmethod
-    def get_fips_codes(lat: float, lon: float) -> Dict[str, str]:
-        """Get FIPS codes for census data lookup"""
-        # This would use FCC's API or a local database
-        # Simplified for demonstration
-        return {
-            'state': '36',  # Example: New York
-            'county': '061',  # Example: New York County
-            'tract': '007502'  # Example tract
-        }
+    def get_fips_codes(lat: float, lon: float) -> Optional[Dict[str, str]]:
+        """
+        Get FIPS codes for census data lookup.
+        Returns None when the point is outside every county or the geocoder fails.
+        """
+        # Bundled county index first; the Census geocoder only outside its coverage
+        try:
+            county = resolve_county(lat, lon)
+            if county:
+                return {
+                    'state': county['state_fips'],
+                    'county': county['county_fips'],
+                    'tract': county.get('tract') or '*'  # All tracts in the county when unresolved
+                }
+        except Exception as e:
+            print(f"FIPS lookup error: {e}")
+        
+        return None
 
 
 class EnhancementOptions:
@@ -166,7 +176,7 @@ class WaterQualityAnalyzer:
                 'sorted': 'no'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
+            response = http_client.get(self.base_url, params=params, timeout=15)
             response.raise_for_status()
             
             data = response.json()
@@ -6,16 +6,33 @@ import time
 import sys
 from dotenv import load_dotenv
 import anthropic
-import requests
 import numpy as np
 from datetime import datetime
 from services.simulate import (
     run_full_simulation,
+    run_ensemble_simulation,
+    iter_simulation_chunks,
+    assemble_simulation_result,
     create_climate_data_from_api,
     create_datacenter_specs_from_config,
     create_grid_info_from_location,
+    estimate_annual_power,
+    naive_utc,
     GridImpactCalculator
 )
+from services.cache import SimulationCache, run_cached_simulation, simulation_cache_key
+from services.location_cache import LocationCache
+from services.county_resolver import census_geocode, get_county_resolver
+from services.acs_table import acs5_url, get_acs_table
+from services.tariff import calculate_tou_cost, get_tariff
+from services.carbon import calculate_hourly_emissions
+from services.optimizer import FLEXIBLE_WORKLOAD_TYPES, optimize_load_shifting
+from services.sweep import run_parameter_sweep
+from services.surrogate import get_surrogate_grid
+from services.representative_days import run_representative_simulation
+from services.projection import ProjectionSchedule, run_projection
+from services.pipeline import StagePipeline
+from services import http_client
 
 load_dotenv('config.env')
 
@@ -34,6 +51,22 @@ if not ANTHROPIC_API_KEY:
 
 client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
 
+# On-disk cache of simulation results shared by the forecast endpoints
+SIMULATION_CACHE = SimulationCache(
+    os.getenv('SIMULATION_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'simulation_cache')),
+    max_bytes=int(os.getenv('SIMULATION_CACHE_MAX_MB', '512')) * 1024 * 1024
+)
+
+# Memory + SQLite cache of geocoder (lat/lon -> FIPS) and ACS (FIPS -> population) lookups
+LOCATION_CACHE = LocationCache(
+    os.getenv('LOCATION_CACHE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'location_cache.sqlite3'))
+)
+
+# Load the bundled ACS county table and county index at startup (lookups skip the
+# Census APIs); either one missing is reported here rather than on the first request
+get_acs_table()
+get_county_resolver()
+
 def calculate_water_consumption(servers: int, cooling_type: str = 'air_cooled') -> int:
     """
     Calculate daily water consumption based on server count and cooling type.
@@ -103,6 +136,9 @@ DATA_CENTER_TIERS = {
     }
 }
 
+# Upper bound on Monte Carlo members per /api/forecast request
+MAX_ENSEMBLE_SIZE = 1000
+
 # New 
 def map_state_to_grid_region(state_fips: str) -> str:
    
@@ -226,66 +262,161 @@ def get_state_name_from_fips(state_fips: str) -> str:
     }
     return fips_to_state.get(state_fips, 'Unknown')
 
-def get_population_data(lat, lon):
-    """Fetch population and median income from Census API given coordinates."""
+def parse_simulation_seed(data):
+    """
+    Read the optional 'seed' and 'start_date' (ISO 8601) request fields.
+    A start_date with a UTC offset is converted to UTC. Replaying a forecast
+    with the seed and start_date reported in its simulation section
+    reproduces the same hourly profile.
+    
+    start_date defaults to midnight today so identical seeded requests made
+    on the same day share a simulation cache entry; unseeded requests are
+    fresh draws and bypass the cache.
+    """
+    seed = data.get('seed')
+    if seed is not None:
+        seed = int(seed)
+        if seed < 0:
+            raise ValueError("seed must be a non-negative integer")
+    
+    start_date = data.get('start_date')
+    if start_date is not None:
+        start_date = naive_utc(start_date)
+    else:
+        start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    return seed, start_date
+
+def parse_simulation_hours(data):
+    """Read the optional 'simulation_hours' request field (default one year); must be at least 1."""
+    simulation_hours = int(data.get('simulation_hours', 8760))
+    if simulation_hours < 1:
+        raise ValueError("simulation_hours must be a positive integer")
+    return simulation_hours
+
+def downsample_for_json(sim_result, view='daily'):
+    """Min/max/mean of power, utilization and PUE per bucket as JSON-ready lists."""
+    return {
+        series: {stat: values.tolist() for stat, values in stats.items()}
+        for series, stats in sim_result.downsample(view).items()
+    }
+
+def build_preview_report(datacenter_config, location_data, climate_data, lat, lon, start_date=None):
+    """
+    Instant estimate for mode=preview: expected energy, PUE and peak from the
+    analytic estimator, costed at the region's flat rate and mean carbon
+    intensity. No simulation and no LLM analysis.
+    """
+    state_fips = location_data.get('state_fips', '')
+    region_code = map_state_to_grid_region(state_fips)
+    grid_calculator = GridImpactCalculator()
+    grid_config = grid_calculator.grid_regions.get(region_code, grid_calculator.grid_regions['DEFAULT'])
+    
+    estimate = estimate_annual_power(
+        create_datacenter_specs_from_config(datacenter_config),
+        create_climate_data_from_api(climate_data),
+        create_grid_info_from_location(location_data, region_code),
+        start_date=start_date
+    )
+    annual_kwh = estimate.expected_annual_mwh * 1000
+    annual_co2_tons = annual_kwh * grid_config['carbon_intensity'] / 907.185
+    
+    return {
+        'mode': 'preview',
+        'timestamp': datetime.utcnow().isoformat(),
+        'location': {
+            'latitude': lat,
+            'longitude': lon,
+            'name': location_data.get('location_name', 'Unknown'),
+            'state': get_state_name_from_fips(state_fips),
+            'grid_region': region_code,
+            'population': location_data.get('population', 0)
+        },
+        'datacenter': datacenter_config,
+        'estimate': estimate.to_dict(),
+        'energy': {
+            'annual_mwh': estimate.expected_annual_mwh,
+            'annual_cost': annual_kwh * grid_config['base_rate'],
+            'peak_power_kw': estimate.approximate_peak_kw,
+            'average_power_kw': estimate.expected_average_power_kw,
+            'average_pue': estimate.expected_pue
+        },
+        'carbon': {
+            'annual_tons_co2': annual_co2_tons,
+            'carbon_intensity': grid_config['carbon_intensity'],
+            'equivalent_cars': annual_co2_tons / 4.6
+        },
+        'community_impact': estimate.community_impact
+    }
+
+def geocode_county(lat, lon):
+    """Resolve coordinates to state/county FIPS: bundled county index, then cache, then Census geocoder."""
+    resolver = get_county_resolver()
+    county = resolver.lookup(lat, lon) if resolver is not None else None
+    if county is not None:
+        return {"state_fips": county["state_fips"], "county_fips": county["county_fips"]}
+
+    cached = LOCATION_CACHE.get_fips(lat, lon)
+    if cached is not None:
+        return cached
+
     try:
-        print("✅ Running get_population_data from:", __file__, file=sys.stderr)
-
-        # Step 1: Get state/county FIPS from coordinates
-        geo_url = "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
-        geo_params = {
-            "x": lon,
-            "y": lat,
-            "benchmark": "Public_AR_Current",
-            "vintage": "Current_Current",
-            "format": "json"
-        }
-        geo_resp = requests.get(geo_url, params=geo_params)
-        geo_json = geo_resp.json() if geo_resp.status_code == 200 else {}
+        county = census_geocode(lat, lon)
+        if county is None:
+            return {"state_fips": "", "county_fips": ""}
 
-        counties = geo_json.get("result", {}).get("geographies", {}).get("Counties", [])
-        if not counties:
-            return {"location_name": "Unknown", "population": 0, "median_income": 0,
-                    "state_fips": "", "county_fips": ""}
+        geo = {"state_fips": county["state_fips"], "county_fips": county["county_fips"]}
+        LOCATION_CACHE.put_fips(lat, lon, geo)
+        return geo
 
-        county = counties[0]
-        state_fips = county.get("STATE", "")
-        county_fips = county.get("COUNTY", "")
+    except Exception as e:
+        print("DEBUG: Exception in geocode_county:", e, file=sys.stderr)
+        return {"state_fips": "", "county_fips": ""}
+
+
+def get_acs_population(geo):
+    """Population and median income for a geocoded county: bundled ACS table, then cache, then Census API."""
+    state_fips = geo.get("state_fips", "")
+    county_fips = geo.get("county_fips", "")
+    unknown = {
+        "location_name": "Unknown",
+        "population": 0,
+        "median_income": 0,
+        "state_fips": state_fips,
+        "county_fips": county_fips
+    }
+    if not county_fips:
+        return unknown
+    table = get_acs_table()
+    bundled = table.lookup(state_fips, county_fips) if table is not None else None
+    if bundled is not None:
+        return bundled
+    cached = LOCATION_CACHE.get_acs(state_fips, county_fips)
+    if cached is not None:
+        return cached
 
-        # Step 2: Get population data from Census API
-        pop_url = "https://api.census.gov/data/2021/acs/acs5"
+    try:
+        pop_url = acs5_url()
         pop_params = {
             "get": "NAME,B01003_001E,B19013_001E",
             "for": f"county:{county_fips}",
             "in": f"state:{state_fips}",
             "key": CENSUS_API_KEY
         }
-        pop_resp = requests.get(pop_url, params=pop_params)
+        pop_resp = http_client.get(pop_url, params=pop_params)
         print("DEBUG: Census URL =", pop_resp.url, file=sys.stderr)
         print("DEBUG: Status =", pop_resp.status_code, file=sys.stderr)
 
         if pop_resp.status_code != 200:
             print("DEBUG: Bad Census response:", pop_resp.text[:200], file=sys.stderr)
-            return {
-                "location_name": "Unknown",
-                "population": 0,
-                "median_income": 0,
-                "state_fips": state_fips,
-                "county_fips": county_fips
-            }
+            return unknown
 
         try:
             pop_data = pop_resp.json()
         except Exception as e:
             print("DEBUG: JSON decode error:", e, file=sys.stderr)
             print("DEBUG: Response text:", pop_resp.text[:200], file=sys.stderr)
-            return {
-                "location_name": "Unknown",
-                "population": 0,
-                "median_income": 0,
-                "state_fips": state_fips,
-                "county_fips": county_fips
-            }
+            return unknown
 
         if isinstance(pop_data, list) and len(pop_data) >= 2:
             row = pop_data[1]
@@ -294,36 +425,57 @@ def get_population_data(lat, lon):
                 median_income = int(row[2])
             except:
                 median_income = 0
-            return {
+            location = {
                 "location_name": row[0],
                 "population": population,
                 "median_income": median_income,
                 "state_fips": state_fips,
                 "county_fips": county_fips
             }
+            LOCATION_CACHE.put_acs(location)
+            return location
 
-        return {
-            "location_name": "Unknown",
-            "population": 0,
-            "median_income": 0,
-            "state_fips": state_fips,
-            "county_fips": county_fips
-        }
+        return unknown
 
     except Exception as e:
-        print("DEBUG: Exception in get_population_data:", e, file=sys.stderr)
-        return {
-            "location_name": "Unknown",
-            "population": 0,
-            "median_income": 0
-        }
+        print("DEBUG: Exception in get_acs_population:", e, file=sys.stderr)
+        return unknown
+
+
+def get_population_data(lat, lon):
+    """Fetch population and median income from Census API given coordinates."""
+    print("✅ Running get_population_data from:", __file__, file=sys.stderr)
+    return get_acs_population(geocode_county(lat, lon))
+
+
+# Stream event sent when each fetch stage completes
+FETCH_STAGE_EVENTS = {
+    'location': 'location_data_complete',
+    'energy': 'energy_data_complete',
+    'climate': 'climate_data_complete'
+}
+
+
+def build_fetch_pipeline(lat, lon, include_energy=True):
+    """
+    Upstream fetches as a stage graph: weather and the geocoder start at once,
+    ACS population and EIA prices as soon as the county is known.
+    Stages: 'climate', 'geocode', 'location' and (optionally) 'energy'.
+    """
+    pipeline = StagePipeline()
+    pipeline.add('climate', lambda: get_climate_data(lat, lon))
+    pipeline.add('geocode', lambda: geocode_county(lat, lon))
+    pipeline.add('location', lambda geo: get_acs_population(geo), depends_on=['geocode'])
+    if include_energy:
+        pipeline.add('energy', lambda geo: get_energy_data(geo.get('state_fips', '')), depends_on=['geocode'])
+    return pipeline
 
 
 def get_energy_data(state_code):
     """Get energy cost data from EIA API"""
     try:
         # Get state electricity prices
-        response = requests.get(
+        response = http_client.get(
             f'https://api.eia.gov/v2/electricity/retail-sales/data/',
             params={
                 'api_key': EIA_API_KEY,
@@ -361,7 +513,7 @@ def get_energy_data(state_code):
 def get_climate_data(lat, lon):
     """Get climate data from OpenWeatherMap"""
     try:
-        response = requests.get(
+        response = http_client.get(
             'https://api.openweathermap.org/data/2.5/weather',
             params={
                 'lat': lat,
@@ -564,14 +716,15 @@ Energy Performance:
 - Average Power: {sim_result.average_power_kw:,.0f} kW
 - Annual Consumption: {sim_result.annual_consumption_mwh:,.0f} MWh
 - Annual Energy Cost: ${annual_cost:,.0f}
-- Average PUE: {np.mean(sim_result.hourly_pue):.2f}
-- Best PUE: {min(sim_result.hourly_pue):.2f}
-- Worst PUE: {max(sim_result.hourly_pue):.2f}
+- Average PUE: {sim_result.summary.pue.mean:.2f}
+- Best PUE: {sim_result.summary.pue.min:.2f}
+- Worst PUE: {sim_result.summary.pue.max:.2f}
+- Load Factor: {sim_result.summary.load_factor:.2f}
 
 Workload Characteristics:
-- Average Utilization: {np.mean(sim_result.hourly_utilization):.1f}%
-- Peak Utilization: {max(sim_result.hourly_utilization):.1f}%
-- Minimum Utilization: {min(sim_result.hourly_utilization):.1f}%
+- Average Utilization: {sim_result.summary.utilization.mean:.1f}%
+- Peak Utilization: {sim_result.summary.utilization.max:.1f}%
+- Minimum Utilization: {sim_result.summary.utilization.min:.1f}%
 
 Carbon Impact:
 - Annual CO2 Emissions: {annual_co2_tons:,.0f} tons
@@ -636,11 +789,11 @@ def calculate_impact_with_simulation(datacenter_config, location_data, energy_da
     annual_kwh = sim_result.annual_consumption_mwh * 1000
     annual_cost = annual_kwh * energy_data['price_per_kwh']
     
-    # Calculate carbon using grid-specific carbon intensity
+    # Calculate carbon from the region's month x hour-of-day carbon profile
     grid_calculator = GridImpactCalculator()
     grid_config = grid_calculator.grid_regions.get(region_code, grid_calculator.grid_regions['DEFAULT'])
-    annual_co2_kg = annual_kwh * grid_config['carbon_intensity']
-    annual_co2_tons = annual_co2_kg / 907.185  # kg to US tons
+    emissions = calculate_hourly_emissions(sim_result, region_code)
+    annual_co2_tons = emissions.annual_tons_co2
     
     return {
         'energy': {
@@ -649,19 +802,22 @@ def calculate_impact_with_simulation(datacenter_config, location_data, energy_da
             'annual_cost': annual_cost,
             'peak_power_kw': sim_result.peak_power_kw,
             'average_power_kw': sim_result.average_power_kw,
-            'average_pue': np.mean(sim_result.hourly_pue),
+            'average_pue': sim_result.summary.pue.mean,
             'percent_increase': sim_result.community_impact['average_impact_percent']
         },
         'carbon': {
             'annual_tons_co2': annual_co2_tons,
             'carbon_intensity': grid_config['carbon_intensity'],
+            'average_intensity_kg_kwh': emissions.average_intensity,
+            'optimal_hours': emissions.optimal_hours,
             'equivalent_cars': annual_co2_tons / 4.6,
             'equivalent_homes': annual_kwh / 10000
         },
         'grid_impact': sim_result.community_impact,
         'simulation': {
             'hourly_data_available': True,
-            'hours_simulated': len(sim_result.hourly_power_kw)
+            'hours_simulated': len(sim_result.hourly_power_kw),
+            'load_factor': sim_result.summary.load_factor
         }
     }
 
@@ -690,15 +846,20 @@ def analyze_datacenter():
         else:
             datacenter_config = DATA_CENTER_TIERS.get(dc_size, DATA_CENTER_TIERS['medium'])
         
-        # Gather data from various APIs
+        # Gather data from various APIs (independent fetches run concurrently)
         print(f"Fetching data for location: {lat}, {lon}")
-        location_data = get_population_data(lat, lon)
+        preview = data.get('mode') == 'preview'
+        fetches = build_fetch_pipeline(lat, lon, include_energy=not preview).start()
+        location_data = fetches.result('location')
+        climate_data = fetches.result('climate')
         
-        # Get state code for energy data
-        state_code = location_data.get('state_fips', 'US')
-        energy_data = get_energy_data(state_code)
+        # Preview: analytic estimate only (no simulation, energy prices or LLM)
+        if preview:
+            return jsonify(build_preview_report(
+                datacenter_config, location_data, climate_data, lat, lon
+            ))
         
-        climate_data = get_climate_data(lat, lon)
+        energy_data = fetches.result('energy')
         
         # Calculate impacts
         impact_data = calculate_impact(datacenter_config, location_data, energy_data, climate_data)
@@ -775,21 +936,16 @@ def stream_analyze_datacenter():
             # Step 1: Initial status
             yield f"data: {json.dumps({'status': 'started', 'step': 'initializing'})}\n\n"
             
-            # Step 2: Gather location data
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'fetching_location_data'})}\n\n"
-            location_data = get_population_data(lat, lon)
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'location_data_complete', 'data': location_data})}\n\n"
-            
-            # Step 3: Get energy data
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'fetching_energy_data'})}\n\n"
-            state_code = location_data.get('state_fips', 'US')
-            energy_data = get_energy_data(state_code)
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'energy_data_complete', 'data': energy_data})}\n\n"
-            
-            # Step 4: Get climate data
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'fetching_climate_data'})}\n\n"
-            climate_data = get_climate_data(lat, lon)
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'climate_data_complete', 'data': climate_data})}\n\n"
+            # Steps 2-4: Location, energy and climate fetches run concurrently;
+            # each completion event is sent as soon as that stage finishes
+            fetches = build_fetch_pipeline(lat, lon).start()
+            for step in ('fetching_location_data', 'fetching_energy_data', 'fetching_climate_data'):
+                yield f"data: {json.dumps({'status': 'progress', 'step': step})}\n\n"
+            fetched = {}
+            for stage, result in fetches.as_completed(FETCH_STAGE_EVENTS):
+                fetched[stage] = result
+                yield f"data: {json.dumps({'status': 'progress', 'step': FETCH_STAGE_EVENTS[stage], 'data': result})}\n\n"
+            location_data, energy_data, climate_data = fetched['location'], fetched['energy'], fetched['climate']
             
             # Step 5: Calculate impacts
             yield f"data: {json.dumps({'status': 'progress', 'step': 'calculating_impacts'})}\n\n"
@@ -925,7 +1081,21 @@ def forecast_datacenter():
         lat = data['latitude']
         lon = data['longitude']
         dc_size = data.get('size', 'medium')
-        simulation_hours = data.get('simulation_hours', 8760)  # Default: 1 year
+        simulation_hours = parse_simulation_hours(data)  # Default: 1 year
+        seed, start_date = parse_simulation_seed(data)
+        resolution_minutes = int(data.get('resolution_minutes', 60))
+        demand_charge_per_kw = float(data.get('demand_charge_per_kw', 0))
+        # Optional load shifting: true for defaults, or {flexible_fraction, window, objective,
+        # capacity_kw, flexible_types}
+        load_shifting = data.get('load_shifting')
+        if load_shifting is True:
+            load_shifting = {}
+        ensemble_size = min(int(data.get('ensemble_size', 0)), MAX_ENSEMBLE_SIZE)
+        # Optional number of representative days to simulate instead of every hour
+        representative_days = data.get('representative_days')
+        # Optional multi-year build-out: {years, phases: [{date, server_count}], it_efficiency_per_year,
+        # pue_improvement_per_year, baseline_growth_per_year}
+        projection = data.get('projection')
         
         # Custom configuration if provided
         if 'custom' in data and data['custom']:
@@ -938,48 +1108,98 @@ def forecast_datacenter():
                 'employees': data.get('employees', 50),
                 'cooling_type': data.get('cooling_type', 'air_cooled'),
                 'server_type': data.get('server_type', 'enterprise'),
-                'datacenter_type': data.get('datacenter_type', 'enterprise')
+                'datacenter_type': data.get('datacenter_type', 'enterprise'),
+                'fleet': data.get('fleet')
             }
         else:
             datacenter_config = DATA_CENTER_TIERS.get(dc_size, DATA_CENTER_TIERS['medium'])
         
-        # Gather data from various APIs
+        # Gather data from various APIs (independent fetches run concurrently;
+        # the forecast prices energy from tariffs, so EIA prices are not fetched)
         print(f"Forecasting data center for location: {lat}, {lon}")
-        location_data = get_population_data(lat, lon)
+        preview = data.get('mode') == 'preview'
+        fetches = build_fetch_pipeline(lat, lon, include_energy=False).start()
+        location_data = fetches.result('location')
+        climate_data = fetches.result('climate')
+        
+        # Preview: analytic estimate only (no simulation, ensemble or LLM)
+        if preview:
+            return jsonify(build_preview_report(
+                datacenter_config, location_data, climate_data, lat, lon, start_date
+            ))
         
         # Get state code and map to grid region
         state_fips = location_data.get('state_fips', '')
         state_name = get_state_name_from_fips(state_fips)
         region_code = map_state_to_grid_region(state_fips)
         
-        energy_data = get_energy_data(state_fips)
-        climate_data = get_climate_data(lat, lon)
-        
         # Convert API data to simulation inputs
         dc_specs = create_datacenter_specs_from_config(datacenter_config)
         climate = create_climate_data_from_api(climate_data)
         grid_info = create_grid_info_from_location(location_data, region_code)
         
-        # Run full simulation
-        print(f"Running simulation for {simulation_hours} hours...")
-        sim_result = run_full_simulation(dc_specs, climate, grid_info, simulation_hours)
+        # Check the build-out against the facility before simulating anything
+        schedule = None
+        if isinstance(projection, dict):
+            schedule = ProjectionSchedule(
+                phases=projection.get('phases', []),
+                it_efficiency_per_year=float(projection.get('it_efficiency_per_year', 0)),
+                pue_improvement_per_year=float(projection.get('pue_improvement_per_year', 0)),
+                baseline_growth_per_year=float(projection.get('baseline_growth_per_year', 0))
+            )
+            projection_years = int(projection.get('years', 15))
+            schedule.validate(dc_specs, projection_years)
+        
+        # Run full simulation (or the representative-days approximation)
+        if representative_days:
+            print(f"Simulating {representative_days} representative days over {simulation_hours} hours...")
+            sim_result = run_representative_simulation(
+                dc_specs, climate, grid_info, simulation_hours, int(representative_days),
+                seed=seed, start_date=start_date, resolution_minutes=resolution_minutes
+            )
+        else:
+            print(f"Running simulation for {simulation_hours} hours...")
+            sim_result = run_cached_simulation(
+                SIMULATION_CACHE, dc_specs, climate, grid_info, simulation_hours,
+                seed=seed, start_date=start_date, resolution_minutes=resolution_minutes
+            )
+        
+        # Optional Monte Carlo ensemble for P50/P90/P99 bands around the single run
+        ensemble = None
+        if ensemble_size > 0:
+            print(f"Running {ensemble_size}-member ensemble...")
+            ensemble_result = run_ensemble_simulation(
+                dc_specs, climate, grid_info, ensemble_size, simulation_hours,
+                seed=sim_result.seed, start_date=sim_result.start_date,
+                resolution_minutes=resolution_minutes
+            )
+            ensemble = {
+                'size': ensemble_result.ensemble_size,
+                'seed': ensemble_result.seed,
+                'resolution_minutes': ensemble_result.step_minutes,
+                'bands': ensemble_result.bands,
+                'stability_risk_distribution': ensemble_result.stability_risk_distribution
+            }
         
         # Calculate costs using grid-specific data
         grid_calculator = GridImpactCalculator()
         grid_config = grid_calculator.grid_regions.get(region_code, grid_calculator.grid_regions['DEFAULT'])
         
+        # Time-of-use cost of the simulated profile (peak windows, seasons, demand charges)
         annual_kwh = sim_result.annual_consumption_mwh * 1000
-        annual_cost = annual_kwh * grid_config['base_rate']
+        tariff = get_tariff(region_code, demand_charge_per_kw)
+        tou_cost = calculate_tou_cost(sim_result, tariff)
+        annual_cost = tou_cost.total_cost
         
-        # Calculate carbon using grid-specific carbon intensity
-        annual_co2_kg = annual_kwh * grid_config['carbon_intensity']
-        annual_co2_tons = annual_co2_kg / 907.185  # kg to US tons
+        # Calculate carbon from the region's month x hour-of-day carbon profile
+        emissions = calculate_hourly_emissions(sim_result, region_code)
+        annual_co2_tons = emissions.annual_tons_co2
         
         # Sample hourly data for frontend (every 24th hour to reduce payload size)
-        sampled_hours = list(range(0, len(sim_result.hourly_power_kw), 24))
-        sampled_power = [sim_result.hourly_power_kw[i] for i in sampled_hours]
-        sampled_utilization = [sim_result.hourly_utilization[i] for i in sampled_hours]
-        sampled_pue = [sim_result.hourly_pue[i] for i in sampled_hours]
+        hourly_sample = sim_result.sample(every_hours=24)
+        hourly_sample['cost_usd'] = tou_cost.hourly_cost[::24 * sim_result.steps_per_hour].tolist()
+        hourly_sample['co2_kg'] = emissions.hourly_co2_kg[::24 * sim_result.steps_per_hour].tolist()
+        daily_view = downsample_for_json(sim_result, 'daily')
         
         # Generate LLM analysis for simulation results
         print("Generating AI analysis...")
@@ -1014,35 +1234,42 @@ def forecast_datacenter():
             'climate': climate_data,
             'simulation': {
                 'hours_simulated': simulation_hours,
+                'seed': sim_result.seed,
+                'start_date': sim_result.start_date.isoformat(),
                 'peak_power_kw': sim_result.peak_power_kw,
+                'corrected_peak_kw': sim_result.corrected_peak_kw,
                 'average_power_kw': sim_result.average_power_kw,
                 'annual_consumption_mwh': sim_result.annual_consumption_mwh,
-                'average_utilization': float(np.mean(sim_result.hourly_utilization)),
-                'peak_utilization': float(max(sim_result.hourly_utilization)),
-                'average_pue': float(np.mean(sim_result.hourly_pue)),
-                'best_pue': float(min(sim_result.hourly_pue)),
-                'worst_pue': float(max(sim_result.hourly_pue)),
-                'hourly_data': {
-                    'hours': sampled_hours,
-                    'power_kw': sampled_power,
-                    'utilization': sampled_utilization,
-                    'pue': sampled_pue
-                }
+                'average_utilization': sim_result.summary.utilization.mean,
+                'peak_utilization': sim_result.summary.utilization.max,
+                'average_pue': sim_result.summary.pue.mean,
+                'best_pue': sim_result.summary.pue.min,
+                'worst_pue': sim_result.summary.pue.max,
+                'load_factor': sim_result.summary.load_factor,
+                'resolution_minutes': sim_result.step_minutes,
+                'representative_days': int(representative_days) if representative_days else None,
+                'max_ramp_kw_per_min': sim_result.summary.max_ramp_kw_per_min,
+                'hourly_data': hourly_sample,
+                'daily_data': daily_view,
+                'fleet_breakdown': sim_result.fleet_breakdown
             },
             'energy': {
                 'annual_mwh': sim_result.annual_consumption_mwh,
                 'annual_kwh': annual_kwh,
                 'annual_cost': annual_cost,
+                'flat_rate_cost': tou_cost.flat_rate_cost,
                 'grid_region': region_code,
                 'base_rate': grid_config['base_rate'],
                 'peak_multiplier': grid_config['peak_multiplier'],
+                'time_of_use': tou_cost.to_dict(),
                 'percent_increase': sim_result.community_impact['average_impact_percent']
             },
             'carbon': {
                 'annual_tons_co2': annual_co2_tons,
                 'carbon_intensity_kg_kwh': grid_config['carbon_intensity'],
                 'equivalent_cars': annual_co2_tons / 4.6,
-                'equivalent_homes': annual_kwh / 10000
+                'equivalent_homes': annual_kwh / 10000,
+                'hourly_profile': emissions.to_dict()
             },
             'community_impact': {
                 'peak_impact_percent': sim_result.community_impact['peak_impact_percent'],
@@ -1054,6 +1281,28 @@ def forecast_datacenter():
             },
             'analysis': llm_analysis
         }
+        
+        if ensemble:
+            forecast_report['ensemble'] = ensemble
+        
+        # Shift flexible (training/batch) load toward cheap or clean hours and
+        # report the savings and the grid impact of the reduced peak
+        if isinstance(load_shifting, dict):
+            shift_result = optimize_load_shifting(
+                sim_result, grid_info, tariff,
+                flexible_fraction=load_shifting.get('flexible_fraction', 0.3),
+                window=load_shifting.get('window', 'daily'),
+                objective=load_shifting.get('objective', 'cost'),
+                capacity_kw=load_shifting.get('capacity_kw'),
+                flexible_types=load_shifting.get('flexible_types', FLEXIBLE_WORKLOAD_TYPES)
+            )
+            forecast_report['load_shifting'] = shift_result.to_dict()
+
+        # Project the phased build-out year by year (monthly rollups only)
+        if schedule is not None:
+            forecast_report['projection'] = run_projection(
+                dc_specs, climate, grid_info, schedule, years=projection_years, seed=seed
+            ).to_dict()
 
         # Write the forecast report to a file for later retrieval or debugging
         with open("forecast_report.json", "w") as f:
@@ -1064,6 +1313,8 @@ def forecast_datacenter():
     except KeyError as e:
         print(f"Missing required parameter in forecast endpoint: {e}")
         return jsonify({'error': f'Missing required parameter: {str(e)}'}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"Error in forecast endpoint: {e}")
         import traceback
@@ -1080,7 +1331,13 @@ def stream_forecast_datacenter():
     lat = data['latitude']
     lon = data['longitude']
     dc_size = data.get('size', 'medium')
-    simulation_hours = data.get('simulation_hours', 8760)
+    try:
+        simulation_hours = parse_simulation_hours(data)
+        seed, start_date = parse_simulation_seed(data)
+        resolution_minutes = int(data.get('resolution_minutes', 60))
+        demand_charge_per_kw = float(data.get('demand_charge_per_kw', 0))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     # Custom configuration if provided
     if 'custom' in data and data['custom']:
@@ -1093,32 +1350,32 @@ def stream_forecast_datacenter():
             'employees': data.get('employees', 50),
             'cooling_type': data.get('cooling_type', 'air_cooled'),
             'server_type': data.get('server_type', 'enterprise'),
-            'datacenter_type': data.get('datacenter_type', 'enterprise')
+            'datacenter_type': data.get('datacenter_type', 'enterprise'),
+            'fleet': data.get('fleet')
         }
     else:
         datacenter_config = DATA_CENTER_TIERS.get(dc_size, DATA_CENTER_TIERS['medium'])
     
     def generate():
         try:
-            last_heartbeat = time.time()
-            
             # Step 1: Initial status
             yield f"data: {json.dumps({'status': 'started', 'step': 'initializing'})}\n\n"
             
-            # Step 2: Gather location data
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'fetching_location_data'})}\n\n"
-            location_data = get_population_data(lat, lon)
+            # Steps 2-3: Location and climate fetches run concurrently; each
+            # completion event is sent as soon as that stage finishes
+            fetches = build_fetch_pipeline(lat, lon, include_energy=False).start()
+            for step in ('fetching_location_data', 'fetching_climate_data'):
+                yield f"data: {json.dumps({'status': 'progress', 'step': step})}\n\n"
+            fetched = {}
+            for stage, result in fetches.as_completed(['location', 'climate']):
+                fetched[stage] = result
+                yield f"data: {json.dumps({'status': 'progress', 'step': FETCH_STAGE_EVENTS[stage], 'data': result})}\n\n"
+            location_data, climate_data = fetched['location'], fetched['climate']
             
-            # Step 3: Get grid and energy data
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'fetching_energy_data'})}\n\n"
+            # Step 4: Map to grid region
             state_fips = location_data.get('state_fips', '')
             state_name = get_state_name_from_fips(state_fips)
             region_code = map_state_to_grid_region(state_fips)
-            energy_data = get_energy_data(state_fips)
-            
-            # Step 4: Get climate data
-            yield f"data: {json.dumps({'status': 'progress', 'step': 'fetching_climate_data'})}\n\n"
-            climate_data = get_climate_data(lat, lon)
             
             # Step 5: Prepare simulation
             yield f"data: {json.dumps({'status': 'progress', 'step': 'preparing_simulation', 'hours': simulation_hours})}\n\n"
@@ -1126,98 +1383,63 @@ def stream_forecast_datacenter():
             climate = create_climate_data_from_api(climate_data)
             grid_info = create_grid_info_from_location(location_data, region_code)
             
-            # Step 6: Run simulation with progress updates (inline loop for streaming)
+            # Step 6: Run simulation in day-sized chunks, one progress event per chunk
             yield f"data: {json.dumps({'status': 'simulating', 'hours_total': simulation_hours})}\n\n"
-            from services.simulate import (
-                ServerPowerModel, WorkloadSimulator, CoolingEfficiencyModel, 
-                GridImpactCalculator, PowerSimulationResult
-            )
-            from datetime import timedelta
-            
-            # Initialize models
-            server_model = ServerPowerModel(server_type=dc_specs.server_type)
-            workload_sim = WorkloadSimulator()
-            cooling_model = CoolingEfficiencyModel(cooling_type=dc_specs.cooling_type)
-            grid_calculator = GridImpactCalculator()
-            
-            hourly_power_kw = []
-            hourly_utilization = []
-            hourly_pue = []
-            start_date = datetime.now()
-            
-            # Run simulation with inline progress updates
-            for hour in range(simulation_hours):
-                current_time = start_date + timedelta(hours=hour)
-                day_of_week = current_time.weekday()
-                month = current_time.month
-                hour_of_day = current_time.hour
-                
-                # Get utilization
-                utilization = workload_sim.simulate_utilization(
-                    hour_of_day, day_of_week, dc_specs.datacenter_type, month
-                )
-                
-                # Calculate power
-                power_per_server_w = server_model.get_power_consumption(
-                    dc_specs.max_power_per_server, utilization
-                )
-                total_power_w = power_per_server_w * dc_specs.server_count
-                
-                # Calculate PUE
-                pue = cooling_model.calculate_pue(climate)
-                total_power_kw = (total_power_w / 1000) * pue
-                
-                hourly_power_kw.append(total_power_kw)
-                hourly_utilization.append(utilization)
-                hourly_pue.append(pue)
-                
-                # Yield progress every 24 hours
-                if (hour + 1) % 24 == 0:
+            # Only seeded runs are cached; an unseeded request is a fresh draw
+            cache_key = simulation_cache_key(
+                dc_specs, climate, grid_info, simulation_hours, seed, start_date, resolution_minutes
+            ) if seed is not None else None
+            sim_result = SIMULATION_CACHE.get(cache_key) if cache_key else None
+            if sim_result is None:
+                chunks = []
+                for chunk in iter_simulation_chunks(
+                    dc_specs, climate, simulation_hours, chunk_hours=24,
+                    seed=seed, start_date=start_date, resolution_minutes=resolution_minutes,
+                    dtype=np.float64 if resolution_minutes == 60 else np.float32
+                ):
+                    chunks.append(chunk)
                     progress_update = {
                         'status': 'simulation_progress',
-                        'hours_completed': hour + 1,
-                        'percent_complete': round(((hour + 1) / simulation_hours) * 100, 1),
-                        'current_avg_power_kw': round(float(np.mean(hourly_power_kw)), 2),
-                        'current_avg_utilization': round(float(np.mean(hourly_utilization)), 2),
-                        'current_avg_pue': round(float(np.mean(hourly_pue)), 3)
+                        'hours_completed': chunk.hours_completed,
+                        'percent_complete': round(chunk.percent_complete, 1),
+                        'current_avg_power_kw': round(chunk.average_power_kw, 2),
+                        'current_avg_utilization': round(chunk.average_utilization, 2),
+                        'current_avg_pue': round(chunk.average_pue, 3)
                     }
                     yield f"data: {json.dumps(progress_update)}\n\n"
-                    last_heartbeat = time.time()
                 
-                # Send heartbeat if needed (every 15 seconds)
-                if time.time() - last_heartbeat > 15:
-                    yield f"data: {json.dumps({'status': 'heartbeat'})}\n\n"
-                    last_heartbeat = time.time()
-            
-            # Calculate grid impact
-            community_impact = grid_calculator.calculate_grid_impact(
-                hourly_power_kw, grid_info
-            )
-            
-            # Build simulation result
-            sim_result = PowerSimulationResult(
-                hourly_power_kw=hourly_power_kw,
-                hourly_utilization=hourly_utilization,
-                hourly_pue=hourly_pue,
-                peak_power_kw=max(hourly_power_kw),
-                average_power_kw=np.mean(hourly_power_kw),
-                annual_consumption_mwh=sum(hourly_power_kw) / 1000,
-                community_impact=community_impact
-            )
+                # Build simulation result (including grid impact)
+                sim_result = assemble_simulation_result(chunks, grid_info)
+                if cache_key:
+                    SIMULATION_CACHE.put(cache_key, sim_result)
+            else:
+                # Cache hit: report the finished run in a single progress event
+                progress_update = {
+                    'status': 'simulation_progress',
+                    'hours_completed': simulation_hours,
+                    'percent_complete': 100.0,
+                    'current_avg_power_kw': round(sim_result.average_power_kw, 2),
+                    'current_avg_utilization': round(sim_result.summary.utilization.mean, 2),
+                    'current_avg_pue': round(sim_result.summary.pue.mean, 3),
+                    'cached': True
+                }
+                yield f"data: {json.dumps(progress_update)}\n\n"
+            grid_calculator = GridImpactCalculator()
             
             # Step 7: Calculate costs
             yield f"data: {json.dumps({'status': 'calculating_costs'})}\n\n"
             grid_config = grid_calculator.grid_regions.get(region_code, grid_calculator.grid_regions['DEFAULT'])
             annual_kwh = sim_result.annual_consumption_mwh * 1000
-            annual_cost = annual_kwh * grid_config['base_rate']
-            annual_co2_kg = annual_kwh * grid_config['carbon_intensity']
-            annual_co2_tons = annual_co2_kg / 907.185
+            tou_cost = calculate_tou_cost(sim_result, get_tariff(region_code, demand_charge_per_kw))
+            annual_cost = tou_cost.total_cost
+            emissions = calculate_hourly_emissions(sim_result, region_code)
+            annual_co2_tons = emissions.annual_tons_co2
             
             # Step 8: Sample data for frontend
-            sampled_hours = list(range(0, len(sim_result.hourly_power_kw), 24))
-            sampled_power = [sim_result.hourly_power_kw[i] for i in sampled_hours]
-            sampled_utilization = [sim_result.hourly_utilization[i] for i in sampled_hours]
-            sampled_pue = [sim_result.hourly_pue[i] for i in sampled_hours]
+            hourly_sample = sim_result.sample(every_hours=24)
+            hourly_sample['cost_usd'] = tou_cost.hourly_cost[::24 * sim_result.steps_per_hour].tolist()
+            hourly_sample['co2_kg'] = emissions.hourly_co2_kg[::24 * sim_result.steps_per_hour].tolist()
+            daily_view = downsample_for_json(sim_result, 'daily')
             
             # Step 9: Generate AI analysis with streaming
             yield f"data: {json.dumps({'status': 'generating_analysis'})}\n\n"
@@ -1253,14 +1475,15 @@ Energy Performance:
 - Average Power: {sim_result.average_power_kw:,.0f} kW
 - Annual Consumption: {sim_result.annual_consumption_mwh:,.0f} MWh
 - Annual Energy Cost: ${annual_cost:,.0f}
-- Average PUE: {np.mean(sim_result.hourly_pue):.2f}
-- Best PUE: {min(sim_result.hourly_pue):.2f}
-- Worst PUE: {max(sim_result.hourly_pue):.2f}
+- Average PUE: {sim_result.summary.pue.mean:.2f}
+- Best PUE: {sim_result.summary.pue.min:.2f}
+- Worst PUE: {sim_result.summary.pue.max:.2f}
+- Load Factor: {sim_result.summary.load_factor:.2f}
 
 Workload Characteristics:
-- Average Utilization: {np.mean(sim_result.hourly_utilization):.1f}%
-- Peak Utilization: {max(sim_result.hourly_utilization):.1f}%
-- Minimum Utilization: {min(sim_result.hourly_utilization):.1f}%
+- Average Utilization: {sim_result.summary.utilization.mean:.1f}%
+- Peak Utilization: {sim_result.summary.utilization.max:.1f}%
+- Minimum Utilization: {sim_result.summary.utilization.min:.1f}%
 
 Carbon Impact:
 - Annual CO2 Emissions: {annual_co2_tons:,.0f} tons
@@ -1327,35 +1550,40 @@ Be specific, data-driven, and balanced. Use the actual simulation data to suppor
                 'climate': climate_data,
                 'simulation': {
                     'hours_simulated': simulation_hours,
+                    'seed': sim_result.seed,
+                    'start_date': sim_result.start_date.isoformat(),
                     'peak_power_kw': sim_result.peak_power_kw,
                     'average_power_kw': sim_result.average_power_kw,
                     'annual_consumption_mwh': sim_result.annual_consumption_mwh,
-                    'average_utilization': float(np.mean(sim_result.hourly_utilization)),
-                    'peak_utilization': float(max(sim_result.hourly_utilization)),
-                    'average_pue': float(np.mean(sim_result.hourly_pue)),
-                    'best_pue': float(min(sim_result.hourly_pue)),
-                    'worst_pue': float(max(sim_result.hourly_pue)),
-                    'hourly_data': {
-                        'hours': sampled_hours,
-                        'power_kw': sampled_power,
-                        'utilization': sampled_utilization,
-                        'pue': sampled_pue
-                    }
+                    'average_utilization': sim_result.summary.utilization.mean,
+                    'peak_utilization': sim_result.summary.utilization.max,
+                    'average_pue': sim_result.summary.pue.mean,
+                    'best_pue': sim_result.summary.pue.min,
+                    'worst_pue': sim_result.summary.pue.max,
+                    'load_factor': sim_result.summary.load_factor,
+                    'resolution_minutes': sim_result.step_minutes,
+                    'max_ramp_kw_per_min': sim_result.summary.max_ramp_kw_per_min,
+                    'hourly_data': hourly_sample,
+                    'daily_data': daily_view,
+                    'fleet_breakdown': sim_result.fleet_breakdown
                 },
                 'energy': {
                     'annual_mwh': sim_result.annual_consumption_mwh,
                     'annual_kwh': annual_kwh,
                     'annual_cost': annual_cost,
+                    'flat_rate_cost': tou_cost.flat_rate_cost,
                     'grid_region': region_code,
                     'base_rate': grid_config['base_rate'],
                     'peak_multiplier': grid_config['peak_multiplier'],
+                    'time_of_use': tou_cost.to_dict(),
                     'percent_increase': sim_result.community_impact['average_impact_percent']
                 },
                 'carbon': {
                     'annual_tons_co2': annual_co2_tons,
                     'carbon_intensity_kg_kwh': grid_config['carbon_intensity'],
                     'equivalent_cars': annual_co2_tons / 4.6,
-                    'equivalent_homes': annual_kwh / 10000
+                    'equivalent_homes': annual_kwh / 10000,
+                    'hourly_profile': emissions.to_dict()
                 },
                 'community_impact': {
                     'peak_impact_percent': sim_result.community_impact['peak_impact_percent'],
@@ -1384,6 +1612,132 @@ Be specific, data-driven, and balanced. Use the actual simulation data to suppor
     response.headers['Access-Control-Allow-Origin'] = '*'  # Adjust for production
     return response
 
+@app.route('/api/sweep', methods=['POST'])
+def sweep_datacenter():
+    """
+    Compare every cooling x server x workload combination at one site.
+    Location and climate data are fetched once; energy data and the LLM analysis are skipped.
+    Optional lists 'cooling_types', 'server_types' and 'datacenter_types' narrow the sweep.
+    """
+    try:
+        data = request.json
+        
+        lat = data['latitude']
+        lon = data['longitude']
+        dc_size = data.get('size', 'medium')
+        simulation_hours = parse_simulation_hours(data)
+        seed, start_date = parse_simulation_seed(data)
+        demand_charge_per_kw = float(data.get('demand_charge_per_kw', 0))
+        rank_by = data.get('rank_by', 'annual_cost')
+        
+        # Size comes from a preset tier or custom servers/power_mw; the swept fields are ignored
+        if 'custom' in data and data['custom']:
+            datacenter_config = {
+                'name': data.get('name', 'Custom Data Center'),
+                'power_mw': data.get('power_mw', 10),
+                'servers': data.get('servers', 1000),
+                'square_feet': data.get('square_feet', 50000)
+            }
+        else:
+            datacenter_config = DATA_CENTER_TIERS.get(dc_size, DATA_CENTER_TIERS['medium'])
+        dc_specs = create_datacenter_specs_from_config(datacenter_config)
+        
+        print(f"Sweeping configurations for location: {lat}, {lon}")
+        fetches = build_fetch_pipeline(lat, lon, include_energy=False).start()
+        location_data = fetches.result('location')
+        climate_data = fetches.result('climate')
+        state_fips = location_data.get('state_fips', '')
+        region_code = map_state_to_grid_region(state_fips)
+        
+        climate = create_climate_data_from_api(climate_data)
+        grid_info = create_grid_info_from_location(location_data, region_code)
+        
+        sweep = run_parameter_sweep(
+            climate, grid_info, dc_specs.server_count, dc_specs.max_power_per_server,
+            cooling_types=data.get('cooling_types'),
+            server_types=data.get('server_types'),
+            datacenter_types=data.get('datacenter_types'),
+            simulation_hours=simulation_hours,
+            seed=seed,
+            start_date=start_date,
+            demand_charge_per_kw=demand_charge_per_kw,
+            rank_by=rank_by
+        )
+        
+        return jsonify({
+            'timestamp': datetime.utcnow().isoformat(),
+            'location': {
+                'latitude': lat,
+                'longitude': lon,
+                'name': location_data.get('location_name', 'Unknown'),
+                'state': get_state_name_from_fips(state_fips),
+                'grid_region': region_code
+            },
+            'datacenter': datacenter_config,
+            'seed': sweep.seed,
+            'start_date': sweep.start_date.isoformat(),
+            'hours_simulated': sweep.simulation_hours,
+            'rank_by': sweep.rank_by,
+            'configurations': len(sweep.rows),
+            'results': sweep.rows
+        })
+        
+    except KeyError as e:
+        print(f"Missing required parameter in sweep endpoint: {e}")
+        return jsonify({'error': f'Missing required parameter: {str(e)}'}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        print(f"Error in sweep endpoint: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/surrogate/score', methods=['POST'])
+def score_candidates():
+    """
+    Score many site/configuration candidates at once from the surrogate grid.
+    Each candidate gives temperature, humidity, power_mw and optional
+    server_type, datacenter_type and cooling_type. No external API calls.
+    """
+    try:
+        candidates = request.json['candidates']
+        result = get_surrogate_grid().score(
+            [c.get('server_type', 'enterprise') for c in candidates],
+            [c.get('datacenter_type', 'enterprise') for c in candidates],
+            [c.get('cooling_type', 'air_cooled') for c in candidates],
+            [c.get('temperature', 70) for c in candidates],
+            [c.get('humidity', 50) for c in candidates],
+            [c.get('power_mw', 10) * 1000 for c in candidates]
+        )
+        return jsonify({
+            'count': len(candidates),
+            'annual_mwh': result['annual_mwh'].tolist(),
+            'peak_mw': (result['peak_kw'] / 1000).tolist(),
+            'average_pue': result['mean_pue'].tolist()
+        })
+        
+    except KeyError as e:
+        return jsonify({'error': f'Missing required parameter: {str(e)}'}), 400
+    except Exception as e:
+        print(f"Error in surrogate score endpoint: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Hit/miss counters and size of the simulation result cache"""
+    return jsonify(SIMULATION_CACHE.stats())
+
+@app.route('/api/cache/location/stats', methods=['GET'])
+def get_location_cache_stats():
+    """Memory/disk hit ratios of the geocoder and ACS lookup cache"""
+    return jsonify(LOCATION_CACHE.stats())
+
+@app.route('/api/upstream/stats', methods=['GET'])
+def get_upstream_stats():
+    """Per-host request counts, retries and latency histograms for upstream APIs"""
+    return jsonify(http_client.get_upstream_client().stats())
+
 @app.route('/api/datacenter-types', methods=['GET'])
 def get_datacenter_types():
     """Get available data center types and their specs"""
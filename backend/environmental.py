@@ -5,7 +5,8 @@ Integrates air quality, emissions, and environmental data without modifying core
 
 import os
 import json
-import requests
+from services import http_client
+from services.acs_table import ACS_TABLE_YEAR, get_acs_table
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import numpy as np
@@ -64,7 +65,7 @@ class AirQualityAnalyzer:
                 'API_KEY': api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -98,7 +99,7 @@ class AirQualityAnalyzer:
                 'API_KEY': api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             return response.json()
@@ -260,7 +261,7 @@ class DemographicsAnalyzer:
                                tract: str = '*') -> Dict[str, Any]:
         """Fetch demographic data for census tract"""
         try:
-            year = 2022  # Most recent ACS 5-year data
+            year = ACS_TABLE_YEAR  # Same vintage as the bundled county table
             variables = ','.join(self.vulnerability_indicators)
             
             census_api_key = os.getenv('CENSUS_API_KEY', '').strip()
@@ -275,7 +276,7 @@ class DemographicsAnalyzer:
                 'key': census_api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -283,6 +284,11 @@ class DemographicsAnalyzer:
             
         except Exception as e:
             logger.error(f"Error fetching census data: {e}")
+            # Fall back to county-level figures from the bundled ACS table
+            table = get_acs_table()
+            county_data = table.census_row(state_fips, county_fips, self.vulnerability_indicators) if table else None
+            if county_data is not None:
+                return {**self._calculate_vulnerability_index(county_data), 'level': 'county'}
             return {'error': str(e), 'vulnerability_index': None}
     
     def _calculate_vulnerability_index(self, census_data: List) -> Dict[str, Any]:
@@ -301,7 +307,7 @@ class DemographicsAnalyzer:
             total_pop = float(data_dict.get('B01001_001E', 1))
             elderly_pop = sum([
                 float(data_dict.get(f'B01001_{i:03d}E', 0))
-                for i in range(20, 26) + list(range(44, 50))
+                for i in list(range(20, 26)) + list(range(44, 50))
             ])
             elderly_percentage = (elderly_pop / total_pop * 100) if total_pop > 0 else 0
             
@@ -366,10 +372,12 @@ class InfrastructureAnalyzer:
             out skel qt;
             """
             
-            response = requests.post(
+            # Overpass queries are read-only, so POST is as safe to retry as GET
+            response = http_client.post(
                 OVERPASS_URL,
                 data={'data': overpass_query},
-                timeout=30
+                timeout=30,
+                idempotent=True
             )
             response.raise_for_status()
             
@@ -0,0 +1,191 @@
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from . import http_client
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_ACS_TABLE_DIR = os.path.join(DATA_DIR, "acs_county")
+# ACS 5-year vintage of the bundled table and of every live Census API call
+# (acs5_url), so API fallbacks and cached rows agree with the table
+ACS_TABLE_YEAR = 2022
+META_FILE = "meta.json"
+
+# Column name -> ACS 5-year variable (one .npy per column)
+ACS_COLUMNS = {
+    "population": "B01003_001E",
+    "households": "B11001_001E",
+    "median_income": "B19013_001E",
+    "age_population": "B01001_001E",  # Universe of the age bands below
+}
+# Age 65+ bands used by DemographicsAnalyzer (B01001_020E-025E male, 044E-049E female)
+ELDERLY_AGE_BANDS = tuple(f"B01001_{i:03d}E" for i in (*range(20, 26), *range(44, 50)))
+ACS_COLUMNS.update({band: band for band in ELDERLY_AGE_BANDS})
+
+FIPS_SLOTS = 100000  # Dense 5-digit state+county FIPS index
+
+
+class AcsCountyTable:
+    """
+    Columnar ACS 5-year table of every US county, memory-mapped from .npy files.
+
+    Rows are addressed through a dense FIPS -> row array, so single lookups
+    are O(1) array reads and multi-county queries are one fancy-index per
+    column. Counties are addressed by exactly five digits (two state, three
+    county); anything else is not in the table. Missing or suppressed ACS
+    values are stored as 0.
+    """
+
+    def __init__(self, fips: np.ndarray, names: np.ndarray, columns: Dict[str, np.ndarray], year: int):
+        self.fips = fips            # (counties,) int32 state * 1000 + county
+        self.names = names          # (counties,) e.g. "Alameda County, California"
+        self.columns = columns      # name -> (counties,) int64
+        self.year = year
+        self.row_of_fips = np.full(FIPS_SLOTS, -1, dtype=np.int32)
+        self.row_of_fips[fips] = np.arange(len(fips), dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.fips)
+
+    def _row(self, code: str) -> int:
+        # Row of a 5-digit state+county code, -1 for malformed or unknown codes
+        code = str(code)
+        if len(code) != 5 or not code.isdigit():
+            return -1
+        return int(self.row_of_fips[int(code)])
+
+    def rows(self, fips_codes: Sequence[str]) -> np.ndarray:
+        """Row index per 5-digit FIPS code (-1 when the county is not in the table)"""
+        return np.array([self._row(code) for code in fips_codes], dtype=np.int64)
+
+    def column(self, name: str, fips_codes: Sequence[str]) -> np.ndarray:
+        """Vectorized read of one column for many counties (missing counties read 0)"""
+        rows = self.rows(fips_codes)
+        return np.where(rows >= 0, self.columns[name][np.maximum(rows, 0)], 0)
+
+    def lookup(self, state_fips: str, county_fips: str) -> Optional[Dict]:
+        """One county as a get_population_data-style location dict, or None"""
+        row = self._row(f"{state_fips}{county_fips}")
+        if row < 0:
+            return None
+        return {
+            "location_name": str(self.names[row]),
+            "population": int(self.columns["population"][row]),
+            "median_income": int(self.columns["median_income"][row]),
+            "households": int(self.columns["households"][row]),
+            "state_fips": state_fips,
+            "county_fips": county_fips
+        }
+
+    def census_row(self, state_fips: str, county_fips: str,
+                   variables: Sequence[str]) -> Optional[List[List[Optional[str]]]]:
+        """
+        A county in the Census API's [headers, values] shape: the requested
+        variables in order, then "state" and "county". NAME is served from the
+        table; variables the table does not carry are None, as the API
+        reports unavailable values.
+        """
+        row = self._row(f"{state_fips}{county_fips}")
+        if row < 0:
+            return None
+        by_variable = {variable: name for name, variable in ACS_COLUMNS.items()}
+        values = []
+        for variable in variables:
+            if variable == "NAME":
+                values.append(str(self.names[row]))
+            elif variable in by_variable:
+                values.append(str(int(self.columns[by_variable[variable]][row])))
+            else:
+                values.append(None)
+        return [[*variables, "state", "county"], [*values, state_fips, county_fips]]
+
+
+def acs5_url(year: int = ACS_TABLE_YEAR) -> str:
+    return f"https://api.census.gov/data/{year}/acs/acs5"
+
+
+def fetch_acs_table(year: int = ACS_TABLE_YEAR) -> Dict[str, np.ndarray]:
+    """Download every county's ACS columns (one request per variable batch)"""
+    variables = sorted(set(ACS_COLUMNS.values()))
+    url = acs5_url(year)
+    rows: Dict[str, Dict[str, str]] = {}
+    # The API caps a request at 50 variables; NAME counts as one
+    for start in range(0, len(variables), 40):
+        batch = variables[start:start + 40]
+        response = http_client.get(url, params={
+            "get": ",".join(["NAME"] + batch),
+            "for": "county:*",
+            "key": os.getenv("CENSUS_API_KEY")
+        }, timeout=120)
+        response.raise_for_status()
+        header, *records = response.json()
+        for record in records:
+            values = dict(zip(header, record))
+            rows.setdefault(values["state"] + values["county"], {}).update(values)
+
+    codes = sorted(rows)
+    def as_count(value: Optional[str]) -> int:
+        # Negative values are ACS annotation codes (suppressed / not available)
+        try:
+            return max(int(float(value)), 0)
+        except (TypeError, ValueError):
+            return 0
+
+    arrays = {
+        "fips": np.array([int(code) for code in codes], dtype=np.int32),
+        "names": np.array([rows[code]["NAME"] for code in codes])
+    }
+    for name, variable in ACS_COLUMNS.items():
+        arrays[name] = np.array([as_count(rows[code].get(variable)) for code in codes], dtype=np.int64)
+    return arrays
+
+
+def save_acs_table(arrays: Dict[str, np.ndarray], year: int, directory: str = DEFAULT_ACS_TABLE_DIR) -> None:
+    """Write one .npy per column plus a JSON sidecar"""
+    os.makedirs(directory, exist_ok=True)
+    for name, values in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), values)
+    with open(os.path.join(directory, META_FILE), "w") as f:
+        json.dump({"year": year, "counties": len(arrays["fips"]), "columns": ACS_COLUMNS}, f, indent=2)
+        f.write("\n")
+
+
+def load_acs_table(directory: Optional[str] = None) -> Optional[AcsCountyTable]:
+    """
+    Memory-map the table (ACS_TABLE_DIR or the bundled one). Warns and
+    returns None when it is missing, in which case every lookup goes to the
+    Census API; also warns when its vintage is not ACS_TABLE_YEAR.
+    """
+    directory = directory or os.getenv("ACS_TABLE_DIR", DEFAULT_ACS_TABLE_DIR)
+    meta_path = os.path.join(directory, META_FILE)
+    if not os.path.exists(meta_path):
+        print(f"Warning: ACS table {directory} not found; population lookups use the Census API. "
+              f"Build it with services/tools/acs_table.py refresh", file=sys.stderr)
+        return None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta["year"] != ACS_TABLE_YEAR:
+        print(f"Warning: ACS table {directory} is the {meta['year']} vintage but Census API "
+              f"fallbacks use {ACS_TABLE_YEAR}", file=sys.stderr)
+    load = lambda name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+    return AcsCountyTable(
+        fips=np.asarray(load("fips")),
+        names=load("names"),
+        columns={name: load(name) for name in meta["columns"]},
+        year=meta["year"]
+    )
+
+
+_acs_table: Optional[AcsCountyTable] = None
+_acs_table_loaded = False
+
+def get_acs_table() -> Optional[AcsCountyTable]:
+    # Loaded once per process on first use
+    global _acs_table, _acs_table_loaded
+    if not _acs_table_loaded:
+        _acs_table = load_acs_table()
+        _acs_table_loaded = True
+    return _acs_table
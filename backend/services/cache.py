@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+from .simulate import (
+    ClimateData,
+    DataCenterSpecs,
+    GridInfo,
+    PowerSimulationResult,
+    CLIMATE_FIELDS,
+    run_full_simulation
+)
+
+# Bump whenever the simulation model changes so stale entries stop matching
+CACHE_FORMAT_VERSION = 3
+
+SERIES_FILES = {
+    "hourly_power_kw": "power_kw.npy",
+    "hourly_utilization": "utilization.npy",
+    "hourly_pue": "pue.npy",
+    "group_it_power_kw": "group_it_power_kw.npy"
+}
+META_FILE = "meta.json"
+STAGING_PREFIX = ".staging-"
+STALE_STAGING_SECONDS = 3600  # Older staging directories are left over from a crashed writer
+
+
+def _canonical_climate(climate_data: ClimateData) -> Dict:
+    # Hourly series are represented by a digest of their bytes
+    canonical = {}
+    for name in CLIMATE_FIELDS:
+        value = getattr(climate_data, name)
+        if isinstance(value, np.ndarray):
+            data = np.ascontiguousarray(value, dtype=np.float64)
+            canonical[name] = {"sha256": hashlib.sha256(data.tobytes()).hexdigest(), "length": len(data)}
+        else:
+            canonical[name] = float(value)
+    return canonical
+
+
+def simulation_cache_key(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    simulation_hours: int,
+    seed: int,
+    start_date: datetime,
+    resolution_minutes: int = 60
+) -> str:
+    """
+    Canonical SHA-256 of every input that determines a simulation run.
+    Only seeded runs have a key: an unseeded run is a fresh draw and is never cached.
+    """
+    if seed is None:
+        raise ValueError("Unseeded runs are not cacheable")
+    payload = {
+        "version": CACHE_FORMAT_VERSION,
+        "specs": asdict(datacenter_specs),
+        "climate": _canonical_climate(climate_data),
+        "grid": asdict(grid_info),
+        "hours": int(simulation_hours),
+        "resolution_minutes": int(resolution_minutes),
+        "seed": seed,
+        "start_date": start_date.replace(minute=0, second=0, microsecond=0).isoformat()
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=float)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SimulationCache:
+    """
+    Content-addressed on-disk cache of simulation results.
+
+    Each entry is a directory holding one .npy file per hourly series plus a
+    JSON sidecar with the scalar results. Hits memory-map the series back
+    read-only. Total size is capped with least-recently-used eviction (entry
+    mtime is refreshed on every hit). Several processes may share the
+    directory: eviction rescans it, so the cap holds across workers.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        # key -> (size in bytes, last used); rebuilt from disk on start-up and before evicting
+        self._index: Dict[str, tuple] = self._scan(remove_incomplete=True)
+
+    def _scan(self, remove_incomplete: bool = False) -> Dict[str, tuple]:
+        # Entries on disk, whichever process wrote them, with their meta mtime as last use
+        index = {}
+        for key in os.listdir(self.directory):
+            entry = os.path.join(self.directory, key)
+            meta_path = os.path.join(entry, META_FILE)
+            try:
+                if os.path.isfile(meta_path):
+                    index[key] = (self._entry_size(entry), os.path.getmtime(meta_path))
+                elif os.path.isdir(entry) and remove_incomplete and (
+                    not key.startswith(STAGING_PREFIX) or time.time() - os.path.getmtime(entry) > STALE_STAGING_SECONDS
+                ):
+                    shutil.rmtree(entry, ignore_errors=True)  # Incomplete write
+            except OSError:
+                continue  # Evicted by another process mid-scan
+        return index
+
+    @staticmethod
+    def _entry_size(entry: str) -> int:
+        return sum(os.path.getsize(os.path.join(entry, name)) for name in os.listdir(entry))
+
+    def get(self, key: str) -> Optional[PowerSimulationResult]:
+        entry = os.path.join(self.directory, key)
+        try:
+            with open(os.path.join(entry, META_FILE)) as f:
+                meta = json.load(f)
+            series = {
+                field: np.load(os.path.join(entry, filename), mmap_mode="r")
+                for field, filename in SERIES_FILES.items()
+            }
+            os.utime(os.path.join(entry, META_FILE))
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+                self._index.pop(key, None)
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if key in self._index:
+                self._index[key] = (self._index[key][0], time.time())
+
+        return PowerSimulationResult(
+            **series,
+            peak_power_kw=meta["peak_power_kw"],
+            average_power_kw=meta["average_power_kw"],
+            annual_consumption_mwh=meta["annual_consumption_mwh"],
+            community_impact=meta["community_impact"],
+            seed=meta["seed"],
+            start_date=datetime.fromisoformat(meta["start_date"]),
+            step_minutes=meta["step_minutes"],
+            fleet_breakdown=meta.get("fleet_breakdown")
+        )
+
+    def put(self, key: str, result: PowerSimulationResult):
+        entry = os.path.join(self.directory, key)
+        if os.path.isdir(entry):
+            return
+
+        # Write into a temporary directory, then rename so readers never see partial entries
+        staging = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self.directory)
+        try:
+            for field, filename in SERIES_FILES.items():
+                np.save(os.path.join(staging, filename), np.ascontiguousarray(getattr(result, field)))
+            with open(os.path.join(staging, META_FILE), "w") as f:
+                json.dump({
+                    "peak_power_kw": result.peak_power_kw,
+                    "average_power_kw": result.average_power_kw,
+                    "annual_consumption_mwh": result.annual_consumption_mwh,
+                    "community_impact": result.community_impact,
+                    "seed": result.seed,
+                    "start_date": result.start_date.isoformat(),
+                    "step_minutes": result.step_minutes,
+                    "fleet_breakdown": result.fleet_breakdown
+                }, f, default=float)
+            size = self._entry_size(staging)
+            os.rename(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+
+        with self._lock:
+            self._index[key] = (size, time.time())
+            self._evict()
+
+    def _evict(self):
+        # Drop least recently used entries until the cache fits under max_bytes, counting
+        # entries other workers have written or touched since this index was built
+        self._index = self._scan()
+        total = sum(size for size, _ in self._index.values())
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+            del self._index[key]
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "size_bytes": sum(size for size, _ in self._index.values()),
+                "max_bytes": self.max_bytes
+            }
+
+
+def run_cached_simulation(
+    cache: Optional[SimulationCache],
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    simulation_hours: int = 8760,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    resolution_minutes: int = 60
+) -> PowerSimulationResult:
+    """run_full_simulation behind the cache (cache=None or an unseeded run is uncached)"""
+    if start_date is None:
+        start_date = datetime.now()
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+    if cache is None or seed is None:
+        return run_full_simulation(
+            datacenter_specs, climate_data, grid_info, simulation_hours,
+            seed=seed, start_date=start_date, resolution_minutes=resolution_minutes
+        )
+
+    key = simulation_cache_key(
+        datacenter_specs, climate_data, grid_info, simulation_hours, seed, start_date, resolution_minutes
+    )
+    result = cache.get(key)
+    if result is None:
+        result = run_full_simulation(
+            datacenter_specs, climate_data, grid_info, simulation_hours,
+            seed=seed, start_date=start_date, resolution_minutes=resolution_minutes
+        )
+        cache.put(key, result)
+    return result
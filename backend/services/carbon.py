@@ -0,0 +1,187 @@
+import csv
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .simulate import GridImpactCalculator, PowerSimulationResult, build_calendar
+
+KG_PER_US_TON = 907.185
+
+# Cleanest hours of the day reported as carbon-optimal
+OPTIMAL_HOUR_COUNT = 6
+
+# Diurnal and seasonal shape of marginal carbon intensity per region, as fractions
+# of the annual mean. These describe each operator's generation mix rather than
+# measured data: how deep solar pulls midday intensity down, how far gas peakers
+# push the evening ramp up, how much overnight wind cleans the night, and how
+# strongly summer cooling load raises intensity. Each region's table is scaled so
+# its annual mean equals the eGRID carbon_intensity in GridImpactCalculator.
+# Set CARBON_PROFILE_PATH to a region,month,hour,kg_per_kwh CSV to load measured
+# profiles instead.
+CARBON_SHAPE_PARAMETERS = {
+    #          solar_dip  evening_ramp  night_wind  summer_swing
+    "CAISO":  (0.35,      0.15,         0.05,       0.06),
+    "ERCOT":  (0.12,      0.08,         0.12,       0.08),
+    "PJM":    (0.05,      0.06,         0.03,       0.05),
+    "NYISO":  (0.04,      0.06,         0.02,       0.06),
+    "SPP":    (0.06,      0.06,         0.15,       0.05),
+    "ISONE":  (0.06,      0.08,         0.02,      -0.04),  # Winter-peaking (oil/gas in cold snaps)
+    "MISO":   (0.05,      0.05,         0.10,       0.05),
+    "SERC":   (0.08,      0.06,         0.02,       0.06),
+    "PACNW":  (0.04,      0.05,         0.04,      -0.08),  # Spring/summer hydro runoff
+    "WEST":   (0.15,      0.10,         0.05,       0.07),
+    "DEFAULT": (0.08,     0.07,         0.05,       0.05)
+}
+
+DAYS_PER_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def _modelled_profile(region_code: str, mean_intensity: float) -> np.ndarray:
+    # (12 x 24) kg CO2/kWh for one region from its shape parameters
+    solar_dip, evening_ramp, night_wind, summer_swing = CARBON_SHAPE_PARAMETERS[region_code]
+    month = np.arange(12)[:, None]
+    hour = np.arange(24)[None, :]
+
+    # Season: +1 in mid-July, -1 in mid-January; solar is ~50% stronger in summer
+    season = -np.cos(2 * np.pi * (month + 0.5) / 12)
+    solar = np.clip(np.sin(np.pi * (hour - 6) / 12), 0, None) * (1 + 0.5 * season)
+    evening = np.exp(-0.5 * ((hour - 19) / 1.5) ** 2)
+    night = ((hour < 6) | (hour >= 22)).astype(float)
+
+    shape = 1 - solar_dip * solar + evening_ramp * evening - night_wind * night + summer_swing * season
+    shape = np.clip(shape, 0.05, None)
+
+    # Scale so the day-weighted annual mean matches the region's average intensity
+    annual_mean = (shape.mean(axis=1) * DAYS_PER_MONTH).sum() / DAYS_PER_MONTH.sum()
+    return shape * (mean_intensity / annual_mean)
+
+
+def _load_profile_csv(path: str, regions: List[str]) -> Dict[str, np.ndarray]:
+    # region,month (1-12),hour (0-23),kg_per_kwh rows; regions absent from the file keep the model
+    profiles = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            region = row["region"]
+            if region not in regions:
+                continue
+            table = profiles.setdefault(region, np.full((12, 24), np.nan))
+            table[int(row["month"]) - 1, int(row["hour"])] = float(row["kg_per_kwh"])
+    return {region: table for region, table in profiles.items() if not np.isnan(table).any()}
+
+
+def _build_profile_table() -> Tuple[Dict[str, int], np.ndarray]:
+    # Region index and a read-only (regions x 12 x 24) float32 table, built once at import
+    grid_regions = GridImpactCalculator().grid_regions
+    regions = list(grid_regions)
+    measured = {}
+    path = os.getenv("CARBON_PROFILE_PATH")
+    if path:
+        try:
+            measured = _load_profile_csv(path, regions)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Warning: could not load carbon profiles from {path}: {e}")
+
+    table = np.empty((len(regions), 12, 24), dtype=np.float32)
+    for i, region in enumerate(regions):
+        if region in measured:
+            table[i] = measured[region]
+        else:
+            parameters_region = region if region in CARBON_SHAPE_PARAMETERS else "DEFAULT"
+            table[i] = _modelled_profile(parameters_region, grid_regions[region]["carbon_intensity"])
+    table.flags.writeable = False
+    return {region: i for i, region in enumerate(regions)}, table
+
+
+CARBON_REGION_INDEX, CARBON_PROFILES = _build_profile_table()
+
+
+def carbon_intensity_profile(region_code: str) -> np.ndarray:
+    """(12 x 24) month x hour-of-day kg CO2/kWh for region_code (read-only view)"""
+    return CARBON_PROFILES[CARBON_REGION_INDEX.get(region_code, CARBON_REGION_INDEX["DEFAULT"])]
+
+
+@dataclass(eq=False)
+class CarbonResult:
+    # Emissions of one simulation under its region's hourly carbon profile
+    region_code: str
+    hourly_co2_kg: np.ndarray    # kg CO2 per simulation step
+    annual_tons_co2: float
+    flat_rate_tons_co2: float    # Same energy at the region's annual mean intensity
+    average_intensity: float     # Energy-weighted kg CO2/kWh actually seen by the load
+    monthly_tons_co2: List[Dict] = field(default_factory=list)
+    optimal_hours: List[int] = field(default_factory=list)            # Cleanest hours of day, year-round
+    optimal_hours_by_month: Dict[int, List[int]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            'region_code': self.region_code,
+            'annual_tons_co2': self.annual_tons_co2,
+            'flat_rate_tons_co2': self.flat_rate_tons_co2,
+            'average_intensity_kg_kwh': self.average_intensity,
+            'monthly_tons_co2': self.monthly_tons_co2,
+            'optimal_hours': self.optimal_hours,
+            'optimal_hours_by_month': {str(month): hours for month, hours in self.optimal_hours_by_month.items()}
+        }
+
+
+@lru_cache(maxsize=64)
+def _calendar_index(start_date: datetime, simulation_hours: int,
+                    step_minutes: int) -> Tuple[np.ndarray, np.ndarray, int]:
+    # Flat (month x hour) profile index and calendar month number for every step,
+    # shared read-only, plus the number of calendar months covered
+    calendar = build_calendar(start_date, simulation_hours, step_minutes)
+    profile_index = (calendar.month - 1) * 24 + calendar.hour_of_day
+    month_of_step = calendar.month_index
+    for array in (profile_index, month_of_step):
+        array.flags.writeable = False
+    return profile_index, month_of_step, int(month_of_step[-1]) + 1 if len(month_of_step) else 0
+
+
+def carbon_intensity_array(region_code: str, start_date: datetime, simulation_hours: int = 8760,
+                           step_minutes: int = 60) -> np.ndarray:
+    """kg CO2/kWh for every simulation step"""
+    profile_index, _, _ = _calendar_index(start_date, simulation_hours, step_minutes)
+    return carbon_intensity_profile(region_code).ravel()[profile_index]
+
+
+def calculate_hourly_emissions(sim_result: PowerSimulationResult, region_code: str) -> CarbonResult:
+    """Emissions of sim_result's power profile using the region's month x hour carbon profile"""
+    if region_code not in CARBON_REGION_INDEX:
+        region_code = "DEFAULT"
+    profile = carbon_intensity_profile(region_code)
+    simulation_hours = len(sim_result.hourly_power_kw) // sim_result.steps_per_hour
+    profile_index, month_of_step, months = _calendar_index(
+        sim_result.start_date, simulation_hours, sim_result.step_minutes
+    )
+
+    energy_kwh = sim_result.hourly_power_kw.astype(np.float64, copy=False) * sim_result.step_hours
+    intensity = profile.ravel()[profile_index]
+    hourly_co2_kg = energy_kwh * intensity
+    total_kwh = float(energy_kwh.sum())
+    total_kg = float(hourly_co2_kg.sum())
+
+    monthly_kg = np.bincount(month_of_step, weights=hourly_co2_kg, minlength=months)
+    first_month = np.datetime64(sim_result.start_date, 'M')
+
+    # Cleanest hours of the day, ranked on the day-weighted annual mean and per month
+    annual_by_hour = (profile * DAYS_PER_MONTH[:, None]).sum(axis=0)
+    by_month = np.argsort(profile, axis=1, kind="stable")[:, :OPTIMAL_HOUR_COUNT]
+
+    mean_intensity = GridImpactCalculator().grid_regions[region_code]["carbon_intensity"]
+    return CarbonResult(
+        region_code=region_code,
+        hourly_co2_kg=hourly_co2_kg,
+        annual_tons_co2=total_kg / KG_PER_US_TON,
+        flat_rate_tons_co2=total_kwh * mean_intensity / KG_PER_US_TON,
+        average_intensity=total_kg / total_kwh if total_kwh > 0 else 0.0,
+        monthly_tons_co2=[
+            {'month': str(first_month + i), 'tons_co2': float(monthly_kg[i] / KG_PER_US_TON)}
+            for i in range(months)
+        ],
+        optimal_hours=sorted(np.argsort(annual_by_hour, kind="stable")[:OPTIMAL_HOUR_COUNT].tolist()),
+        optimal_hours_by_month={month + 1: sorted(by_month[month].tolist()) for month in range(12)}
+    )
@@ -0,0 +1,251 @@
+import json
+import os
+import struct
+import sys
+import zipfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import http_client
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+# Bundled index: built from cb_2016_us_county_500k without Connecticut (09, planning
+# regions since 2022) and Valdez-Cordova (02261, split in 2019), whose points fall
+# through to the Census geocoder. Rebuild from the current release to cover them.
+DEFAULT_COUNTY_INDEX_PATH = os.path.join(DATA_DIR, "county_index.npz")
+# TIGER/Line cartographic boundary counties (1:500k); the build command reads the zip directly
+COUNTY_BOUNDARY_URL = "https://www2.census.gov/geo/tiger/GENZ2023/shp/cb_2023_us_county_500k.zip"
+CENSUS_GEOCODER_URL = "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
+
+GRID_CELL_DEGREES = 0.5  # Spatial index cell size; a cell lists every county whose bbox touches it
+
+
+class CountyResolver:
+    """
+    Offline (lat, lon) -> county lookup over bundled boundary polygons.
+
+    A uniform grid over county bounding boxes narrows each query to a few
+    candidates, which are tested with an even-odd ray cast over their ring
+    edges (holes and multi-part counties need no special casing). Points
+    outside every county return None so callers can fall back to the
+    Census geocoder.
+    """
+
+    def __init__(self, fips: np.ndarray, names: np.ndarray, bboxes: np.ndarray,
+                 vertices: np.ndarray, vertex_offsets: np.ndarray, edge_valid: np.ndarray):
+        self.fips = fips                      # (counties,) 5-digit state+county FIPS
+        self.names = names                    # (counties,) e.g. "Alameda County, California"
+        self.bboxes = bboxes                  # (counties, 4) min_lon, min_lat, max_lon, max_lat
+        self.vertices = vertices              # (points, 2) lon, lat; each county's rings are contiguous
+        self.vertex_offsets = vertex_offsets  # (counties + 1,) county c owns vertices[offsets[c]:offsets[c+1]]
+        self.edge_valid = edge_valid          # (points,) vertex i -> i+1 is an edge of the same ring
+
+        # Grid index: CSR arrays mapping each cell to candidate counties
+        self.origin = np.floor(bboxes[:, :2].min(axis=0) / GRID_CELL_DEGREES) * GRID_CELL_DEGREES
+        cell_min = np.floor((bboxes[:, :2] - self.origin) / GRID_CELL_DEGREES).astype(np.int64)
+        cell_max = np.floor((bboxes[:, 2:] - self.origin) / GRID_CELL_DEGREES).astype(np.int64)
+        self.shape = tuple(cell_max.max(axis=0) + 1)
+        cells: List[List[int]] = [[] for _ in range(self.shape[0] * self.shape[1])]
+        for county, ((x0, y0), (x1, y1)) in enumerate(zip(cell_min, cell_max)):
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    cells[x * self.shape[1] + y].append(county)
+        self.cell_offsets = np.cumsum([0] + [len(c) for c in cells])
+        self.cell_counties = np.fromiter((county for c in cells for county in c), dtype=np.int32,
+                                         count=int(self.cell_offsets[-1]))
+
+    @property
+    def counties(self) -> int:
+        return len(self.fips)
+
+    def _candidates(self, lat: float, lon: float) -> np.ndarray:
+        x, y = np.floor((np.array([lon, lat]) - self.origin) / GRID_CELL_DEGREES).astype(np.int64)
+        if not (0 <= x < self.shape[0] and 0 <= y < self.shape[1]):
+            return self.cell_counties[:0]
+        cell = x * self.shape[1] + y
+        return self.cell_counties[self.cell_offsets[cell]:self.cell_offsets[cell + 1]]
+
+    def _contains(self, county: int, lat: float, lon: float) -> bool:
+        start, end = self.vertex_offsets[county], self.vertex_offsets[county + 1]
+        x0, y0 = self.vertices[start:end - 1].T
+        x1, y1 = self.vertices[start + 1:end].T
+        straddles = ((y0 > lat) != (y1 > lat)) & self.edge_valid[start:end - 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing_x = x0 + (lat - y0) * (x1 - x0) / (y1 - y0)
+        return bool(np.count_nonzero(straddles & (lon < crossing_x)) % 2)
+
+    def lookup(self, lat: float, lon: float) -> Optional[Dict[str, str]]:
+        """County containing the point, or None outside coverage"""
+        for county in self._candidates(lat, lon):
+            min_lon, min_lat, max_lon, max_lat = self.bboxes[county]
+            if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat and self._contains(county, lat, lon):
+                fips = str(self.fips[county])
+                return {"state_fips": fips[:2], "county_fips": fips[2:], "name": str(self.names[county])}
+        return None
+
+
+def _read_shapefile(shp: bytes, dbf: bytes) -> List[Tuple[Dict[str, str], List[np.ndarray]]]:
+    # Minimal ESRI shapefile reader for polygon (type 5) records and their dBASE attributes
+    records, header_length, record_length = struct.unpack("<xxxxIHH", dbf[:12])
+    fields, position = [], 32
+    while dbf[position] != 0x0D:
+        name = dbf[position:position + 11].split(b"\x00")[0].decode("ascii")
+        fields.append((name, dbf[position + 16]))
+        position += 32
+    attributes = []
+    for record in range(records):
+        offset = header_length + record * record_length
+        if dbf[offset:offset + 1] == b"*":
+            attributes.append(None)  # Deleted record; its shape is dropped below
+            continue
+        row, offset = {}, offset + 1
+        for name, length in fields:
+            row[name] = dbf[offset:offset + length].decode("latin-1").strip()
+            offset += length
+        attributes.append(row)
+
+    shapes, offset = [], 100
+    while offset < len(shp):
+        content_length = struct.unpack(">I", shp[offset + 4:offset + 8])[0] * 2
+        content = shp[offset + 8:offset + 8 + content_length]
+        offset += 8 + content_length
+        if struct.unpack("<i", content[:4])[0] != 5:
+            shapes.append([])  # Null shape
+            continue
+        parts, points = struct.unpack("<ii", content[36:44])
+        starts = list(struct.unpack(f"<{parts}i", content[44:44 + 4 * parts])) + [points]
+        coordinates = np.frombuffer(content, dtype="<f8", count=2 * points, offset=44 + 4 * parts).reshape(-1, 2)
+        shapes.append([coordinates[a:b] for a, b in zip(starts[:-1], starts[1:])])
+    return [(row, rings) for row, rings in zip(attributes, shapes) if row is not None]
+
+
+def _read_geojson(features: List[Dict]) -> List[Tuple[Dict[str, str], List[np.ndarray]]]:
+    counties = []
+    for feature in features:
+        geometry = feature["geometry"]
+        polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+        counties.append((feature["properties"], [np.asarray(ring, dtype=float) for polygon in polygons for ring in polygon]))
+    return counties
+
+
+def build_county_index(source: str, exclude: Sequence[str] = ()) -> Dict[str, np.ndarray]:
+    """
+    Flatten county boundaries into index arrays.
+
+    source is a cartographic boundary zip or .shp (with its .dbf beside it),
+    or a GeoJSON FeatureCollection; records need STATEFP, COUNTYFP and NAME
+    (plus STATE_NAME when present). Counties whose 5-digit FIPS starts with
+    any exclude prefix (a state or a single county) are left out.
+    """
+    if source.endswith(".zip"):
+        with zipfile.ZipFile(source) as archive:
+            names = archive.namelist()
+            shp = archive.read(next(n for n in names if n.endswith(".shp")))
+            dbf = archive.read(next(n for n in names if n.endswith(".dbf")))
+        counties = _read_shapefile(shp, dbf)
+    elif source.endswith(".shp"):
+        with open(source, "rb") as f_shp, open(source[:-4] + ".dbf", "rb") as f_dbf:
+            counties = _read_shapefile(f_shp.read(), f_dbf.read())
+    else:
+        with open(source) as f:
+            counties = _read_geojson(json.load(f)["features"])
+
+    fips, names, bboxes, vertices, offsets, edge_valid = [], [], [], [], [0], []
+    for attributes, rings in counties:
+        rings = [ring if np.array_equal(ring[0], ring[-1]) else np.vstack([ring, ring[:1]])
+                 for ring in rings if len(ring) >= 3]
+        county_fips = attributes["STATEFP"] + attributes["COUNTYFP"]
+        if not rings or county_fips.startswith(tuple(exclude)):
+            continue
+        points = np.vstack(rings)
+        fips.append(county_fips)
+        name = attributes.get("NAMELSAD") or attributes["NAME"]
+        names.append(f"{name}, {attributes['STATE_NAME']}" if attributes.get("STATE_NAME") else name)
+        bboxes.append([*points.min(axis=0), *points.max(axis=0)])
+        vertices.append(points)
+        offsets.append(offsets[-1] + len(points))
+        for ring in rings:
+            valid = np.ones(len(ring), dtype=bool)
+            valid[-1] = False  # Last vertex closes the ring; the next vertex starts another
+            edge_valid.append(valid)
+
+    return {
+        "fips": np.array(fips),
+        "names": np.array(names),
+        "bboxes": np.array(bboxes, dtype=np.float64),
+        "vertices": np.vstack(vertices).astype(np.float64),
+        "vertex_offsets": np.array(offsets, dtype=np.int64),
+        "edge_valid": np.concatenate(edge_valid)
+    }
+
+
+def save_county_index(arrays: Dict[str, np.ndarray], path: str = DEFAULT_COUNTY_INDEX_PATH) -> None:
+    """
+    Write the index compressed with float32 vertices (about 1 m at US
+    longitudes, well inside the 1:500k generalization); bounding boxes are
+    recomputed from the rounded vertices so they still enclose every ring.
+    """
+    vertices = arrays["vertices"].astype(np.float32)
+    starts = arrays["vertex_offsets"][:-1]
+    bboxes = np.hstack([np.minimum.reduceat(vertices, starts), np.maximum.reduceat(vertices, starts)])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez_compressed(path, **{**arrays, "vertices": vertices, "bboxes": bboxes.astype(np.float64)})
+
+
+def load_county_resolver(path: Optional[str] = None) -> Optional[CountyResolver]:
+    """
+    Load the index (COUNTY_INDEX_PATH or the bundled file); warns and
+    returns None when it is missing, in which case every lookup goes to
+    the Census geocoder.
+    """
+    path = path or os.getenv("COUNTY_INDEX_PATH", DEFAULT_COUNTY_INDEX_PATH)
+    if not os.path.exists(path):
+        print(f"Warning: county index {path} not found; geocoding falls back to the Census API", file=sys.stderr)
+        return None
+    with np.load(path) as arrays:
+        index = {name: arrays[name] for name in arrays.files}
+    index["vertices"] = index["vertices"].astype(np.float64)
+    return CountyResolver(**index)
+
+
+_county_resolver: Optional[CountyResolver] = None
+_county_resolver_loaded = False
+
+def get_county_resolver() -> Optional[CountyResolver]:
+    # Loaded once per process on first use
+    global _county_resolver, _county_resolver_loaded
+    if not _county_resolver_loaded:
+        _county_resolver = load_county_resolver()
+        _county_resolver_loaded = True
+    return _county_resolver
+
+
+def census_geocode(lat: float, lon: float) -> Optional[Dict[str, str]]:
+    """Live Census geocoder lookup: state/county FIPS and, when returned, the tract"""
+    params = {
+        "x": lon,
+        "y": lat,
+        "benchmark": "Public_AR_Current",
+        "vintage": "Current_Current",
+        "format": "json"
+    }
+    response = http_client.get(CENSUS_GEOCODER_URL, params=params)
+    geographies = (response.json() if response.status_code == 200 else {}).get("result", {}).get("geographies", {})
+    counties = geographies.get("Counties", [])
+    if not counties:
+        return None
+    tracts = geographies.get("Census Tracts", [])
+    return {
+        "state_fips": counties[0].get("STATE", ""),
+        "county_fips": counties[0].get("COUNTY", ""),
+        "name": counties[0].get("NAME", ""),
+        "tract": tracts[0].get("TRACT", "") if tracts else ""
+    }
+
+
+def resolve_county(lat: float, lon: float) -> Optional[Dict[str, str]]:
+    """Offline lookup first; the Census geocoder only outside the bundled coverage"""
+    resolver = get_county_resolver()
+    county = resolver.lookup(lat, lon) if resolver is not None else None
+    return county if county is not None else census_geocode(lat, lon)
@@ -0,0 +1,201 @@
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+# (connect, read) seconds; a bare number passed by a caller replaces the read timeout only
+DEFAULT_TIMEOUT = (3.05, 10.0)
+MAX_RETRIES = 2              # Retries after the first attempt
+BACKOFF_BASE = 0.25          # Seconds; attempt n sleeps uniform(0, base * 2**n) ("full jitter")
+BACKOFF_MAX = 4.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods safe to resend after the server may have acted on them (RFC 9110 9.2.2)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+POOL_SIZE = 16               # Keep-alive connections per host
+DEFAULT_HOST_CONCURRENCY = 8
+# Hosts with published usage policies get tighter in-flight limits
+HOST_CONCURRENCY = {
+    "nominatim.openstreetmap.org": 1,
+    "overpass-api.de": 2
+}
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class HostStats:
+    """Request counters and a latency histogram for one upstream host"""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0          # Attempts that raised (timeouts, connection failures)
+        self.status_counts: Dict[int, int] = {}
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, seconds: float, status: Optional[int]):
+        self.requests += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        milliseconds = seconds * 1000
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if milliseconds <= bound),
+                      len(LATENCY_BUCKETS_MS))
+        self.buckets[bucket] += 1
+        if status is None:
+            self.errors += 1
+        else:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def quantile_ms(self, q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-th request (None past the last bound)
+        target = q * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return float(bound)
+        return None
+
+    def to_dict(self) -> Dict:
+        labels = [f"le_{bound}ms" for bound in LATENCY_BUCKETS_MS] + [f"gt_{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "status_counts": {str(status): count for status, count in sorted(self.status_counts.items())},
+            "mean_ms": self.total_seconds / self.requests * 1000 if self.requests else 0.0,
+            "max_ms": self.max_seconds * 1000,
+            "p50_ms": self.quantile_ms(0.5) if self.requests else None,
+            "p95_ms": self.quantile_ms(0.95) if self.requests else None,
+            "histogram": dict(zip(labels, self.buckets))
+        }
+
+
+def _failed_before_send(error: Exception) -> bool:
+    # True when the request never reached the server (DNS, refused or timed-out connect)
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError)
+
+
+class UpstreamClient:
+    """
+    Shared HTTP client for every upstream API.
+
+    Each host gets its own keep-alive Session, an in-flight limit and latency
+    stats. Calls always carry a connect/read timeout, and connection errors,
+    timeouts and 429/5xx responses are retried with jittered exponential
+    backoff. Non-idempotent requests (POST, PATCH) are only retried when the
+    connection failed before anything was sent, unless the caller passes
+    idempotent=True for a read-only endpoint. Responses are plain requests.Response objects, so call sites
+    keep their status_code / raise_for_status handling.
+    """
+
+    def __init__(self, max_retries: int = MAX_RETRIES, timeout: Tuple[float, float] = DEFAULT_TIMEOUT):
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._sessions: Dict[str, requests.Session] = {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host: str) -> Tuple[requests.Session, threading.BoundedSemaphore, HostStats]:
+        with self._lock:
+            if host not in self._sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+                self._semaphores[host] = threading.BoundedSemaphore(
+                    HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+                )
+                self._stats[host] = HostStats()
+            return self._sessions[host], self._semaphores[host], self._stats[host]
+
+    def _timeout(self, timeout: Union[None, float, Tuple[float, float]]) -> Tuple[float, float]:
+        if timeout is None:
+            return self.timeout
+        if isinstance(timeout, tuple):
+            return timeout
+        return (self.timeout[0], float(timeout))
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+        # Honour a numeric Retry-After (429/503) when it asks for longer
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            delay = max(delay, min(BACKOFF_MAX, float(retry_after)))
+        return delay
+
+    def request(self, method: str, url: str, timeout=None, max_retries: Optional[int] = None,
+                idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        session, semaphore, stats = self._host(urlsplit(url).netloc)
+        timeout = self._timeout(timeout)
+        max_retries = self.max_retries if max_retries is None else max_retries
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(max_retries + 1):
+            response = None
+            started = time.perf_counter()
+            try:
+                with semaphore:
+                    response = session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                with self._lock:
+                    stats.record(time.perf_counter() - started, None)
+                if attempt == max_retries or not (idempotent or _failed_before_send(error)):
+                    raise
+            else:
+                with self._lock:
+                    stats.record(time.perf_counter() - started, response.status_code)
+                if response.status_code not in RETRY_STATUSES or attempt == max_retries or not idempotent:
+                    return response
+            with self._lock:
+                stats.retries += 1
+            time.sleep(self._backoff(attempt, response))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {host: host_stats.to_dict() for host, host_stats in sorted(self._stats.items())}
+
+
+_upstream_client: Optional[UpstreamClient] = None
+_upstream_client_lock = threading.Lock()
+
+
+def get_upstream_client() -> UpstreamClient:
+    # One client per process so every analyzer shares the same pools and stats, created on first use
+    global _upstream_client
+    with _upstream_client_lock:
+        if _upstream_client is None:
+            _upstream_client = UpstreamClient()
+    return _upstream_client
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """requests.get through the shared upstream client"""
+    return get_upstream_client().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """requests.post through the shared upstream client"""
+    return get_upstream_client().post(url, **kwargs)
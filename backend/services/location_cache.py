@@ -0,0 +1,144 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from .acs_table import ACS_TABLE_YEAR
+
+# Map clicks are snapped to a 0.01 degree grid (~1 km) before the FIPS lookup
+COORD_PRECISION = 2
+FIPS_TTL_SECONDS = 365 * 24 * 3600   # County boundaries change at most yearly
+ACS_TTL_SECONDS = 90 * 24 * 3600     # ACS 5-year estimates are released once a year
+MEMORY_ENTRIES = 4096                # Per namespace
+
+NAMESPACES = ("fips", "acs")
+
+
+def quantize_coordinates(lat: float, lon: float) -> str:
+    return f"{round(float(lat), COORD_PRECISION):.{COORD_PRECISION}f},{round(float(lon), COORD_PRECISION):.{COORD_PRECISION}f}"
+
+
+def county_key(state_fips: str, county_fips: str) -> str:
+    # ACS rows are keyed by vintage so rows cached from an older release stop matching
+    return f"{ACS_TABLE_YEAR}:{state_fips}{county_fips}"
+
+
+class LocationCache:
+    """
+    Two-tier cache of location lookups: quantized lat/lon -> county FIPS and
+    county FIPS -> ACS population/income row.
+
+    The first tier is an in-process LRU per namespace; the second a SQLite
+    table that survives restarts and is shared by every worker on the host.
+    Disk hits are promoted into memory. Entries expire after a per-namespace
+    TTL; only successful lookups should be stored.
+    """
+
+    def __init__(self, path: str, memory_entries: int = MEMORY_ENTRIES,
+                 ttl_seconds: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.ttl_seconds = {"fips": FIPS_TTL_SECONDS, "acs": ACS_TTL_SECONDS, **(ttl_seconds or {})}
+        self._memory: Dict[str, OrderedDict] = {namespace: OrderedDict() for namespace in NAMESPACES}
+        self._counts = {namespace: {"memory_hits": 0, "disk_hits": 0, "misses": 0} for namespace in NAMESPACES}
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+
+    def get(self, namespace: str, key: str) -> Optional[Dict]:
+        now = time.time()
+        with self._lock:
+            memory = self._memory[namespace]
+            entry = memory.get(key)
+            if entry is not None and entry[1] > now:
+                memory.move_to_end(key)
+                self._counts[namespace]["memory_hits"] += 1
+                return entry[0]
+
+            row = self._db.execute(
+                "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, key, now)
+            ).fetchone()
+            if row is None:
+                memory.pop(key, None)
+                self._counts[namespace]["misses"] += 1
+                return None
+
+            value = json.loads(row[0])
+            self._remember(namespace, key, value, row[1])
+            self._counts[namespace]["disk_hits"] += 1
+            return value
+
+    def put(self, namespace: str, key: str, value: Dict):
+        self.put_many(namespace, [(key, value)])
+
+    def put_many(self, namespace: str, items: Iterable[Tuple[str, Dict]]) -> int:
+        """Store many entries in one transaction (bulk preloading); returns the count"""
+        expires_at = time.time() + self.ttl_seconds[namespace]
+        items = list(items)
+        with self._lock:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    [(namespace, key, json.dumps(value), expires_at) for key, value in items]
+                )
+            for key, value in items[-self.memory_entries:]:
+                self._remember(namespace, key, value, expires_at)
+        return len(items)
+
+    def _remember(self, namespace: str, key: str, value: Dict, expires_at: float):
+        memory = self._memory[namespace]
+        memory[key] = (value, expires_at)
+        memory.move_to_end(key)
+        while len(memory) > self.memory_entries:
+            memory.popitem(last=False)
+
+    # Typed helpers for the two lookups
+
+    def get_fips(self, lat: float, lon: float) -> Optional[Dict]:
+        return self.get("fips", quantize_coordinates(lat, lon))
+
+    def put_fips(self, lat: float, lon: float, geo: Dict):
+        self.put("fips", quantize_coordinates(lat, lon), geo)
+
+    def get_acs(self, state_fips: str, county_fips: str) -> Optional[Dict]:
+        return self.get("acs", county_key(state_fips, county_fips))
+
+    def put_acs(self, row: Dict):
+        self.put("acs", county_key(row["state_fips"], row["county_fips"]), row)
+
+    def preload_acs(self, rows: Iterable[Dict]) -> int:
+        return self.put_many("acs", ((county_key(row["state_fips"], row["county_fips"]), row) for row in rows))
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            with self._db:
+                removed = self._db.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),)).rowcount
+        return removed
+
+    def stats(self) -> Dict:
+        with self._lock:
+            disk_entries = dict(self._db.execute(
+                "SELECT namespace, COUNT(*) FROM entries WHERE expires_at > ? GROUP BY namespace", (time.time(),)
+            ).fetchall())
+            stats = {}
+            for namespace, counts in self._counts.items():
+                lookups = sum(counts.values())
+                hits = counts["memory_hits"] + counts["disk_hits"]
+                stats[namespace] = {
+                    **counts,
+                    "hit_ratio": hits / lookups if lookups else 0.0,
+                    "memory_entries": len(self._memory[namespace]),
+                    "disk_entries": disk_entries.get(namespace, 0)
+                }
+            return stats
@@ -0,0 +1,235 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .carbon import CarbonResult, calculate_hourly_emissions, carbon_intensity_array
+from .simulate import GridImpactCalculator, GridInfo, PowerSimulationResult
+from .tariff import Tariff, TariffCostResult, calculate_tou_cost, tariff_price_array
+
+# Default flexible groups: training jobs. Callers pass flexible_types to add batch
+# queues or other deferrable groups, matched by datacenter_type or group name.
+FLEXIBLE_WORKLOAD_TYPES = ("ai_training",)
+
+SHIFT_WINDOWS = {"daily": 24, "weekly": 168}
+SHIFT_OBJECTIVES = ("cost", "carbon", "blended")
+DEFAULT_CARBON_PRICE_PER_TON = 51.0  # $/metric ton CO2 used by the blended objective
+
+
+@dataclass(eq=False)
+class LoadShiftResult:
+    # A load-shifted profile and its savings against the original simulation
+    shifted_power_kw: np.ndarray
+    flexible_share: float        # Share of energy from flexible workload types
+    flexible_fraction: float     # Fraction of that energy allowed to move
+    window: str
+    objective: str
+    capacity_kw: float           # Facility power cap the shifted profile respects
+    requested_capacity_kw: Optional[float]  # Cap asked for, if any
+    capacity_met: bool           # False when the requested cap is below what shifting can reach
+    flexible_types: Tuple[str, ...]
+    shifted_energy_mwh: float
+    original_cost: TariffCostResult
+    shifted_cost: TariffCostResult
+    original_emissions: CarbonResult
+    shifted_emissions: CarbonResult
+    original_peak_kw: float
+    shifted_peak_kw: float
+    community_impact: Dict       # GridImpactCalculator output for the shifted profile
+
+    def to_dict(self) -> Dict:
+        return {
+            'flexible_share': self.flexible_share,
+            'flexible_fraction': self.flexible_fraction,
+            'window': self.window,
+            'objective': self.objective,
+            'capacity_kw': self.capacity_kw,
+            'requested_capacity_kw': self.requested_capacity_kw,
+            'capacity_met': self.capacity_met,
+            'flexible_types': list(self.flexible_types),
+            'shifted_energy_mwh': self.shifted_energy_mwh,
+            'cost_savings': self.original_cost.total_cost - self.shifted_cost.total_cost,
+            'co2_savings_tons': self.original_emissions.annual_tons_co2 - self.shifted_emissions.annual_tons_co2,
+            'peak_reduction_mw': (self.original_peak_kw - self.shifted_peak_kw) / 1000,
+            'original_cost': self.original_cost.total_cost,
+            'shifted_cost': self.shifted_cost.total_cost,
+            'original_tons_co2': self.original_emissions.annual_tons_co2,
+            'shifted_tons_co2': self.shifted_emissions.annual_tons_co2,
+            'original_peak_mw': self.original_peak_kw / 1000,
+            'shifted_peak_mw': self.shifted_peak_kw / 1000,
+            'community_impact': self.community_impact
+        }
+
+
+def _is_flexible(group: Dict, flexible_types) -> bool:
+    return group['datacenter_type'] in flexible_types or group['name'] in flexible_types
+
+
+def flexible_share(sim_result: PowerSimulationResult, flexible_types=FLEXIBLE_WORKLOAD_TYPES) -> float:
+    """Share of IT energy from flexible workload types (from the fleet breakdown)"""
+    if not sim_result.fleet_breakdown:
+        return 0.0
+    return float(sum(
+        group['share_of_it_energy'] for group in sim_result.fleet_breakdown
+        if _is_flexible(group, flexible_types)
+    ))
+
+
+def flexible_power_profile(sim_result: PowerSimulationResult, flexible_types=FLEXIBLE_WORKLOAD_TYPES) -> np.ndarray:
+    """Facility power (IT x PUE) drawn by the flexible groups at every step"""
+    mask = [_is_flexible(group, flexible_types) for group in sim_result.fleet_breakdown or []]
+    if not any(mask):
+        return np.zeros(len(sim_result.hourly_power_kw))
+    if sim_result.group_it_power_kw is None:
+        raise ValueError("Load shifting needs the per-group power series of the simulation")
+    flexible_it_kw = np.asarray(sim_result.group_it_power_kw, dtype=np.float64)[np.array(mask)].sum(axis=0)
+    return flexible_it_kw * sim_result.hourly_pue
+
+
+def _as_windows(values: np.ndarray, window_steps: int, fill: float) -> np.ndarray:
+    # (windows x window_steps) view of a series; the trailing partial window is padded with fill
+    windows = -(-len(values) // window_steps)
+    padded = np.full(windows * window_steps, fill, dtype=np.float64)
+    padded[:len(values)] = values
+    return padded.reshape(windows, window_steps)
+
+
+def _water_levels(base: np.ndarray, energy: np.ndarray) -> np.ndarray:
+    # Per window, the flat level L with sum(max(0, L - base)) == energy: the lowest peak
+    # any placement of that energy can reach. Candidate levels for filling the k lowest
+    # steps come from one cumulative sum; the valid candidates form a prefix.
+    ordered = np.sort(base, axis=1)
+    filled = np.arange(1, base.shape[1] + 1)
+    with np.errstate(invalid="ignore"):
+        candidates = (energy[:, None] + np.cumsum(ordered, axis=1)) / filled
+    valid = ordered < candidates
+    count = np.maximum(valid.sum(axis=1), 1)
+    return candidates[np.arange(len(base)), count - 1]
+
+
+def _greedy_fill(score: np.ndarray, headroom: np.ndarray, energy: np.ndarray) -> np.ndarray:
+    # Place each window's energy into its lowest-score steps up to their headroom.
+    # This is the exact LP optimum for one linear objective with per-step bounds.
+    order = np.argsort(score, axis=1, kind="stable")
+    sorted_headroom = np.take_along_axis(headroom, order, axis=1)
+    filled_before = np.cumsum(sorted_headroom, axis=1) - sorted_headroom
+    allocation = np.clip(energy[:, None] - filled_before, 0, sorted_headroom)
+    placed = np.empty_like(allocation)
+    np.put_along_axis(placed, order, allocation, axis=1)
+    return placed
+
+
+def shift_power_profile(
+    power_kw: np.ndarray,
+    flexible_kw: np.ndarray,
+    score: np.ndarray,
+    window_steps: int,
+    capacity_kw: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
+    """
+    Move flexible_kw within consecutive windows of window_steps to the
+    lowest-score steps. The facility cap is the lowest level every window can
+    meet (peak reduction first), raised to capacity_kw when a higher cap is
+    allowed; it never exceeds the original peak. Returns the shifted profile
+    and the cap used.
+    """
+    steps = len(power_kw)
+    base = _as_windows(power_kw - flexible_kw, window_steps, np.inf)
+    energy = _as_windows(flexible_kw, window_steps, 0.0).sum(axis=1)
+    window_score = _as_windows(score, window_steps, np.inf)
+
+    finite_base = np.where(np.isfinite(base), base, -np.inf)
+    minimum_cap = max(float(_water_levels(base, energy).max()), float(finite_base.max()))
+    cap = minimum_cap if capacity_kw is None else max(minimum_cap, float(capacity_kw))
+    cap = min(cap, float(power_kw.max()))
+
+    headroom = np.clip(cap - base, 0, None)
+    placed = _greedy_fill(window_score, headroom, energy)
+    shifted = (base + placed).ravel()[:steps]
+    return shifted, cap
+
+
+def optimize_load_shifting(
+    sim_result: PowerSimulationResult,
+    grid_info: GridInfo,
+    tariff: Tariff,
+    flexible_fraction: float = 0.3,
+    window: str = "daily",
+    objective: str = "cost",
+    capacity_kw: Optional[float] = None,
+    carbon_price_per_ton: float = DEFAULT_CARBON_PRICE_PER_TON,
+    flexible_types=FLEXIBLE_WORKLOAD_TYPES
+) -> LoadShiftResult:
+    """
+    Shift the flexible part of sim_result's load within daily or weekly
+    windows to cut cost, CO2 or both, and re-run grid impact on the result.
+
+    The flexible load is the hourly facility power of the groups whose
+    datacenter_type or name is in flexible_types, times flexible_fraction.
+    It is shifted as-is (PUE differences between the source and destination
+    hours are ignored) and energy within each window is conserved. A
+    capacity_kw below the lowest cap the windows can reach is reported with
+    capacity_met False and the reachable cap in capacity_kw.
+    """
+    if window not in SHIFT_WINDOWS:
+        raise ValueError(f"window must be one of {sorted(SHIFT_WINDOWS)}, got '{window}'")
+    if objective not in SHIFT_OBJECTIVES:
+        raise ValueError(f"objective must be one of {SHIFT_OBJECTIVES}, got '{objective}'")
+    flexible_fraction = min(max(float(flexible_fraction), 0.0), 1.0)
+
+    power_kw = sim_result.hourly_power_kw.astype(np.float64, copy=False)
+    simulation_hours = len(power_kw) // sim_result.steps_per_hour
+    flexible_types = tuple(flexible_types)
+    share = flexible_share(sim_result, flexible_types)
+    flexible_kw = flexible_power_profile(sim_result, flexible_types) * flexible_fraction
+
+    prices = tariff_price_array(tariff, sim_result.start_date, simulation_hours, sim_result.step_minutes)
+    intensity = carbon_intensity_array(
+        tariff.region_code, sim_result.start_date, simulation_hours, sim_result.step_minutes
+    )
+    if objective == "cost":
+        score = prices
+    elif objective == "carbon":
+        score = intensity
+    else:
+        score = prices + intensity * (carbon_price_per_ton / 1000)
+
+    shifted_kw, cap = shift_power_profile(
+        power_kw, flexible_kw, score,
+        SHIFT_WINDOWS[window] * sim_result.steps_per_hour, capacity_kw
+    )
+
+    shifted = PowerSimulationResult(
+        hourly_power_kw=shifted_kw,
+        hourly_utilization=sim_result.hourly_utilization,
+        hourly_pue=sim_result.hourly_pue,
+        peak_power_kw=float(shifted_kw.max()),
+        average_power_kw=float(shifted_kw.mean()),
+        annual_consumption_mwh=float(shifted_kw.sum()) * sim_result.step_hours / 1000,
+        community_impact=GridImpactCalculator().calculate_grid_impact_from_stats(
+            float(shifted_kw.max()) / 1000, float(shifted_kw.mean()) / 1000, grid_info
+        ),
+        seed=sim_result.seed,
+        start_date=sim_result.start_date,
+        step_minutes=sim_result.step_minutes
+    )
+
+    return LoadShiftResult(
+        shifted_power_kw=shifted_kw,
+        flexible_share=share,
+        flexible_fraction=flexible_fraction,
+        window=window,
+        objective=objective,
+        capacity_kw=cap,
+        requested_capacity_kw=None if capacity_kw is None else float(capacity_kw),
+        capacity_met=capacity_kw is None or cap <= float(capacity_kw),
+        flexible_types=flexible_types,
+        shifted_energy_mwh=float(np.abs(shifted_kw - power_kw).sum()) / 2 * sim_result.step_hours / 1000,
+        original_cost=calculate_tou_cost(sim_result, tariff),
+        shifted_cost=calculate_tou_cost(shifted, tariff),
+        original_emissions=calculate_hourly_emissions(sim_result, tariff.region_code),
+        shifted_emissions=calculate_hourly_emissions(shifted, tariff.region_code),
+        original_peak_kw=float(power_kw.max()),
+        shifted_peak_kw=shifted.peak_power_kw,
+        community_impact=shifted.community_impact
+    )
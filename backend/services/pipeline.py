@@ -0,0 +1,110 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+# Upstream fetches are I/O bound; a few requests' worth of stages can be in flight at once
+FETCH_WORKERS = 16
+
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+_fetch_executor_lock = threading.Lock()
+
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    # One thread pool per process shared by every request pipeline, created on first use
+    global _fetch_executor
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch")
+    return _fetch_executor
+
+
+class StagePipeline:
+    """
+    A small dependency graph of request stages run on a shared executor.
+
+    Each stage is called with its dependencies' results as positional
+    arguments and is submitted the moment the last of them finishes, so
+    independent stages overlap and wall-clock time follows the critical path.
+    A failed stage fails every stage downstream of it.
+    """
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None):
+        self.executor = executor or get_fetch_executor()
+        self.stages: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {}
+        self.futures: Dict[str, Future] = {}
+        self.timings: Dict[str, float] = {}  # Seconds each stage spent running
+        self._lock = threading.Lock()
+        self._submitted = set()
+        self._started = False
+
+    def add(self, name: str, func: Callable, depends_on: Sequence[str] = ()) -> "StagePipeline":
+        if self._started:
+            raise RuntimeError("Cannot add stages to a running pipeline")
+        missing = [dep for dep in depends_on if dep not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages {missing}")
+        self.stages[name] = (func, tuple(depends_on))
+        self.futures[name] = Future()
+        return self
+
+    def start(self) -> "StagePipeline":
+        """Submit every stage without dependencies; the rest follow as inputs complete"""
+        if self._started:
+            return self
+        self._started = True
+        for name, (_, depends_on) in self.stages.items():
+            if depends_on:
+                for dep in depends_on:
+                    self.futures[dep].add_done_callback(lambda _, name=name: self._maybe_submit(name))
+            else:
+                self._submit(name)
+        return self
+
+    def _maybe_submit(self, name: str):
+        depends_on = self.stages[name][1]
+        dep_futures = [self.futures[dep] for dep in depends_on]
+        with self._lock:
+            # Callbacks fire once per dependency; only the last one submits
+            if not all(f.done() for f in dep_futures) or name in self._submitted:
+                return
+            self._submitted.add(name)
+        self.futures[name].set_running_or_notify_cancel()
+        failed = next((f for f in dep_futures if f.exception() is not None), None)
+        if failed is not None:
+            self.futures[name].set_exception(failed.exception())
+            return
+        self.executor.submit(self._run, name, [f.result() for f in dep_futures])
+
+    def _submit(self, name: str):
+        self.futures[name].set_running_or_notify_cancel()
+        self.executor.submit(self._run, name, [])
+
+    def _run(self, name: str, args: list):
+        func = self.stages[name][0]
+        started = time.perf_counter()
+        try:
+            result = func(*args)
+        except BaseException as e:
+            self.timings[name] = time.perf_counter() - started
+            self.futures[name].set_exception(e)
+        else:
+            self.timings[name] = time.perf_counter() - started
+            self.futures[name].set_result(result)
+
+    def result(self, name: str, timeout: Optional[float] = None) -> Any:
+        """Block until one stage finishes and return its result (re-raising its error)"""
+        self.start()
+        return self.futures[name].result(timeout)
+
+    def as_completed(self, names: Optional[Sequence[str]] = None,
+                     timeout: Optional[float] = None) -> Iterator[Tuple[str, Any]]:
+        """Yield (name, result) for the given stages (default: all) in completion order"""
+        self.start()
+        pending = {self.futures[name]: name for name in (names or self.stages)}
+        for future in as_completed(pending, timeout=timeout):
+            yield pending[future], future.result()
+
+    def run(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run the whole graph and return every stage's result by name"""
+        return dict(self.as_completed(timeout=timeout))
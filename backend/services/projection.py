@@ -0,0 +1,234 @@
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .simulate import (
+    ClimateData,
+    CoolingEfficiencyModel,
+    DataCenterSpecs,
+    GridImpactCalculator,
+    GridInfo,
+    WorkloadSimulator,
+    build_calendar,
+    facility_utilization,
+    naive_utc,
+    new_simulation_seed,
+    simulate_fleet_it_power,
+    simulate_hourly_pue
+)
+
+HOURS_PER_YEAR = 8766  # Average year length including leap years
+MAX_PROJECTION_YEARS = 30
+
+
+@dataclass
+class BuildOutPhase:
+    # Total servers online from `date` until the next phase
+    date: datetime
+    server_count: int
+
+
+@dataclass
+class ProjectionSchedule:
+    # Phased build-out and improvement trajectories for a multi-year projection
+    phases: List[BuildOutPhase] = field(default_factory=list)  # Empty: everything online from the start
+    it_efficiency_per_year: float = 0.0    # Fractional yearly drop in power per server at equal load
+    pue_improvement_per_year: float = 0.0  # Fractional yearly drop in cooling overhead (PUE - 1)
+    baseline_growth_per_year: float = 0.0  # Fractional yearly growth of the grid's baseline demand
+
+    def __post_init__(self):
+        # Accept plain dicts (e.g. from a JSON request) with ISO dates; phase dates index a naive
+        # datetime64 timeline, so offsets are folded into UTC
+        self.phases = sorted(
+            (BuildOutPhase(
+                date=naive_utc(p.date if isinstance(p, BuildOutPhase) else p['date']),
+                server_count=p.server_count if isinstance(p, BuildOutPhase) else int(p['server_count'])
+            ) for p in self.phases),
+            key=lambda p: p.date
+        )
+
+    def validate(self, datacenter_specs: DataCenterSpecs, years: int) -> None:
+        """Raise ValueError unless every phase fits the final facility and years is in range"""
+        if not 1 <= years <= MAX_PROJECTION_YEARS:
+            raise ValueError(f"years must be between 1 and {MAX_PROJECTION_YEARS}")
+        total_servers = sum(group.count for group in datacenter_specs.fleet_groups())
+        for phase in self.phases:
+            if not 0 <= phase.server_count <= total_servers:
+                raise ValueError(
+                    f"Phase on {phase.date.date().isoformat()} has {phase.server_count} servers; "
+                    f"server_count must be between 0 and the facility's {total_servers}"
+                )
+
+
+@dataclass
+class ProjectionResult:
+    # Streaming aggregates of a multi-year projection: no hourly series are kept
+    seed: int
+    start_date: datetime
+    years: int
+    total_energy_mwh: float
+    planning_peak_kw: float       # Highest peak of any projection year (size grid upgrades to this)
+    yearly: List[Dict] = field(default_factory=list)
+    monthly: List[Dict] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            'seed': self.seed,
+            'start_date': self.start_date.isoformat(),
+            'years': self.years,
+            'total_energy_mwh': self.total_energy_mwh,
+            'planning_peak_mw': self.planning_peak_kw / 1000,
+            'yearly': self.yearly,
+            'monthly': self.monthly
+        }
+
+
+def run_projection(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    schedule: ProjectionSchedule,
+    years: int = 15,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    progress_callback = None
+) -> ProjectionResult:
+    """
+    Simulate a phased build-out over `years` one month at a time.
+
+    Months run from start_date's day of the month (clamped to shorter
+    months), so every projection year is exactly twelve months from
+    start_date; each monthly row labels its calendar month and gives its
+    start date. datacenter_specs describes the final facility; each phase's
+    server_count (0 to the facility's total) scales every fleet group by the
+    same share. IT power per server and the
+    cooling overhead improve by the schedule's yearly rates from start_date.
+    Only monthly rollups and per-year aggregates (with community_impact
+    against the grown grid baseline) are kept. Average PUE and utilization
+    cover only the hours with servers online and are None for a month or
+    year with none.
+    """
+    schedule.validate(datacenter_specs, years)
+    if seed is None:
+        seed = new_simulation_seed()
+    if start_date is None:
+        start_date = schedule.phases[0].date if schedule.phases else datetime.now()
+    start_date = naive_utc(start_date).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    fleet = datacenter_specs.fleet_groups()
+    total_servers = sum(group.count for group in fleet)
+    workload_sim = WorkloadSimulator(rng=np.random.default_rng(seed))
+    cooling_model = CoolingEfficiencyModel(cooling_type=datacenter_specs.cooling_type)
+    grid_calculator = GridImpactCalculator()
+
+    # Online share of the final fleet as a step function of time
+    phase_hours = np.array([np.datetime64(p.date, 'h') for p in schedule.phases], dtype='datetime64[h]')
+    phase_share = np.array([p.server_count / total_servers for p in schedule.phases]) if total_servers else np.zeros(0)
+    phase_servers = np.array([p.server_count for p in schedule.phases])
+
+    # Month boundaries on start_date's day, clamped to each month's length
+    start = np.datetime64(start_date, 'h')
+    calendar_months = np.datetime64(start_date, 'M') + np.arange(years * 12 + 1)
+    month_days = (calendar_months + 1).astype('datetime64[D]') - calendar_months.astype('datetime64[D]')
+    day_offset = np.minimum(start_date.day, month_days.astype(int)) - 1
+    month_starts = (calendar_months.astype('datetime64[D]') + day_offset).astype('datetime64[h]')
+
+    monthly = []
+    yearly = []
+    total_energy_mwh = 0.0
+    year_energy_kwh = year_utilization_sum = year_pue_sum = 0.0
+    year_peak_kw = 0.0
+    year_steps = year_online_steps = 0
+
+    for month in range(years * 12):
+        chunk_start, chunk_end = month_starts[month], month_starts[month + 1]
+        hours = int((chunk_end - chunk_start) / np.timedelta64(1, 'h'))
+        timestamps = chunk_start + np.arange(hours)
+        calendar = build_calendar(chunk_start.astype(datetime), hours)
+
+        # Final-fleet IT power scaled by the share online and the efficiency trajectory
+        group_power_kw, group_utilization = simulate_fleet_it_power(fleet, workload_sim, calendar)
+        years_elapsed = (timestamps - start) / np.timedelta64(HOURS_PER_YEAR, 'h')
+        phase = np.searchsorted(phase_hours, timestamps, side='right') - 1
+        if len(phase_hours):
+            online_share = np.where(phase >= 0, phase_share[np.maximum(phase, 0)], 0.0)
+        else:
+            online_share = np.ones(hours)
+        it_power_kw = group_power_kw.sum(axis=0) * online_share * (1 - schedule.it_efficiency_per_year) ** years_elapsed
+
+        # Cooling overhead shrinks along the PUE trajectory
+        pue = simulate_hourly_pue(cooling_model, climate_data, calendar)
+        pue = 1 + (pue - 1) * (1 - schedule.pue_improvement_per_year) ** years_elapsed
+        power_kw = it_power_kw * pue
+        utilization = facility_utilization(fleet, group_utilization)
+
+        energy_kwh = float(power_kw.sum())
+        peak_kw = float(power_kw.max())
+        # PUE and utilization are undefined while nothing is running
+        online = online_share > 0
+        online_steps = int(online.sum())
+        servers_online = int(phase_servers[phase[-1]]) if len(phase_hours) and phase[-1] >= 0 else \
+            (0 if len(phase_hours) else total_servers)
+        monthly.append({
+            'month': str(chunk_start.astype('datetime64[M]')),
+            'start': str(chunk_start.astype('datetime64[D]')),
+            'energy_mwh': energy_kwh / 1000,
+            'peak_mw': peak_kw / 1000,
+            'average_mw': energy_kwh / hours / 1000,
+            'average_pue': float(pue[online].mean()) if online_steps else None,
+            'average_utilization': float(utilization[online].mean()) if online_steps else None,
+            'servers_online': servers_online
+        })
+
+        total_energy_mwh += energy_kwh / 1000
+        year_energy_kwh += energy_kwh
+        year_utilization_sum += float(utilization[online].sum())
+        year_pue_sum += float(pue[online].sum())
+        year_peak_kw = max(year_peak_kw, peak_kw)
+        year_steps += hours
+        year_online_steps += online_steps
+
+        # Close each projection year (12 months from the start month)
+        if month % 12 == 11:
+            year = month // 12
+            average_kw = year_energy_kwh / year_steps
+            year_grid = replace(
+                grid_info,
+                baseline_demand_mw=grid_info.baseline_demand_mw * (1 + schedule.baseline_growth_per_year) ** year
+            )
+            yearly.append({
+                'year': year + 1,
+                'start': monthly[year * 12]['start'],
+                'energy_mwh': year_energy_kwh / 1000,
+                'peak_mw': year_peak_kw / 1000,
+                'average_mw': average_kw / 1000,
+                'average_pue': year_pue_sum / year_online_steps if year_online_steps else None,
+                'average_utilization': year_utilization_sum / year_online_steps if year_online_steps else None,
+                'servers_online': servers_online,
+                'baseline_demand_mw': year_grid.baseline_demand_mw,
+                'community_impact': grid_calculator.calculate_grid_impact_from_stats(
+                    year_peak_kw / 1000, average_kw / 1000, year_grid
+                )
+            })
+            year_energy_kwh = year_utilization_sum = year_pue_sum = year_peak_kw = 0.0
+            year_steps = year_online_steps = 0
+
+        if progress_callback:
+            progress_callback({
+                'months_completed': month + 1,
+                'percent_complete': (month + 1) / (years * 12) * 100,
+                'current_peak_mw': peak_kw / 1000,
+                'servers_online': servers_online
+            })
+
+    return ProjectionResult(
+        seed=seed,
+        start_date=start_date,
+        years=years,
+        total_energy_mwh=total_energy_mwh,
+        planning_peak_kw=max(year['peak_mw'] for year in yearly) * 1000,
+        yearly=yearly,
+        monthly=monthly
+    )
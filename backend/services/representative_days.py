@@ -0,0 +1,431 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .simulate import (
+    CLIMATE_FIELDS,
+    ClimateData,
+    CoolingEfficiencyModel,
+    DataCenterSpecs,
+    GridImpactCalculator,
+    GridInfo,
+    PowerSimulationResult,
+    ServerPowerModel,
+    SimulationCalendar,
+    WorkloadSimulator,
+    build_calendar,
+    facility_utilization,
+    fleet_breakdown,
+    new_simulation_seed,
+    peak_utilization_quantiles,
+    simulate_fleet_it_power,
+    simulate_hourly_pue,
+    steps_per_hour
+)
+
+DEFAULT_REPRESENTATIVE_DAYS = 12
+# Months whose workload seasonal_factor applies (WorkloadSimulator.base_utilization)
+SEASONAL_MONTHS = (11, 12, 1)
+
+
+@dataclass(eq=False)
+class RepresentativeDays:
+    # Days simulated in place of a whole run, and the medoid standing in for every day
+    medoids: np.ndarray      # Day index of each representative day
+    day_medoid: np.ndarray   # For every day of the run, index into medoids
+    weights: np.ndarray      # Number of days each medoid represents
+    steps_per_day: int
+
+    @property
+    def steps(self) -> np.ndarray:
+        # Step indices of the representative days within the run
+        return (self.medoids[:, None] * self.steps_per_day + np.arange(self.steps_per_day)).ravel()
+
+
+def _day_blocks(values: np.ndarray, steps_per_day: int) -> np.ndarray:
+    # (days x steps_per_day) view of a per-step series covering whole days
+    return np.asarray(values).reshape(-1, steps_per_day)
+
+
+def day_features(calendar: SimulationCalendar, climate_data: ClimateData, steps_per_day: int) -> np.ndarray:
+    """Per-day clustering features: time of year (cyclic) and, for hourly climate, mean/max temperature and humidity"""
+    hour_of_year = _day_blocks(calendar.hour_of_year, steps_per_day).mean(axis=1)
+    angle = 2 * np.pi * hour_of_year / 8760
+    features = [np.cos(angle), np.sin(angle)]
+    if climate_data.is_hourly:
+        hourly = climate_data.at_hours(calendar.hour_of_year)
+        dry_bulb = _day_blocks(np.broadcast_to(hourly.dry_bulb_temp, len(calendar)), steps_per_day)
+        humidity = _day_blocks(np.broadcast_to(hourly.humidity, len(calendar)), steps_per_day)
+        for feature in (dry_bulb.mean(axis=1), dry_bulb.max(axis=1), humidity.mean(axis=1)):
+            spread = feature.std()
+            features.append((feature - feature.mean()) / spread if spread > 0 else np.zeros_like(feature))
+    return np.column_stack(features)
+
+
+PAIRWISE_CHUNK_ELEMENTS = 1 << 22  # Bound on the (rows x days x features) difference block
+
+
+def _pairwise_distance(features: np.ndarray) -> np.ndarray:
+    # Euclidean distance between every pair of rows, built a block of rows at a time
+    # so the difference tensor never exceeds PAIRWISE_CHUNK_ELEMENTS
+    count = len(features)
+    distance = np.empty((count, count))
+    chunk = max(1, PAIRWISE_CHUNK_ELEMENTS // max(count * features.shape[1], 1))
+    for start in range(0, count, chunk):
+        block = features[start:start + chunk, None, :] - features[None, :, :]
+        distance[start:start + chunk] = np.sqrt((block ** 2).sum(axis=2))
+    return distance
+
+
+def _k_medoids(features: np.ndarray, k: int, rng: np.random.Generator,
+               iterations: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+    # Voronoi-iteration k-medoids with k-medoids++ seeding; returns medoid row indices
+    # and the cluster of every row
+    distance = _pairwise_distance(features)
+    medoids = [int(rng.integers(len(features)))]
+    while len(medoids) < k:
+        nearest = distance[:, medoids].min(axis=1) ** 2
+        if nearest.sum() == 0:
+            break
+        medoids.append(int(rng.choice(len(features), p=nearest / nearest.sum())))
+    medoids = np.array(medoids)
+
+    for _ in range(iterations):
+        labels = distance[:, medoids].argmin(axis=1)
+        updated = medoids.copy()
+        for cluster in range(len(medoids)):
+            members = np.flatnonzero(labels == cluster)
+            updated[cluster] = members[distance[np.ix_(members, members)].sum(axis=1).argmin()]
+        if np.array_equal(updated, medoids):
+            break
+        medoids = updated
+    return medoids, distance[:, medoids].argmin(axis=1)
+
+
+def select_representative_days(
+    calendar: SimulationCalendar,
+    climate_data: ClimateData,
+    days: int = DEFAULT_REPRESENTATIVE_DAYS,
+    seed: int = 0,
+    steps_per_day: int = 24
+) -> RepresentativeDays:
+    """
+    Cluster the run's days with k-medoids on day_features. Days are first
+    stratified by weekday/weekend and seasonal month, the inputs that move
+    expected utilization, so a medoid never stands in for a day with a
+    different workload level; the days budget is split across strata by size.
+    """
+    weekend = _day_blocks(calendar.day_of_week >= 5, steps_per_day).mean(axis=1) >= 0.5
+    seasonal = _day_blocks(np.isin(calendar.month, SEASONAL_MONTHS), steps_per_day).mean(axis=1) >= 0.5
+    stratum_of_day = weekend * 2 + seasonal
+    strata = [np.flatnonzero(stratum_of_day == stratum) for stratum in range(4)]
+    strata = [members for members in strata if len(members)]
+
+    # Largest-remainder allocation of the budget, at least one medoid per stratum
+    total_days = len(stratum_of_day)
+    days = min(max(days, len(strata)), total_days)
+    share = np.array([len(members) for members in strata]) * (days - len(strata)) / total_days
+    allocation = 1 + np.floor(share).astype(int)
+    allocation[np.argsort(share - np.floor(share))[::-1][:days - allocation.sum()]] += 1
+    allocation = np.minimum(allocation, [len(members) for members in strata])
+
+    features = day_features(calendar, climate_data, steps_per_day)
+    rng = np.random.default_rng(seed)
+    medoids: List[int] = []
+    day_medoid = np.empty(total_days, dtype=np.intp)
+    for members, k in zip(strata, allocation):
+        local, labels = _k_medoids(features[members], int(k), rng)
+        day_medoid[members] = len(medoids) + labels
+        medoids.extend(members[local].tolist())
+
+    return RepresentativeDays(
+        medoids=np.array(medoids, dtype=np.intp),
+        day_medoid=day_medoid,
+        weights=np.bincount(day_medoid, minlength=len(medoids)),
+        steps_per_day=steps_per_day
+    )
+
+
+def _climate_key(climate_data: ClimateData) -> Optional[str]:
+    # Hourly climates key the day selection and the PUE cached with it; snapshot
+    # climates don't affect the selection and their PUE is a single value
+    if not climate_data.is_hourly:
+        return None
+    digest = hashlib.sha256()
+    for name in CLIMATE_FIELDS:
+        digest.update(np.asarray(getattr(climate_data, name), dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+@dataclass(eq=False)
+class _PueAggregates:
+    # Hourly-climate PUE over the run, reduced onto the sample steps it is paired with
+    series: np.ndarray  # PUE at every step of the run
+    sums: np.ndarray    # Per sample step, sum of PUE over the run steps it stands in for
+    maxima: np.ndarray  # Per sample step, highest PUE among those run steps
+
+
+@dataclass(eq=False)
+class _RunPlan:
+    # Everything about a representative-days run that doesn't depend on the facility or seed
+    calendar: SimulationCalendar         # Whole days covering the run
+    selection: RepresentativeDays
+    sample_calendar: SimulationCalendar  # The representative days' steps
+    rebuild: np.ndarray                  # Sample step standing in for every step of the run
+    step_weights: np.ndarray             # Run steps each sample step stands in for
+    peak_utilization: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    pue: Dict[str, _PueAggregates] = field(default_factory=dict)  # Hourly climate, per cooling type
+
+
+_plan_cache: "OrderedDict[Tuple, _RunPlan]" = OrderedDict()
+PLAN_CACHE_SIZE = 32
+
+def _run_plan(start_date: datetime, simulation_hours: int, step_minutes: int, days: int,
+              climate_data: ClimateData) -> _RunPlan:
+    # Calendar, day selection and rebuild index, cached so batch studies over many
+    # configurations on the same calendar and climate only cluster once
+    key = (start_date, simulation_hours, step_minutes, days, _climate_key(climate_data))
+    plan = _plan_cache.get(key)
+    if plan is not None:
+        _plan_cache.move_to_end(key)
+        return plan
+
+    steps_per_day = 24 * steps_per_hour(step_minutes)
+    calendar = build_calendar(start_date, -(-simulation_hours // 24) * 24, step_minutes)
+    selection = select_representative_days(calendar, climate_data, days, steps_per_day=steps_per_day)
+    steps = selection.steps
+    rebuild = (selection.day_medoid[:, None] * steps_per_day + np.arange(steps_per_day)).ravel()
+    rebuild = rebuild[:simulation_hours * steps_per_hour(step_minutes)]
+    plan = _RunPlan(
+        calendar=calendar,
+        selection=selection,
+        sample_calendar=SimulationCalendar(
+            hour_of_day=calendar.hour_of_day[steps],
+            day_of_week=calendar.day_of_week[steps],
+            month=calendar.month[steps],
+            hour_of_year=calendar.hour_of_year[steps],
+            month_index=calendar.month_index[steps]
+        ),
+        rebuild=rebuild,
+        step_weights=np.bincount(rebuild, minlength=len(steps)).astype(float)
+    )
+    _plan_cache[key] = plan
+    if len(_plan_cache) > PLAN_CACHE_SIZE:
+        _plan_cache.popitem(last=False)
+    return plan
+
+
+def _peak_correction(datacenter_specs: DataCenterSpecs, plan: _RunPlan, start_date: datetime,
+                     simulation_hours: int, step_minutes: int) -> float:
+    # The representative days draw far fewer steps than the run, so their largest
+    # step sits lower in the utilization distribution. Scale by the ratio of the
+    # median run peak to the median peak over the drawn steps only (from the
+    # analytic peak distribution), weighted by each group's nameplate power.
+    full = sampled = 0.0
+    for group in datacenter_specs.fleet_groups():
+        if group.datacenter_type not in plan.peak_utilization:
+            plan.peak_utilization[group.datacenter_type] = (
+                float(peak_utilization_quantiles(
+                    group.datacenter_type, start_date, simulation_hours, step_minutes
+                )[1]),
+                float(peak_utilization_quantiles(
+                    group.datacenter_type, start_date, len(plan.calendar) // steps_per_hour(step_minutes),
+                    step_minutes, plan.selection.steps
+                )[1])
+            )
+        full_utilization, sampled_utilization = plan.peak_utilization[group.datacenter_type]
+        curve = ServerPowerModel(group.server_type)
+        nameplate_kw = group.count * group.max_power_per_server / 1000
+        full += nameplate_kw * float(curve.power_ratio(full_utilization))
+        sampled += nameplate_kw * float(curve.power_ratio(sampled_utilization))
+    return full / sampled if sampled > 0 else 1.0
+
+
+def _pue_aggregates(plan: _RunPlan, cooling_model: CoolingEfficiencyModel,
+                    climate_data: ClimateData) -> _PueAggregates:
+    # Computed once per cooling type; the plan is already specific to the climate
+    aggregates = plan.pue.get(cooling_model.cooling_type)
+    if aggregates is None:
+        run_steps = len(plan.rebuild)
+        series = simulate_hourly_pue(cooling_model, climate_data, plan.calendar)[:run_steps]
+        maxima = np.full(len(plan.step_weights), -np.inf)
+        np.maximum.at(maxima, plan.rebuild, series)
+        aggregates = _PueAggregates(
+            series=series,
+            sums=np.bincount(plan.rebuild, weights=series, minlength=len(plan.step_weights)),
+            maxima=maxima
+        )
+        plan.pue[cooling_model.cooling_type] = aggregates
+    return aggregates
+
+
+@dataclass(eq=False)
+class RepresentativeDaysResult:
+    """
+    A representative-days run kept as its simulated days and their weights.
+
+    Energy, averages, peaks and the fleet breakdown are computed from the
+    representative steps times the number of run steps each stands in for,
+    so they cost O(representative steps) once the day selection is cached.
+    to_simulation_result() rebuilds the full-length series on first call,
+    for callers that cost or plot every hour.
+    """
+    day_power_kw: np.ndarray   # Representative days x steps per day, at the mean PUE of the steps each stands in for
+    step_weights: np.ndarray   # Run steps each representative step stands in for (day_power_kw order)
+    day_weights: np.ndarray    # Days each representative day stands in for
+    peak_power_kw: float       # Largest step of the rebuilt run
+    corrected_peak_kw: float   # Peak scaled to the full run's number of draws (used for grid impact)
+    average_power_kw: float
+    annual_consumption_mwh: float
+    average_utilization: float
+    average_pue: float
+    community_impact: Dict
+    fleet_breakdown: List[Dict]
+    seed: int
+    start_date: datetime
+    step_minutes: int
+    _plan: _RunPlan
+    _group_it_power_kw: np.ndarray   # Groups x representative steps
+    _utilization: np.ndarray         # Per representative step
+    _pue: object                     # Snapshot PUE (float) or _PueAggregates
+    _dtype: object
+
+    def to_simulation_result(self) -> PowerSimulationResult:
+        """The run as a PowerSimulationResult with every step rebuilt (cached)"""
+        result = self.__dict__.get("_simulation_result")
+        if result is None:
+            rebuild = self._plan.rebuild
+            pue = self._pue.series if isinstance(self._pue, _PueAggregates) else np.full(len(rebuild), self._pue)
+            power_kw = self._group_it_power_kw.sum(axis=0)[rebuild] * pue
+            result = PowerSimulationResult(
+                hourly_power_kw=power_kw.astype(self._dtype, copy=False),
+                hourly_utilization=self._utilization[rebuild].astype(self._dtype, copy=False),
+                hourly_pue=pue.astype(self._dtype, copy=False),
+                peak_power_kw=self.peak_power_kw,
+                average_power_kw=self.average_power_kw,
+                annual_consumption_mwh=self.annual_consumption_mwh,
+                community_impact=self.community_impact,
+                seed=self.seed,
+                start_date=self.start_date,
+                step_minutes=self.step_minutes,
+                fleet_breakdown=self.fleet_breakdown,
+                corrected_peak_kw=self.corrected_peak_kw,
+                group_it_power_kw=self._group_it_power_kw[:, rebuild].astype(self._dtype, copy=False)
+            )
+            self.__dict__["_simulation_result"] = result
+        return result
+
+
+def simulate_representative_days(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    simulation_hours: int = 8760,
+    representative_days: int = DEFAULT_REPRESENTATIVE_DAYS,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    resolution_minutes: int = 60,
+    dtype = None
+) -> RepresentativeDaysResult:
+    """
+    Approximate run_full_simulation by simulating only representative days.
+
+    Every day of the run is represented by its medoid's simulated profile;
+    energy and averages are the day-weighted sums and peak_power_kw is the
+    largest step of that rebuilt run (exact, from the highest PUE each
+    representative step is paired with). corrected_peak_kw additionally
+    scales the peak for the smaller number of draws and is what the grid
+    impact uses. See REFERENCES.md for the measured error and speed-up.
+    """
+    if dtype is None:
+        dtype = np.float64 if resolution_minutes == 60 else np.float32
+    if seed is None:
+        seed = new_simulation_seed()
+    if start_date is None:
+        start_date = datetime.now()
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+    plan = _run_plan(start_date, simulation_hours, resolution_minutes, representative_days, climate_data)
+    run_steps = len(plan.rebuild)
+    weights = plan.step_weights
+    used = weights > 0  # A trailing partial day leaves some representative steps unused
+
+    # Simulate the representative days only
+    fleet = datacenter_specs.fleet_groups()
+    workload_sim = WorkloadSimulator(rng=np.random.default_rng(seed))
+    cooling_model = CoolingEfficiencyModel(cooling_type=datacenter_specs.cooling_type)
+    group_power_kw, group_utilization = simulate_fleet_it_power(fleet, workload_sim, plan.sample_calendar)
+    it_power_kw = group_power_kw.sum(axis=0)
+    utilization = facility_utilization(fleet, group_utilization)
+
+    # PUE keeps its own hours: per representative step, the PUE summed and maximised
+    # over the run steps it stands in for
+    if climate_data.is_hourly:
+        pue = _pue_aggregates(plan, cooling_model, climate_data)
+        pue_sums, pue_maxima = pue.sums, pue.maxima
+    else:
+        pue = cooling_model.calculate_pue(climate_data)
+        pue_sums, pue_maxima = weights * pue, np.full(len(weights), pue)
+
+    step_hours = 1 / steps_per_hour(resolution_minutes)
+    energy_kwh = float(it_power_kw @ pue_sums) * step_hours
+    average_power_kw = energy_kwh / (run_steps * step_hours)
+    peak_power_kw = float((it_power_kw * pue_maxima)[used].max())
+    corrected_peak_kw = peak_power_kw * _peak_correction(
+        datacenter_specs, plan, start_date, simulation_hours, resolution_minutes
+    )
+    mean_pue = np.divide(pue_sums, weights, out=np.zeros(len(weights)), where=used)
+
+    return RepresentativeDaysResult(
+        day_power_kw=(it_power_kw * mean_pue).reshape(-1, plan.selection.steps_per_day),
+        step_weights=weights,
+        day_weights=plan.selection.weights,
+        peak_power_kw=peak_power_kw,
+        corrected_peak_kw=corrected_peak_kw,
+        average_power_kw=average_power_kw,
+        annual_consumption_mwh=energy_kwh / 1000,
+        average_utilization=float(utilization @ weights) / run_steps,
+        average_pue=float(pue_sums.sum()) / run_steps,
+        community_impact=GridImpactCalculator().calculate_grid_impact_from_stats(
+            corrected_peak_kw / 1000, average_power_kw / 1000, grid_info
+        ),
+        fleet_breakdown=fleet_breakdown(
+            # Group totals weight each representative step by the steps it stands in for
+            fleet, group_power_kw @ weights, group_utilization @ weights,
+            np.where(used, group_power_kw, -np.inf).max(axis=1), run_steps, resolution_minutes
+        ),
+        seed=seed,
+        start_date=start_date,
+        step_minutes=resolution_minutes,
+        _plan=plan,
+        _group_it_power_kw=group_power_kw,
+        _utilization=utilization,
+        _pue=pue,
+        _dtype=dtype
+    )
+
+
+def run_representative_simulation(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    simulation_hours: int = 8760,
+    representative_days: int = DEFAULT_REPRESENTATIVE_DAYS,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    resolution_minutes: int = 60,
+    dtype = None
+) -> PowerSimulationResult:
+    """
+    simulate_representative_days with the full-length series rebuilt, for
+    callers that need every step (tariff cost, hourly carbon, charts). Those
+    series make it O(hours); use simulate_representative_days directly when
+    the statistics are enough.
+    """
+    return simulate_representative_days(
+        datacenter_specs, climate_data, grid_info, simulation_hours, representative_days,
+        seed, start_date, resolution_minutes, dtype
+    ).to_simulation_result()
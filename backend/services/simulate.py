@@ -1,31 +1,96 @@
 import numpy as np
-import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime, timedelta
-import random
-from scipy.stats import norm, poisson
-from scipy import interpolate
+from functools import cached_property, lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional, Union
+from datetime import datetime, timedelta, timezone
+from scipy import interpolate, special
 
 
+CLIMATE_FIELDS = ("dry_bulb_temp", "wet_bulb_temp", "humidity", "wind_speed", "solar_irradiance")
+
+# Step lengths that divide an hour evenly (60 = the original hourly model)
+RESOLUTION_MINUTES = (5, 10, 15, 20, 30, 60)
+
+# Views available from PowerSimulationResult.downsample (hours per bucket)
+DOWNSAMPLE_VIEWS = {"hourly": 1, "daily": 24, "weekly": 168}
+
+# Mean size (% utilization) of a workload spike, drawn from a Poisson distribution
+SPIKE_POISSON_MEAN = 15
+
 @dataclass
 class ClimateData:
-    # Climate data for cooling calculations
-    dry_bulb_temp: float  # °F
-    wet_bulb_temp: float  # °F
-    humidity: float       # %
-    wind_speed: float     # mph
-    solar_irradiance: float = 0  # W/m²
+    # Climate data for cooling calculations. Each field is either a single
+    # snapshot value or an hourly series indexed by hour of year (e.g. a
+    # typical-meteorological-year file); series shorter than the run wrap around.
+    dry_bulb_temp: Union[float, np.ndarray]  # °F
+    wet_bulb_temp: Union[float, np.ndarray]  # °F
+    humidity: Union[float, np.ndarray]       # %
+    wind_speed: Union[float, np.ndarray]     # mph
+    solar_irradiance: Union[float, np.ndarray] = 0  # W/m²
+
+    def __post_init__(self):
+        lengths = set()
+        for name in CLIMATE_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, (list, tuple, np.ndarray)):
+                value = np.asarray(value, dtype=float)
+                setattr(self, name, value)
+                lengths.add(len(value))
+        if len(lengths) > 1:
+            raise ValueError(f"Hourly climate series must share one length, got {sorted(lengths)}")
+
+    @property
+    def is_hourly(self) -> bool:
+        return any(isinstance(getattr(self, name), np.ndarray) for name in CLIMATE_FIELDS)
+
+    def at_hours(self, hour_of_year: np.ndarray) -> "ClimateData":
+        # Values for each requested hour of the year; snapshot fields stay scalar
+        selected = {}
+        for name in CLIMATE_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, np.ndarray):
+                value = value[np.asarray(hour_of_year) % len(value)]
+            selected[name] = value
+        return ClimateData(**selected)
+
+@dataclass
+class FleetGroup:
+    # One homogeneous group of servers within a mixed fleet
+    server_type: str
+    datacenter_type: str
+    count: int
+    max_power_per_server: float  # Watts
+    name: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return self.name or f"{self.server_type}/{self.datacenter_type}"
 
 @dataclass
 class DataCenterSpecs:
-    # Data center specifications
+    # Data center specifications. With a fleet, server_count and
+    # max_power_per_server describe the facility as a whole and each group
+    # is simulated with its own power curve and workload pattern.
     server_count: int
     max_power_per_server: float  # Watts
     facility_size_sqft: float
     cooling_type: str = "air_cooled"
     server_type: str = "enterprise"
     datacenter_type: str = "enterprise"
+    fleet: Optional[List[FleetGroup]] = None
+
+    def __post_init__(self):
+        # Accept plain dicts (e.g. from a JSON request) as fleet entries
+        if self.fleet:
+            self.fleet = [g if isinstance(g, FleetGroup) else FleetGroup(**g) for g in self.fleet]
+
+    def fleet_groups(self) -> List[FleetGroup]:
+        # Single-type specs behave as a one-group fleet
+        if self.fleet:
+            return self.fleet
+        return [FleetGroup(self.server_type, self.datacenter_type, self.server_count, self.max_power_per_server)]
 
 @dataclass
 class GridInfo:
@@ -36,90 +101,310 @@ class GridInfo:
     average_household_bill: float = 120.0  # Monthly average
 
 @dataclass
+class SimulationCalendar:
+    # Step-by-step calendar for a simulation run, stored as parallel arrays
+    # (one entry per hour, or per sub-hourly step at finer resolutions)
+    hour_of_day: np.ndarray  # 0-23
+    day_of_week: np.ndarray  # 0=Monday ... 6=Sunday
+    month: np.ndarray        # 1-12
+    hour_of_year: np.ndarray # Hours since Jan 1 00:00 (index into hourly climate series)
+    month_index: np.ndarray  # Calendar months since the first simulated month (billing periods)
+
+    def __len__(self) -> int:
+        return len(self.hour_of_day)
+
+@dataclass
+class SeriesSummary:
+    # Summary statistics of one hourly series
+    mean: float
+    min: float
+    max: float
+    p50: float
+    p95: float
+    p99: float
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "SeriesSummary":
+        # Min, max and percentiles come from a single multi-kth partition
+        minimum, p50, p95, p99, maximum = np.percentile(values, (0, 50, 95, 99, 100))
+        return cls(
+            mean=float(values.mean(dtype=np.float64)),
+            min=float(minimum), max=float(maximum),
+            p50=float(p50), p95=float(p95), p99=float(p99)
+        )
+
+@dataclass
+class SimulationSummary:
+    power_kw: SeriesSummary
+    utilization: SeriesSummary
+    pue: SeriesSummary
+    load_factor: float  # Average power / peak power
+    max_ramp_kw_per_min: float = 0.0  # Largest step-to-step power change
+
+@dataclass(eq=False)
 class PowerSimulationResult:
-    # Results from power simulation
-    hourly_power_kw: List[float]
-    hourly_utilization: List[float]
-    hourly_pue: List[float]
+    # Results from power simulation. Hourly series are contiguous float arrays
+    # (float64, or float32 when requested) rather than Python lists. At sub-hourly
+    # resolution the "hourly" series hold one value per step_minutes step.
+    hourly_power_kw: np.ndarray
+    hourly_utilization: np.ndarray
+    hourly_pue: np.ndarray
     peak_power_kw: float
     average_power_kw: float
     annual_consumption_mwh: float
     community_impact: Dict
+    seed: Optional[int] = None             # Seed that reproduces this run
+    start_date: Optional[datetime] = None  # First simulated hour
+    step_minutes: int = 60                 # Length of one series step
+    fleet_breakdown: Optional[List[Dict]] = None  # Per-group IT power and utilization
+    corrected_peak_kw: Optional[float] = None     # Representative days: peak scaled to the full run's draws
+    group_it_power_kw: Optional[np.ndarray] = None  # Per-group IT power (groups x steps), fleet_breakdown order
 
+    def __post_init__(self):
+        # Accept lists from older callers; keep arrays in their given dtype
+        for name in ("hourly_power_kw", "hourly_utilization", "hourly_pue"):
+            values = getattr(self, name)
+            dtype = values.dtype if isinstance(values, np.ndarray) and values.dtype.kind == "f" else np.float64
+            setattr(self, name, np.ascontiguousarray(values, dtype=dtype))
 
+    @cached_property
+    def summary(self) -> SimulationSummary:
+        # Computed once on first access and reused by every consumer
+        power = SeriesSummary.from_array(self.hourly_power_kw)
+        return SimulationSummary(
+            power_kw=power,
+            utilization=SeriesSummary.from_array(self.hourly_utilization),
+            pue=SeriesSummary.from_array(self.hourly_pue),
+            load_factor=power.mean / power.max if power.max > 0 else 0.0,
+            max_ramp_kw_per_min=self.max_ramp_kw_per_min
+        )
 
-class ServerPowerModel:
-    
-    def __init__(self, server_type: str = "enterprise"):
-        # Real power curves from SPEC benchmarks and industry data
-        # All curves follow SPECpower_ssj2008 standard with 11 data points (every 10%)
-        # 
-        # Available server types:
-        #   - enterprise: Traditional x86 servers (Intel Xeon, AMD EPYC)
-        #   - gpu_compute: Legacy GPU servers (older generation)
-        #   - cpu_intensive: HPC/scientific computing servers
-        #   - tpu_v4: Google TPU v4/v5 (AI/ML optimized)
-        #   - nvidia_h100: Modern NVIDIA H100/A100 (AI training)
-        #   - inference_accelerator: AI inference-optimized accelerators
-        #   - arm_server: ARM-based cloud servers (AWS Graviton, Ampere Altra)
-        self.power_curves = {
-            # Traditional x86 enterprise servers (Intel Xeon, AMD EPYC)
-            "enterprise": {
-                "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                "power_ratio": [0.58, 0.64, 0.69, 0.75, 0.80, 0.85, 0.89, 0.94, 0.96, 0.98, 1.0]
-            },
-            # Legacy GPU compute servers (older generation GPUs)
-            "gpu_compute": {
-                "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                "power_ratio": [0.45, 0.52, 0.61, 0.72, 0.78, 0.84, 0.88, 0.92, 0.95, 0.98, 1.0]
-            },
-            # CPU-intensive compute servers (HPC, scientific computing)
-            "cpu_intensive": {
-                "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                "power_ratio": [0.55, 0.62, 0.68, 0.76, 0.81, 0.87, 0.91, 0.95, 0.97, 0.99, 1.0]
-            },
-            # Google TPU v4/v5 (AI/ML optimized, 175-250W per chip)
-            "tpu_v4": {
-                "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                "power_ratio": [0.35, 0.42, 0.51, 0.62, 0.68, 0.75, 0.81, 0.87, 0.91, 0.95, 1.0]
-            },
-            # Modern NVIDIA H100/A100 GPUs for AI training (700W TDP)
-            "nvidia_h100": {
-                "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                "power_ratio": [0.40, 0.48, 0.58, 0.70, 0.76, 0.82, 0.86, 0.90, 0.94, 0.97, 1.0]
-            },
-            # AI inference accelerators (optimized for low-latency inference)
-            "inference_accelerator": {
-                "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                "power_ratio": [0.30, 0.38, 0.48, 0.60, 0.66, 0.73, 0.79, 0.85, 0.89, 0.94, 1.0]
-            },
-            # ARM-based servers (AWS Graviton, Ampere Altra)
-            "arm_server": {
-                "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                "power_ratio": [0.48, 0.55, 0.62, 0.70, 0.75, 0.81, 0.85, 0.90, 0.93, 0.96, 1.0]
+    @property
+    def steps_per_hour(self) -> int:
+        return 60 // self.step_minutes
+
+    @property
+    def step_hours(self) -> float:
+        return self.step_minutes / 60
+
+    @property
+    def max_ramp_kw_per_min(self) -> float:
+        if len(self.hourly_power_kw) < 2:
+            return 0.0
+        ramps = np.diff(self.hourly_power_kw.astype(np.float64, copy=False))
+        return float(np.abs(ramps).max()) / self.step_minutes
+
+    def sample(self, every_hours: int = 24) -> Dict[str, List[float]]:
+        # Downsampled series for JSON payloads (every Nth hour)
+        stride = every_hours * self.steps_per_hour
+        return {
+            'hours': list(range(0, len(self.hourly_power_kw) // self.steps_per_hour, every_hours)),
+            'power_kw': self.hourly_power_kw[::stride].tolist(),
+            'utilization': self.hourly_utilization[::stride].tolist(),
+            'pue': self.hourly_pue[::stride].tolist()
+        }
+
+    def downsample(self, view: str = "daily") -> Dict[str, Dict[str, np.ndarray]]:
+        # Min/max/mean of each series per hourly, daily or weekly bucket
+        if view not in DOWNSAMPLE_VIEWS:
+            raise ValueError(f"Unknown view '{view}', expected one of {sorted(DOWNSAMPLE_VIEWS)}")
+        period = DOWNSAMPLE_VIEWS[view] * self.steps_per_hour
+        steps = len(self.hourly_power_kw)
+        starts = np.arange(0, steps, period)
+        counts = np.diff(np.append(starts, steps))
+
+        def reduce(values: np.ndarray) -> Dict[str, np.ndarray]:
+            return {
+                'mean': np.add.reduceat(values, starts, dtype=np.float64) / counts,
+                'min': np.minimum.reduceat(values, starts),
+                'max': np.maximum.reduceat(values, starts)
             }
+
+        return {
+            'power_kw': reduce(self.hourly_power_kw),
+            'utilization': reduce(self.hourly_utilization),
+            'pue': reduce(self.hourly_pue)
         }
-        
-        self.server_type = server_type
-        
-        # Create interpolation function for smooth power curves
-        curve = self.power_curves.get(server_type, self.power_curves["enterprise"])
-        self.power_interpolator = interpolate.interp1d(
+
+@dataclass
+class EnsembleSimulationResult:
+    # Percentile bands over N independent realizations of the same configuration
+    ensemble_size: int
+    seed: int
+    start_date: datetime
+    bands: Dict[str, Dict[str, float]]       # metric -> {"p50", "p90", "p99", "mean"}
+    stability_risk_distribution: Dict[str, float]  # risk level -> share of members
+    step_minutes: int = 60                   # Resolution every member was simulated at
+
+@dataclass
+class AnalyticEstimate:
+    # Expected values of a full simulation computed from the workload distributions, without sampling
+    simulation_hours: int
+    step_minutes: int
+    expected_annual_mwh: float
+    annual_mwh_error: float             # 3-sigma spread of a seeded run's energy around the expectation
+    expected_average_power_kw: float
+    expected_utilization: float
+    expected_pue: float
+    approximate_peak_kw: float          # Median of the simulated peak
+    peak_kw_range: Tuple[float, float]  # 5th-95th percentile of the simulated peak
+    community_impact: Dict
+
+    def to_dict(self) -> Dict:
+        return {
+            'simulation_hours': self.simulation_hours,
+            'resolution_minutes': self.step_minutes,
+            'expected_annual_mwh': self.expected_annual_mwh,
+            'annual_mwh_error': self.annual_mwh_error,
+            'expected_average_power_kw': self.expected_average_power_kw,
+            'expected_utilization': self.expected_utilization,
+            'expected_pue': self.expected_pue,
+            'approximate_peak_kw': self.approximate_peak_kw,
+            'peak_kw_range': list(self.peak_kw_range),
+            'community_impact': self.community_impact
+        }
+
+
+
+# Real power curves from SPEC benchmarks and industry data
+# All curves follow SPECpower_ssj2008 standard with 11 data points (every 10%)
+# 
+# Available server types:
+#   - enterprise: Traditional x86 servers (Intel Xeon, AMD EPYC)
+#   - gpu_compute: Legacy GPU servers (older generation)
+#   - cpu_intensive: HPC/scientific computing servers
+#   - tpu_v4: Google TPU v4/v5 (AI/ML optimized)
+#   - nvidia_h100: Modern NVIDIA H100/A100 (AI training)
+#   - inference_accelerator: AI inference-optimized accelerators
+#   - arm_server: ARM-based cloud servers (AWS Graviton, Ampere Altra)
+SERVER_POWER_CURVES = {
+    # Traditional x86 enterprise servers (Intel Xeon, AMD EPYC)
+    "enterprise": {
+        "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+        "power_ratio": [0.58, 0.64, 0.69, 0.75, 0.80, 0.85, 0.89, 0.94, 0.96, 0.98, 1.0]
+    },
+    # Legacy GPU compute servers (older generation GPUs)
+    "gpu_compute": {
+        "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+        "power_ratio": [0.45, 0.52, 0.61, 0.72, 0.78, 0.84, 0.88, 0.92, 0.95, 0.98, 1.0]
+    },
+    # CPU-intensive compute servers (HPC, scientific computing)
+    "cpu_intensive": {
+        "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+        "power_ratio": [0.55, 0.62, 0.68, 0.76, 0.81, 0.87, 0.91, 0.95, 0.97, 0.99, 1.0]
+    },
+    # Google TPU v4/v5 (AI/ML optimized, 175-250W per chip)
+    "tpu_v4": {
+        "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+        "power_ratio": [0.35, 0.42, 0.51, 0.62, 0.68, 0.75, 0.81, 0.87, 0.91, 0.95, 1.0]
+    },
+    # Modern NVIDIA H100/A100 GPUs for AI training (700W TDP)
+    "nvidia_h100": {
+        "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+        "power_ratio": [0.40, 0.48, 0.58, 0.70, 0.76, 0.82, 0.86, 0.90, 0.94, 0.97, 1.0]
+    },
+    # AI inference accelerators (optimized for low-latency inference)
+    "inference_accelerator": {
+        "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+        "power_ratio": [0.30, 0.38, 0.48, 0.60, 0.66, 0.73, 0.79, 0.85, 0.89, 0.94, 1.0]
+    },
+    # ARM-based servers (AWS Graviton, Ampere Altra)
+    "arm_server": {
+        "utilization": [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+        "power_ratio": [0.48, 0.55, 0.62, 0.70, 0.75, 0.81, 0.85, 0.90, 0.93, 0.96, 1.0]
+    }
+}
+
+# Dense power-ratio lookup tables shared by every ServerPowerModel instance.
+# Each table samples the cubic SPEC curve at 0.01% utilization steps and is
+# built once per server type on first use, then kept read-only.
+POWER_CURVE_RESOLUTION = 0.01  # % utilization per table step
+_POWER_CURVE_GRID = np.linspace(0, 100, int(round(100 / POWER_CURVE_RESOLUTION)) + 1)
+_POWER_CURVE_GRID.flags.writeable = False
+_POWER_CURVE_TABLES: Dict[str, np.ndarray] = {}
+
+def get_power_curve_table(server_type: str) -> np.ndarray:
+    # Return the shared lookup table for server_type (unknown types use enterprise)
+    if server_type not in SERVER_POWER_CURVES:
+        server_type = "enterprise"
+    table = _POWER_CURVE_TABLES.get(server_type)
+    if table is None:
+        curve = SERVER_POWER_CURVES[server_type]
+        interpolator = interpolate.interp1d(
             curve["utilization"], 
             curve["power_ratio"], 
-            kind='cubic',
-            bounds_error=False,
-            fill_value=(curve["power_ratio"][0], curve["power_ratio"][-1])
+            kind='cubic'
         )
+        table = interpolator(_POWER_CURVE_GRID)
+        table.flags.writeable = False
+        table = _POWER_CURVE_TABLES.setdefault(server_type, table)
+    return table
+
+
+def power_curve_index(utilization_percent) -> np.ndarray:
+    # Nearest table step for a utilization (scalar or array); out-of-range values
+    # clamp to the 0% / 100% ends instead of indexing past or wrapping around the table
+    index = np.rint(np.asarray(utilization_percent) / POWER_CURVE_RESOLUTION).astype(np.intp)
+    return np.clip(index, 0, len(_POWER_CURVE_GRID) - 1)
+
+
+def get_fleet_power_tables(server_types: List[str]) -> np.ndarray:
+    # (groups x table) stack of the shared lookup tables, one row per group
+    return np.stack([get_power_curve_table(server_type) for server_type in server_types])
+
+def simulate_fleet_it_power(
+    fleet: List[FleetGroup],
+    workload_sim: "WorkloadSimulator",
+    calendar: SimulationCalendar,
+    realizations: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    # IT power (kW) and utilization per fleet group as (groups x steps) matrices,
+    # or (realizations x groups x steps) for ensembles. All groups are evaluated in
+    # one pass: one utilization draw and one gather from the stacked curve tables.
+    utilization = workload_sim.simulate_fleet_utilization(
+        calendar.hour_of_day, calendar.day_of_week,
+        [group.datacenter_type for group in fleet], calendar.month, realizations=realizations
+    )
+    tables = get_fleet_power_tables([group.server_type for group in fleet])
+    index = power_curve_index(utilization)
+    index += (np.arange(len(fleet)) * tables.shape[1])[:, None]
+    power_ratio = tables.ravel()[index]
+    
+    max_power_w = np.array([[group.max_power_per_server] for group in fleet], dtype=float)
+    server_count = np.array([[group.count] for group in fleet], dtype=float)
+    return max_power_w * power_ratio * server_count / 1000, utilization
+
+def facility_utilization(fleet: List[FleetGroup], group_utilization: np.ndarray) -> np.ndarray:
+    """Server-count weighted mean utilization across fleet groups"""
+    if len(fleet) == 1:
+        return group_utilization[..., 0, :]
+    weights = np.array([group.count for group in fleet], dtype=float)
+    return np.einsum("...gh,g->...h", group_utilization, weights / weights.sum())
+
+class ServerPowerModel:
+    
+    def __init__(self, server_type: str = "enterprise"):
+        # Real power curves from SPEC benchmarks (see SERVER_POWER_CURVES)
+        self.power_curves = SERVER_POWER_CURVES
+        self.server_type = server_type
+        
+        # Shared precomputed table replaces a per-instance scipy interpolator
+        self.power_table = get_power_curve_table(server_type)
+    
+    def power_ratio(self, utilization_percent):
+        # Fraction of max power drawn at the given utilization (0-100, scalar or array;
+        # values outside the range clamp to its ends). Nearest-step indexing into the
+        # dense table avoids np.interp's binary search.
+        return self.power_table[power_curve_index(utilization_percent)]
     
     def get_power_consumption(self, max_power_w: float, utilization_percent: float) -> float:
 
         utilization_clamped = np.clip(utilization_percent, 0, 100)
-        power_ratio = self.power_interpolator(utilization_clamped)
+        power_ratio = self.power_ratio(utilization_clamped)
         return max_power_w * power_ratio
     
     def get_server_efficiency_rating(self, utilization_percent: float) -> str:
-        power_ratio = self.power_interpolator(np.clip(utilization_percent, 0, 100))
+        power_ratio = self.power_ratio(np.clip(utilization_percent, 0, 100))
         
         if power_ratio < 0.65:
             return "excellent", round(float(power_ratio), 2)
@@ -132,7 +417,14 @@ class ServerPowerModel:
 
 class WorkloadSimulator:
     
-    def __init__(self):
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        # All stochastic draws go through this generator so a seeded run is reproducible
+        self.rng = rng if rng is not None else np.random.default_rng()
+        
+        # Batched draws use one child stream each for the normal noise, spike
+        # selection and spike size, so chunked and one-shot runs see the same values
+        self._noise_rng, self._spike_rng, self._spike_size_rng = self.rng.spawn(3)
+        
         # Define workload patterns based on real data center types
         self.patterns = {
             "enterprise": {
@@ -193,14 +485,81 @@ class WorkloadSimulator:
         
         # Add random variance (normal distribution)
         variance = pattern["daily_variance"]
-        utilization = norm.rvs(base_util, variance/3)  # 3-sigma rule
+        utilization = self.rng.normal(base_util, variance/3)  # 3-sigma rule
         
         # Add occasional spikes
-        if random.random() < pattern["spike_frequency"]:
-            spike_intensity = poisson.rvs(15)  # Random spike
+        if self.rng.random() < pattern["spike_frequency"]:
+            spike_intensity = self.rng.poisson(SPIKE_POISSON_MEAN)  # Random spike
             utilization += spike_intensity
         
         return np.clip(utilization, 5, 98)  # Realistic bounds
+
+    def base_utilization(self, hours: np.ndarray, days_of_week: np.ndarray,
+                         datacenter_type: str = "enterprise", months: np.ndarray = None) -> np.ndarray:
+        # Deterministic part of simulate_utilization evaluated over whole calendar arrays
+        pattern = self.patterns.get(datacenter_type, self.patterns["enterprise"])
+        hours = np.asarray(hours)
+        days_of_week = np.asarray(days_of_week)
+        months = np.full(hours.shape, 6) if months is None else np.asarray(months)
+
+        base_util = np.full(hours.shape, float(pattern["base_utilization"]))
+
+        # Weekend adjustment
+        base_util[days_of_week >= 5] *= pattern["weekend_reduction"]
+
+        # Peak hour adjustment (peak window wins over the off-hours window)
+        if pattern["peak_hours"]:
+            peak_start, peak_end = pattern["peak_hours"]
+            in_peak = (hours >= peak_start) & (hours <= peak_end)
+            off_hours = ~in_peak & ((hours < 6) | (hours > 22))
+            base_util[in_peak] *= 1.3
+            base_util[off_hours] *= 0.7
+
+        # Seasonal adjustment (Nov, Dec, Jan)
+        base_util[np.isin(months, (11, 12, 1))] *= pattern["seasonal_factor"]
+
+        return base_util
+
+    def simulate_utilization_batch(self, hours: np.ndarray, days_of_week: np.ndarray,
+                                   datacenter_type: str = "enterprise", months: np.ndarray = None,
+                                   realizations: Optional[int] = None) -> np.ndarray:
+        # Vectorized simulate_utilization: all normal and Poisson noise drawn in one call each.
+        # With realizations=N the result is an (N x hours) matrix of independent draws.
+        pattern = self.patterns.get(datacenter_type, self.patterns["enterprise"])
+        base_util = self.base_utilization(hours, days_of_week, datacenter_type, months)
+        size = base_util.shape if realizations is None else (realizations,) + base_util.shape
+
+        utilization = self._noise_rng.normal(base_util, pattern["daily_variance"] / 3, size=size)
+
+        # Poisson spike magnitudes are only drawn for the hours that actually spike
+        spikes = self._spike_rng.random(size) < pattern["spike_frequency"]
+        utilization[spikes] += self._spike_size_rng.poisson(SPIKE_POISSON_MEAN, size=int(spikes.sum()))
+
+        return np.clip(utilization, 5, 98)
+
+    def simulate_fleet_utilization(self, hours: np.ndarray, days_of_week: np.ndarray,
+                                   datacenter_types: List[str], months: np.ndarray = None,
+                                   realizations: Optional[int] = None) -> np.ndarray:
+        # simulate_utilization_batch for a whole fleet: a (groups x hours) matrix, one row per
+        # group's workload pattern, with each kind of noise still drawn in one call.
+        # Draws are laid out hour-major so chunked runs stay chunk-size invariant, and a
+        # one-group fleet consumes the streams exactly like simulate_utilization_batch.
+        patterns = [self.patterns.get(t, self.patterns["enterprise"]) for t in datacenter_types]
+        columns = {}
+        for datacenter_type in datacenter_types:
+            if datacenter_type not in columns:
+                columns[datacenter_type] = self.base_utilization(hours, days_of_week, datacenter_type, months)
+        base_util = np.stack([columns[t] for t in datacenter_types], axis=-1)  # hours x groups
+        size = base_util.shape if realizations is None else (realizations,) + base_util.shape
+
+        noise_scale = np.array([p["daily_variance"] / 3 for p in patterns])
+        spike_frequency = np.array([p["spike_frequency"] for p in patterns])
+
+        utilization = self._noise_rng.normal(base_util, noise_scale, size=size)
+        spikes = self._spike_rng.random(size) < spike_frequency
+        utilization[spikes] += self._spike_size_rng.poisson(SPIKE_POISSON_MEAN, size=int(spikes.sum()))
+
+        return np.ascontiguousarray(np.swapaxes(np.clip(utilization, 5, 98), -1, -2))
     
     def generate_daily_profile(self, datacenter_type: str = "enterprise", day_of_week: int = 1, month: int = 6) -> List[float]:
         return [
@@ -247,6 +606,14 @@ class CoolingEfficiencyModel:
             }
         }
         
+        # Water usage factors (gallons per kWh of cooling)
+        self.water_factors = {
+            "air_cooled": 0.2,      # Minimal water use
+            "water_cooled": 1.8,    # Traditional cooling towers
+            "evaporative": 1.0,     # Evaporative cooling
+            "liquid_cooling": 0.3   # Direct liquid cooling
+        }
+        
         self.cooling_type = cooling_type
     
     def calculate_pue(self, climate: ClimateData) -> float:
@@ -278,6 +645,26 @@ class CoolingEfficiencyModel:
         # Ensure PUE stays within realistic bounds
         return max(1.02, min(config["max_pue"], pue))
     
+    def calculate_pue_array(self, climate: ClimateData) -> np.ndarray:
+        # calculate_pue evaluated over hourly climate arrays in one pass
+        config = self.cooling_configs.get(self.cooling_type, 
+                                         self.cooling_configs["air_cooled"])
+        dry_bulb = np.asarray(climate.dry_bulb_temp, dtype=float)
+        humidity = np.asarray(climate.humidity, dtype=float)
+        wind_speed = np.asarray(climate.wind_speed, dtype=float)
+        
+        pue = config["base_pue"] + np.maximum(0, dry_bulb - config["optimal_temp"]) * config["temp_sensitivity"]
+        pue = pue + np.maximum(0, humidity - 45) * config["humidity_factor"]
+        pue = pue - np.where(
+            wind_speed > 5, np.minimum(0.1, (wind_speed - 5) * config["wind_benefit"]), 0
+        )
+        
+        if self.cooling_type == "evaporative":
+            wet_bulb = np.asarray(climate.wet_bulb_temp, dtype=float)
+            pue = pue + np.maximum(0, wet_bulb - 65) * 0.01
+        
+        return np.clip(pue, 1.02, config["max_pue"])
+    
     def get_cooling_efficiency_rating(self, pue: float) -> str:
         """Get efficiency rating for PUE value"""
         if pue < 1.2:
@@ -291,15 +678,7 @@ class CoolingEfficiencyModel:
     
     def calculate_water_usage(self, it_power_kw: float, climate: ClimateData) -> float:
   
-        # Water usage factors (gallons per kWh of cooling)
-        water_factors = {
-            "air_cooled": 0.2,      # Minimal water use
-            "water_cooled": 1.8,    # Traditional cooling towers
-            "evaporative": 1.0,     # Evaporative cooling
-            "liquid_cooling": 0.3   # Direct liquid cooling
-        }
-        
-        factor = water_factors.get(self.cooling_type, 0.2)
+        factor = self.water_factors.get(self.cooling_type, 0.2)
         
         # Calculate cooling load
         pue = self.calculate_pue(climate)
@@ -309,6 +688,13 @@ class CoolingEfficiencyModel:
         temp_multiplier = 1 + max(0, (climate.dry_bulb_temp - 70) * 0.02)
         
         return cooling_power_kw * factor * temp_multiplier
+    
+    def calculate_water_usage_array(self, it_power_kw: np.ndarray, climate: ClimateData) -> np.ndarray:
+        # calculate_water_usage over hourly IT power and climate arrays (gallons per hour)
+        factor = self.water_factors.get(self.cooling_type, 0.2)
+        cooling_power_kw = np.asarray(it_power_kw, dtype=float) * (self.calculate_pue_array(climate) - 1)
+        temp_multiplier = 1 + np.maximum(0, (np.asarray(climate.dry_bulb_temp, dtype=float) - 70) * 0.02)
+        return cooling_power_kw * factor * temp_multiplier
 
 class GridImpactCalculator:
     
@@ -418,10 +804,17 @@ class GridImpactCalculator:
                              grid_info: GridInfo) -> Dict:
 
         # Convert to MW for grid calculations
-        datacenter_power_mw = [power / 1000 for power in datacenter_power_profile]
+        datacenter_power_mw = np.asarray(datacenter_power_profile, dtype=float) / 1000
         
-        # Calculate peak impact
-        datacenter_peak_mw = max(datacenter_power_mw)
+        return self.calculate_grid_impact_from_stats(
+            float(datacenter_power_mw.max()), float(datacenter_power_mw.mean()), grid_info
+        )
+    
+    def calculate_grid_impact_from_stats(self, datacenter_peak_mw: float, datacenter_average_mw: float,
+                                         grid_info: GridInfo) -> Dict:
+        # Grid impact only depends on the profile's peak and mean, so callers that
+        # already have those (ensembles, batched runs) can skip the hourly profile
+
         baseline_peak_mw = grid_info.baseline_demand_mw
         
         # Safeguard against division by zero
@@ -433,7 +826,7 @@ class GridImpactCalculator:
         
         # Grid impact percentages
         peak_impact_percent = (datacenter_peak_mw / baseline_peak_mw) * 100
-        average_impact_percent = (np.mean(datacenter_power_mw) / baseline_peak_mw) * 100
+        average_impact_percent = (datacenter_average_mw / baseline_peak_mw) * 100
         
         # Grid stability assessment
         stability_risk = self._assess_stability_risk(peak_impact_percent)
@@ -546,80 +939,629 @@ class GridImpactCalculator:
             return "critical"
 
 
-def run_full_simulation(
+def steps_per_hour(resolution_minutes: int) -> int:
+    """Number of simulation steps per hour for a supported resolution"""
+    if resolution_minutes not in RESOLUTION_MINUTES:
+        raise ValueError(f"resolution_minutes must be one of {RESOLUTION_MINUTES}, got {resolution_minutes}")
+    return 60 // resolution_minutes
+
+def build_calendar(start_date: datetime, simulation_hours: int, step_minutes: int = 60) -> SimulationCalendar:
+    # Calendar arrays equivalent to stepping start_date forward one step at a time
+    start = np.datetime64(start_date.replace(minute=0, second=0, microsecond=0), 'm')
+    timestamps = start + np.arange(simulation_hours * steps_per_hour(step_minutes)) * step_minutes
+    hours = timestamps.astype('datetime64[h]')
+    days = timestamps.astype('datetime64[D]')
+    months = timestamps.astype('datetime64[M]').astype(np.int64)
+
+    return SimulationCalendar(
+        hour_of_day=(hours - days).astype(np.int64),
+        day_of_week=(days.astype(np.int64) + 3) % 7,  # 1970-01-01 was a Thursday
+        month=months % 12 + 1,
+        hour_of_year=(hours - timestamps.astype('datetime64[Y]')).astype(np.int64),
+        month_index=months - months[0] if len(months) else months
+    )
+
+def simulate_hourly_pue(cooling_model: "CoolingEfficiencyModel", climate_data: ClimateData,
+                        calendar: SimulationCalendar) -> np.ndarray:
+    # Snapshot climate gives one PUE for every hour; hourly series give seasonal PUE
+    if climate_data.is_hourly:
+        return cooling_model.calculate_pue_array(climate_data.at_hours(calendar.hour_of_year))
+    return np.full(len(calendar), cooling_model.calculate_pue(climate_data))
+
+def naive_utc(value) -> datetime:
+    """Datetime or ISO 8601 string as naive UTC; aware values are converted, not truncated"""
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def new_simulation_seed() -> int:
+    """Draw a fresh 32-bit seed from OS entropy (JSON-safe for the frontend)"""
+    return int(np.random.SeedSequence().generate_state(1)[0])
+
+@dataclass(eq=False)
+class SimulationChunk:
+    # One slice of a chunked simulation plus O(1) running aggregates for the run so far
+    start_hour: int
+    hourly_power_kw: np.ndarray
+    hourly_utilization: np.ndarray
+    hourly_pue: np.ndarray
+    hours_completed: int
+    simulation_hours: int
+    power_sum_kw: float
+    utilization_sum: float
+    pue_sum: float
+    peak_power_kw: float
+    seed: int
+    start_date: datetime
+    step_minutes: int = 60
+    # Running per-group aggregates (one entry per fleet group)
+    fleet: Optional[List[FleetGroup]] = None
+    group_power_sum_kw: Optional[np.ndarray] = None
+    group_utilization_sum: Optional[np.ndarray] = None
+    group_peak_power_kw: Optional[np.ndarray] = None
+    # Per-group IT power for this slice (groups x steps)
+    group_it_power_kw: Optional[np.ndarray] = None
+
+    @property
+    def percent_complete(self) -> float:
+        return self.hours_completed / self.simulation_hours * 100
+
+    @property
+    def steps_completed(self) -> int:
+        return self.hours_completed * 60 // self.step_minutes
+
+    @property
+    def energy_kwh(self) -> float:
+        return self.power_sum_kw * self.step_minutes / 60
+
+    @property
+    def average_power_kw(self) -> float:
+        return self.power_sum_kw / self.steps_completed
+
+    @property
+    def average_utilization(self) -> float:
+        return self.utilization_sum / self.steps_completed
+
+    @property
+    def average_pue(self) -> float:
+        return self.pue_sum / self.steps_completed
+
+def iter_simulation_chunks(
     datacenter_specs: DataCenterSpecs,
     climate_data: ClimateData,
-    grid_info: GridInfo,
-    simulation_hours: int = 8760,  # 1 year
-    progress_callback = None
-) -> PowerSimulationResult:
-  
+    simulation_hours: int = 8760,
+    chunk_hours: int = 24,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    dtype = np.float64,
+    resolution_minutes: int = 60
+) -> Iterator[SimulationChunk]:
+    # Simulate in vectorized chunks of chunk_hours. Noise streams are consumed in
+    # step order, so a seeded run produces the same profile for any chunk size.
+    # Sub-hourly steps draw their own noise and spikes, which is what exposes
+    # intra-hour ramps and 15-minute demand peaks.
+    
+    # Same specs, climate, hours, seed and start date give identical output
+    if seed is None:
+        seed = new_simulation_seed()
+    if start_date is None:
+        start_date = datetime.now()
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+    chunk_hours = max(1, int(chunk_hours))
+    steps_per_hour(resolution_minutes)  # Validate before any work
+    if simulation_hours < 1:
+        raise ValueError("simulation_hours must be at least 1")
+    
     # Initialize models
-    server_model = ServerPowerModel(server_type=datacenter_specs.server_type)
-    workload_sim = WorkloadSimulator()
+    fleet = datacenter_specs.fleet_groups()
+    workload_sim = WorkloadSimulator(rng=np.random.default_rng(seed))
     cooling_model = CoolingEfficiencyModel(cooling_type=datacenter_specs.cooling_type)
-    grid_calculator = GridImpactCalculator()
     
-    # Simulate hourly data
-    hourly_power_kw = []
-    hourly_utilization = []
-    hourly_pue = []
+    power_sum_kw = utilization_sum = pue_sum = 0.0
+    peak_power_kw = -np.inf
+    group_power_sum_kw = np.zeros(len(fleet))
+    group_utilization_sum = np.zeros(len(fleet))
+    group_peak_power_kw = np.full(len(fleet), -np.inf)
     
-    start_date = datetime.now()
-    
-    for hour in range(simulation_hours):
-        current_time = start_date + timedelta(hours=hour)
-        day_of_week = current_time.weekday()
-        month = current_time.month
-        hour_of_day = current_time.hour
+    for chunk_start in range(0, simulation_hours, chunk_hours):
+        hours = min(chunk_hours, simulation_hours - chunk_start)
         
-        # Get utilization for this hour
-        utilization = workload_sim.simulate_utilization(
-            hour_of_day, day_of_week, datacenter_specs.datacenter_type, month
-        )
+        # Hour/weekday/month calendar for every step of this chunk
+        calendar = build_calendar(start_date + timedelta(hours=chunk_start), hours, resolution_minutes)
         
-        # Calculate power consumption (optimized - calculate once, multiply by server count)
-        power_per_server_w = server_model.get_power_consumption(
-            datacenter_specs.max_power_per_server, utilization
-        )
-        total_power_w = power_per_server_w * datacenter_specs.server_count
+        # Utilization and IT power for every group and step (groups x steps, one batched
+        # draw for all noise and one gather from the per-group power curve tables)
+        group_power_kw, group_utilization = simulate_fleet_it_power(fleet, workload_sim, calendar)
+        utilization = facility_utilization(fleet, group_utilization)
         
-        # Calculate PUE (cooling efficiency)
-        pue = cooling_model.calculate_pue(climate_data)
+        # PUE for every step (computed once per chunk when the climate is a snapshot)
+        pue = simulate_hourly_pue(cooling_model, climate_data, calendar)
         
         # Total power including cooling
-        total_power_kw = (total_power_w / 1000) * pue
+        total_power_kw = group_power_kw.sum(axis=0) * pue
         
-        hourly_power_kw.append(total_power_kw)
-        hourly_utilization.append(utilization)
-        hourly_pue.append(pue)
-
+        power_sum_kw += float(total_power_kw.sum())
+        utilization_sum += float(utilization.sum())
+        pue_sum += float(pue.sum())
+        peak_power_kw = max(peak_power_kw, float(total_power_kw.max()))
+        group_power_sum_kw += group_power_kw.sum(axis=1)
+        group_utilization_sum += group_utilization.sum(axis=1)
+        group_peak_power_kw = np.maximum(group_peak_power_kw, group_power_kw.max(axis=1))
+        
+        yield SimulationChunk(
+            start_hour=chunk_start,
+            hourly_power_kw=total_power_kw.astype(dtype, copy=False),
+            hourly_utilization=utilization.astype(dtype, copy=False),
+            hourly_pue=pue.astype(dtype, copy=False),
+            hours_completed=chunk_start + hours,
+            simulation_hours=simulation_hours,
+            power_sum_kw=power_sum_kw,
+            utilization_sum=utilization_sum,
+            pue_sum=pue_sum,
+            peak_power_kw=peak_power_kw,
+            seed=seed,
+            start_date=start_date,
+            step_minutes=resolution_minutes,
+            fleet=fleet,
+            group_power_sum_kw=group_power_sum_kw.copy(),
+            group_utilization_sum=group_utilization_sum.copy(),
+            group_peak_power_kw=group_peak_power_kw.copy(),
+            group_it_power_kw=group_power_kw.astype(dtype, copy=False)
+        )
 
-        if progress_callback and (hour + 1) % 24 == 0:
-            progress_callback({
-                'hours_completed': hour + 1,
-                'percent_complete': ((hour + 1) / simulation_hours) * 100,
-                'current_avg_power_kw': float(np.mean(hourly_power_kw)),
-                'current_avg_utilization': float(np.mean(hourly_utilization)),
-                'current_avg_pue': float(np.mean(hourly_pue))
-            })
+def fleet_breakdown(
+    fleet: List[FleetGroup],
+    group_power_sum_kw: np.ndarray,
+    group_utilization_sum: np.ndarray,
+    group_peak_power_kw: np.ndarray,
+    steps: int,
+    step_minutes: int = 60
+) -> List[Dict]:
+    # Per-group IT power, energy and utilization from per-group running sums
+    group_energy_mwh = group_power_sum_kw * (step_minutes / 60) / 1000
+    total_energy_mwh = group_energy_mwh.sum()
+    return [
+        {
+            'name': group.label,
+            'server_type': group.server_type,
+            'datacenter_type': group.datacenter_type,
+            'count': group.count,
+            'max_power_per_server': group.max_power_per_server,
+            'peak_it_power_kw': float(group_peak_power_kw[i]),
+            'average_it_power_kw': float(group_power_sum_kw[i] / steps),
+            'average_utilization': float(group_utilization_sum[i] / steps),
+            'it_energy_mwh': float(group_energy_mwh[i]),
+            'share_of_it_energy': float(group_energy_mwh[i] / total_energy_mwh) if total_energy_mwh > 0 else 0.0
+        }
+        for i, group in enumerate(fleet)
+    ]
 
+def assemble_simulation_result(chunks: List[SimulationChunk], grid_info: GridInfo) -> PowerSimulationResult:
+    # Join the chunks of one run into a PowerSimulationResult and compute grid impact
+    if not chunks:
+        raise ValueError("No simulation chunks to assemble")
+    last = chunks[-1]
+    peak_power_kw = last.peak_power_kw
+    average_power_kw = last.average_power_kw
     
     # Calculate grid impact
-    community_impact = grid_calculator.calculate_grid_impact(
-        hourly_power_kw, grid_info
+    community_impact = GridImpactCalculator().calculate_grid_impact_from_stats(
+        peak_power_kw / 1000, average_power_kw / 1000, grid_info
     )
     
+    def join(name):
+        parts = [getattr(chunk, name) for chunk in chunks]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=-1)
+    
     # Compile results
     return PowerSimulationResult(
-        hourly_power_kw=hourly_power_kw,
-        hourly_utilization=hourly_utilization,
-        hourly_pue=hourly_pue,
-        peak_power_kw=max(hourly_power_kw),
-        average_power_kw=np.mean(hourly_power_kw),
-        annual_consumption_mwh=sum(hourly_power_kw) / 1000,
-        community_impact=community_impact
+        hourly_power_kw=join("hourly_power_kw"),
+        hourly_utilization=join("hourly_utilization"),
+        hourly_pue=join("hourly_pue"),
+        peak_power_kw=peak_power_kw,
+        average_power_kw=average_power_kw,
+        annual_consumption_mwh=last.energy_kwh / 1000,
+        community_impact=community_impact,
+        seed=last.seed,
+        start_date=last.start_date,
+        step_minutes=last.step_minutes,
+        fleet_breakdown=fleet_breakdown(
+            last.fleet, last.group_power_sum_kw, last.group_utilization_sum,
+            last.group_peak_power_kw, last.steps_completed, last.step_minutes
+        ) if last.fleet else None,
+        group_it_power_kw=join("group_it_power_kw") if last.group_it_power_kw is not None else None
+    )
+
+def run_full_simulation(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    simulation_hours: int = 8760,  # 1 year
+    progress_callback = None,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    dtype = None,  # Storage dtype of the series (default float64 hourly, float32 sub-hourly)
+    resolution_minutes: int = 60  # 15 -> 35,040 steps per year, 5 -> 105,120
+) -> PowerSimulationResult:
+    
+    if dtype is None:
+        dtype = np.float64 if resolution_minutes == 60 else np.float32
+    
+    # One vectorized pass, or day-sized chunks when reporting progress
+    chunks = []
+    for chunk in iter_simulation_chunks(
+        datacenter_specs, climate_data, simulation_hours,
+        chunk_hours=24 if progress_callback else simulation_hours,
+        seed=seed, start_date=start_date, dtype=dtype,
+        resolution_minutes=resolution_minutes
+    ):
+        chunks.append(chunk)
+        if progress_callback:
+            progress_callback({
+                'hours_completed': chunk.hours_completed,
+                'percent_complete': chunk.percent_complete,
+                'current_avg_power_kw': chunk.average_power_kw,
+                'current_avg_utilization': chunk.average_utilization,
+                'current_avg_pue': chunk.average_pue
+            })
+    
+    return assemble_simulation_result(chunks, grid_info)
+
+def simulate_sites(
+    datacenter_specs: DataCenterSpecs,
+    sites: List[Tuple[ClimateData, GridInfo]],
+    simulation_hours: int = 8760,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    dtype = np.float64
+) -> List[PowerSimulationResult]:
+    # Evaluate one facility at many candidate sites. The calendar, utilization draw
+    # and IT power are computed once; PUE and total power are (sites x hours)
+    # arrays. With the same seed each site matches run_full_simulation for that site.
+    if seed is None:
+        seed = new_simulation_seed()
+    if start_date is None:
+        start_date = datetime.now()
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+    if not sites:
+        return []
+    
+    # Shared across sites
+    fleet = datacenter_specs.fleet_groups()
+    workload_sim = WorkloadSimulator(rng=np.random.default_rng(seed))
+    cooling_model = CoolingEfficiencyModel(cooling_type=datacenter_specs.cooling_type)
+    calendar = build_calendar(start_date, simulation_hours)
+    group_power_kw, group_utilization = simulate_fleet_it_power(fleet, workload_sim, calendar)
+    utilization = facility_utilization(fleet, group_utilization)
+    it_power_kw = group_power_kw.sum(axis=0)
+    breakdown = fleet_breakdown(
+        fleet, group_power_kw.sum(axis=1), group_utilization.sum(axis=1),
+        group_power_kw.max(axis=1), simulation_hours
     )
+    
+    # Site-specific PUE as one array evaluation: (sites x 1) for snapshot
+    # climates, (sites x hours) once any site has an hourly series
+    climates = [climate for climate, _ in sites]
+    width = simulation_hours if any(c.is_hourly for c in climates) else 1
+    columns = {}
+    for name in CLIMATE_FIELDS:
+        columns[name] = np.empty((len(sites), width))
+        for row, climate in enumerate(climates):
+            value = getattr(climate, name)
+            if isinstance(value, np.ndarray):
+                value = value[calendar.hour_of_year % len(value)]
+            columns[name][row] = value
+    pue = cooling_model.calculate_pue_array(ClimateData(**columns))
+    pue = np.broadcast_to(pue, (len(sites), simulation_hours))
+    
+    total_power_kw = it_power_kw * pue
+    peak_power_kw = total_power_kw.max(axis=1)
+    average_power_kw = total_power_kw.mean(axis=1)
+    
+    grid_calculator = GridImpactCalculator()
+    hourly_utilization = utilization.astype(dtype, copy=False)
+    group_it_power_kw = group_power_kw.astype(dtype, copy=False)
+    results = []
+    for row, (_, grid_info) in enumerate(sites):
+        results.append(PowerSimulationResult(
+            hourly_power_kw=total_power_kw[row].astype(dtype, copy=False),
+            hourly_utilization=hourly_utilization,
+            hourly_pue=pue[row].astype(dtype),
+            peak_power_kw=float(peak_power_kw[row]),
+            average_power_kw=float(average_power_kw[row]),
+            annual_consumption_mwh=float(average_power_kw[row]) * simulation_hours / 1000,
+            community_impact=grid_calculator.calculate_grid_impact_from_stats(
+                peak_power_kw[row] / 1000, average_power_kw[row] / 1000, grid_info
+            ),
+            seed=seed,
+            start_date=start_date,
+            fleet_breakdown=breakdown,
+            group_it_power_kw=group_it_power_kw
+        ))
+    return results
+
+# Realizations per worker task. Fixed so a seeded ensemble gives the same bands
+# whether it runs serially or across the process pool.
+ENSEMBLE_CHUNK_SIZE = 64
+ENSEMBLE_PERCENTILES = (50, 90, 99)
+# Ensembles smaller than this run in-process; pool start-up would dominate
+ENSEMBLE_PARALLEL_THRESHOLD = 256
+
+_simulation_pool: Optional[ProcessPoolExecutor] = None
+
+def get_simulation_pool() -> ProcessPoolExecutor:
+    # One long-lived pool per process shared by ensembles and sweeps, created on first use
+    global _simulation_pool
+    if _simulation_pool is None:
+        _simulation_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _simulation_pool
+
+def _simulate_ensemble_chunk(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    simulation_hours: int,
+    start_date: datetime,
+    seed_sequence: np.random.SeedSequence,
+    realizations: int,
+    resolution_minutes: int = 60
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Simulate `realizations` members as one (members x hours) array computation.
+    # Returns per-member peak kW, average kW, energy MWh and mean PUE.
+    workload_sim = WorkloadSimulator(rng=np.random.default_rng(seed_sequence))
+    cooling_model = CoolingEfficiencyModel(cooling_type=datacenter_specs.cooling_type)
+    
+    calendar = build_calendar(start_date, simulation_hours, resolution_minutes)
+    group_power_kw, _ = simulate_fleet_it_power(
+        datacenter_specs.fleet_groups(), workload_sim, calendar, realizations=realizations
+    )
+    it_power_kw = group_power_kw.sum(axis=1)
+    pue = simulate_hourly_pue(cooling_model, climate_data, calendar)
+    total_power_kw = it_power_kw * pue
+    
+    return (
+        total_power_kw.max(axis=1),
+        total_power_kw.mean(axis=1),
+        total_power_kw.sum(axis=1) * (resolution_minutes / 60) / 1000,
+        np.full(realizations, pue.mean())
+    )
+
+def run_ensemble_simulation(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    ensemble_size: int = 200,
+    simulation_hours: int = 8760,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    parallel: Optional[bool] = None,
+    resolution_minutes: int = 60  # Match the deterministic run so bands and series agree
+) -> EnsembleSimulationResult:
+    
+    if ensemble_size < 1:
+        raise ValueError("ensemble_size must be at least 1")
+    steps_per_hour(resolution_minutes)  # Validate before any work
+    if seed is None:
+        seed = new_simulation_seed()
+    if start_date is None:
+        start_date = datetime.now()
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+    
+    # Split the ensemble into fixed-size chunks, each with its own child seed
+    chunk_sizes = [ENSEMBLE_CHUNK_SIZE] * (ensemble_size // ENSEMBLE_CHUNK_SIZE)
+    if ensemble_size % ENSEMBLE_CHUNK_SIZE:
+        chunk_sizes.append(ensemble_size % ENSEMBLE_CHUNK_SIZE)
+    child_seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    chunk_args = [
+        (datacenter_specs, climate_data, simulation_hours, start_date, child, size, resolution_minutes)
+        for child, size in zip(child_seeds, chunk_sizes)
+    ]
+    
+    if parallel is None:
+        parallel = ensemble_size >= ENSEMBLE_PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1
+    if parallel and len(chunk_args) > 1:
+        chunks = list(get_simulation_pool().map(_simulate_ensemble_chunk, *zip(*chunk_args)))
+    else:
+        chunks = [_simulate_ensemble_chunk(*args) for args in chunk_args]
+    
+    peak_kw, average_kw, energy_mwh, mean_pue = (np.concatenate(column) for column in zip(*chunks))
+    
+    # Community impact per member (depends only on each member's peak and mean)
+    grid_calculator = GridImpactCalculator()
+    impacts = [
+        grid_calculator.calculate_grid_impact_from_stats(peak / 1000, average / 1000, grid_info)
+        for peak, average in zip(peak_kw, average_kw)
+    ]
+    
+    metrics = {
+        "peak_power_kw": peak_kw,
+        "average_power_kw": average_kw,
+        "annual_consumption_mwh": energy_mwh,
+        "average_pue": mean_pue,
+        "peak_impact_percent": np.array([i["peak_impact_percent"] for i in impacts]),
+        "average_impact_percent": np.array([i["average_impact_percent"] for i in impacts]),
+        "infrastructure_cost_total": np.array([i["infrastructure_cost"]["total"] for i in impacts]),
+        "monthly_cost_per_household": np.array(
+            [i["household_impact"]["monthly_cost_per_household"] for i in impacts]
+        ),
+        "household_bill_increase_percent": np.array(
+            [i["household_impact"]["percentage_increase"] for i in impacts]
+        )
+    }
+    
+    bands = {}
+    for name, values in metrics.items():
+        percentiles = np.percentile(values, ENSEMBLE_PERCENTILES)
+        bands[name] = {f"p{p}": float(v) for p, v in zip(ENSEMBLE_PERCENTILES, percentiles)}
+        bands[name]["mean"] = float(values.mean())
+    
+    risk_levels, risk_counts = np.unique([i["stability_risk"] for i in impacts], return_counts=True)
+    
+    return EnsembleSimulationResult(
+        ensemble_size=ensemble_size,
+        seed=seed,
+        start_date=start_date,
+        bands=bands,
+        stability_risk_distribution={
+            str(level): float(count / ensemble_size) for level, count in zip(risk_levels, risk_counts)
+        },
+        step_minutes=resolution_minutes
+    )
+
+# Analytic estimator. Utilization in every step is clip(N(base, variance/3) + spike, 5, 98)
+# where the spike is 0 or, with the pattern's spike_frequency, Poisson(SPIKE_POISSON_MEAN).
+# The calendar only produces a handful of distinct base levels (weekend x peak window x
+# season), so the distribution of each level is integrated once on a utilization grid and
+# every expectation is a small dot product against the power curve.
+ESTIMATE_BIN_WIDTH = 0.5     # % utilization per integration bin
+ESTIMATE_MAX_SPIKE = 45      # Poisson(15) mass above this is below 1e-9
+ESTIMATE_PEAK_QUANTILES = (0.05, 0.5, 0.95)
+_ESTIMATE_EDGES = np.arange(5, 98 + ESTIMATE_BIN_WIDTH / 2, ESTIMATE_BIN_WIDTH)
+# Utilization points the probabilities refer to: the two clip bounds and every bin midpoint
+_ESTIMATE_POINTS = np.concatenate([[5.0], (_ESTIMATE_EDGES[:-1] + _ESTIMATE_EDGES[1:]) / 2, [98.0]])
+for _array in (_ESTIMATE_EDGES, _ESTIMATE_POINTS):
+    _array.flags.writeable = False
+
+@lru_cache(maxsize=128)
+def _utilization_distribution(datacenter_type: str, start_date: datetime, simulation_hours: int,
+                              step_minutes: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # For one workload pattern over one calendar: the probability of each of
+    # _ESTIMATE_POINTS per distinct base level, the base level of every step, and
+    # the 5th/50th/95th percentile of the run's peak utilization. Cached read-only,
+    # so only the first estimate on a calendar pays.
+    workload_sim = WorkloadSimulator(rng=np.random.default_rng(0))
+    pattern = workload_sim.patterns.get(datacenter_type, workload_sim.patterns["enterprise"])
+    calendar = build_calendar(start_date, simulation_hours, step_minutes)
+    base_util = workload_sim.base_utilization(
+        calendar.hour_of_day, calendar.day_of_week, datacenter_type, calendar.month
+    )
+    levels, level_of_step, steps_per_level = np.unique(base_util, return_inverse=True, return_counts=True)
+
+    # Spike size mixture: no spike, or a Poisson-sized one
+    spike_sizes = np.arange(ESTIMATE_MAX_SPIKE + 1)
+    spike_weights = pattern["spike_frequency"] * special.pdtr(spike_sizes, SPIKE_POISSON_MEAN)
+    spike_weights[1:] -= pattern["spike_frequency"] * special.pdtr(spike_sizes[:-1], SPIKE_POISSON_MEAN)
+    spike_weights[0] += 1 - pattern["spike_frequency"]
+
+    # CDF of the unclipped utilization at every grid edge, per base level (levels x edges)
+    sigma = pattern["daily_variance"] / 3
+    z = (_ESTIMATE_EDGES[None, None, :] - levels[:, None, None] - spike_sizes[None, :, None]) / sigma
+    cdf = np.einsum("lse,s->le", special.ndtr(z), spike_weights)
+
+    # Mass clipped to 5, in each interior bin, and clipped to 98
+    probabilities = np.concatenate([cdf[:, :1], np.diff(cdf, axis=1), 1 - cdf[:, -1:]], axis=1)
+
+    peak_utilization = _peak_utilization(probabilities, steps_per_level)
+
+    for array in (probabilities, level_of_step, steps_per_level, peak_utilization):
+        array.flags.writeable = False
+    return probabilities, level_of_step, steps_per_level, peak_utilization
+
+def _peak_utilization(probabilities: np.ndarray, steps_per_level: np.ndarray) -> np.ndarray:
+    # P(peak <= edge) is the product of every step's CDF; its ESTIMATE_PEAK_QUANTILES
+    # bracket the largest utilization among steps_per_level draws of each base level
+    cdf = np.cumsum(probabilities[:, :-1], axis=1)
+    log_cdf_peak = np.log(np.clip(cdf, 1e-300, None)).T @ steps_per_level
+    peak_edges = np.searchsorted(log_cdf_peak, np.log(ESTIMATE_PEAK_QUANTILES))
+    return np.append(_ESTIMATE_EDGES, 98.0)[peak_edges]
+
+def peak_utilization_quantiles(datacenter_type: str, start_date: datetime, simulation_hours: int,
+                               step_minutes: int = 60, steps: Optional[np.ndarray] = None) -> np.ndarray:
+    """5th/50th/95th percentile of a run's largest utilization step, or of the largest among `steps` only"""
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+    probabilities, level_of_step, steps_per_level, peak_utilization = _utilization_distribution(
+        datacenter_type, start_date, simulation_hours, step_minutes
+    )
+    if steps is None:
+        return peak_utilization
+    return _peak_utilization(probabilities, np.bincount(level_of_step[steps], minlength=len(steps_per_level)))
+
+@lru_cache(maxsize=32)
+def _estimate_power_ratios(server_type: str) -> np.ndarray:
+    # Power ratio at each of _ESTIMATE_POINTS
+    ratios = ServerPowerModel(server_type).power_ratio(_ESTIMATE_POINTS)
+    ratios.flags.writeable = False
+    return ratios
+
+def estimate_annual_power(
+    datacenter_specs: DataCenterSpecs,
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    simulation_hours: int = 8760,
+    start_date: Optional[datetime] = None,
+    resolution_minutes: int = 60
+) -> AnalyticEstimate:
+    """
+    Expected energy, PUE and peak of run_full_simulation without sampling.
+
+    Energy and utilization are exact expectations up to the 0.5% integration
+    grid. annual_mwh_error is three standard deviations of a seeded run's
+    annual energy around that expectation (steps are independent). The peak is
+    the median of the distribution of the run's largest step, with a 5-95%
+    range; fleets with several groups add the per-group peaks (an upper bound)
+    and hourly climate uses the highest PUE of the run.
+    """
+    if start_date is None:
+        start_date = datetime.now()
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+    step_hours = 1 / steps_per_hour(resolution_minutes)
+
+    cooling_model = CoolingEfficiencyModel(cooling_type=datacenter_specs.cooling_type)
+    if climate_data.is_hourly:
+        pue = simulate_hourly_pue(cooling_model, climate_data, build_calendar(start_date, simulation_hours))
+        pue = np.repeat(pue, steps_per_hour(resolution_minutes))
+        peak_pue = float(pue.max())
+    else:
+        pue = peak_pue = cooling_model.calculate_pue(climate_data)
+
+    fleet = datacenter_specs.fleet_groups()
+    total_servers = sum(group.count for group in fleet)
+    energy_kwh = variance_kwh = utilization_sum = 0.0
+    peak_kw = np.zeros(len(ESTIMATE_PEAK_QUANTILES))
+    for group in fleet:
+        probabilities, level_of_step, steps_per_level, peak_utilization = _utilization_distribution(
+            group.datacenter_type, start_date, simulation_hours, resolution_minutes
+        )
+        ratios = _estimate_power_ratios(group.server_type)
+        group_max_kw = group.max_power_per_server * group.count / 1000
+        mean_ratio = probabilities @ ratios
+        variance_ratio = probabilities @ ratios ** 2 - mean_ratio ** 2
+
+        if climate_data.is_hourly:
+            energy_kwh += group_max_kw * step_hours * float(mean_ratio[level_of_step] @ pue)
+            variance_kwh += (group_max_kw * step_hours) ** 2 * float(variance_ratio[level_of_step] @ pue ** 2)
+        else:
+            energy_kwh += group_max_kw * step_hours * pue * float(mean_ratio @ steps_per_level)
+            variance_kwh += (group_max_kw * step_hours * pue) ** 2 * float(variance_ratio @ steps_per_level)
+
+        utilization_sum += group.count * float((probabilities @ _ESTIMATE_POINTS) @ steps_per_level)
+        peak_kw += group_max_kw * peak_pue * ServerPowerModel(group.server_type).power_ratio(peak_utilization)
+
+    steps = simulation_hours * steps_per_hour(resolution_minutes)
+    average_power_kw = energy_kwh / (steps * step_hours)
+    approximate_peak_kw = float(peak_kw[1])
+
+    return AnalyticEstimate(
+        simulation_hours=simulation_hours,
+        step_minutes=resolution_minutes,
+        expected_annual_mwh=energy_kwh / 1000,
+        annual_mwh_error=3 * variance_kwh ** 0.5 / 1000,
+        expected_average_power_kw=average_power_kw,
+        expected_utilization=utilization_sum / (total_servers * steps),
+        expected_pue=float(np.mean(pue)),
+        approximate_peak_kw=approximate_peak_kw,
+        peak_kw_range=(float(peak_kw[0]), float(peak_kw[2])),
+        community_impact=GridImpactCalculator().calculate_grid_impact_from_stats(
+            approximate_peak_kw / 1000, average_power_kw / 1000, grid_info
+        )
+    )
+
+def estimate_wet_bulb(temp_f, humidity):
+    """Estimate wet bulb temperature (simplified formula; scalars or arrays)"""
+    return temp_f * np.arctan(0.151977 * np.sqrt(humidity + 8.313659)) + \
+           np.arctan(temp_f + humidity) - np.arctan(humidity - 1.676331) + \
+           0.00391838 * (humidity ** 1.5) * np.arctan(0.023101 * humidity) - 4.686035
 
 def create_climate_data_from_api(weather_data: dict) -> ClimateData:
     """Convert OpenWeatherMap data to ClimateData"""
@@ -627,9 +1569,7 @@ def create_climate_data_from_api(weather_data: dict) -> ClimateData:
     humidity = weather_data.get('humidity', 50)
     
     # Estimate wet bulb temp (simplified formula)
-    wet_bulb = temp_f * math.atan(0.151977 * math.sqrt(humidity + 8.313659)) + \
-               math.atan(temp_f + humidity) - math.atan(humidity - 1.676331) + \
-               0.00391838 * (humidity ** 1.5) * math.atan(0.023101 * humidity) - 4.686035
+    wet_bulb = float(estimate_wet_bulb(temp_f, humidity))
     
     return ClimateData(
         dry_bulb_temp=temp_f,
@@ -639,13 +1579,51 @@ def create_climate_data_from_api(weather_data: dict) -> ClimateData:
         solar_irradiance=weather_data.get('solar_irradiance', 0)
     )
 
+def load_hourly_climate(path: str) -> ClimateData:
+    """
+    Load an hourly climate series (e.g. a typical meteorological year) from CSV.
+    
+    Columns are named after the ClimateData fields, in the same units (°F, %, mph).
+    dry_bulb_temp and humidity are required; a missing wet_bulb_temp is estimated,
+    wind_speed defaults to 5 mph and solar_irradiance to 0. Row 0 is Jan 1 00:00.
+    """
+    table = np.genfromtxt(path, delimiter=',', names=True, dtype=float)
+    columns = table.dtype.names
+    for required in ("dry_bulb_temp", "humidity"):
+        if required not in columns:
+            raise ValueError(f"{path} is missing required column '{required}'")
+    
+    dry_bulb = table["dry_bulb_temp"]
+    humidity = table["humidity"]
+    return ClimateData(
+        dry_bulb_temp=dry_bulb,
+        wet_bulb_temp=table["wet_bulb_temp"] if "wet_bulb_temp" in columns else estimate_wet_bulb(dry_bulb, humidity),
+        humidity=humidity,
+        wind_speed=table["wind_speed"] if "wind_speed" in columns else np.full(len(dry_bulb), 5.0),
+        solar_irradiance=table["solar_irradiance"] if "solar_irradiance" in columns else np.zeros(len(dry_bulb))
+    )
+
 def create_datacenter_specs_from_config(config: dict) -> DataCenterSpecs:
     """Convert app.py config to DataCenterSpecs"""
-    servers = config.get('servers', 1000)
-    power_mw = config.get('power_mw', 10)
+    # Mixed fleet: facility totals are derived from the groups
+    fleet = [
+        g if isinstance(g, FleetGroup) else FleetGroup(
+            server_type=g.get('server_type', 'enterprise'),
+            datacenter_type=g.get('datacenter_type', 'enterprise'),
+            count=int(g['count']),
+            max_power_per_server=float(g['max_power_per_server']),
+            name=g.get('name')
+        )
+        for g in config.get('fleet') or []
+    ]
+    if fleet:
+        servers = sum(group.count for group in fleet)
+        total_power_w = sum(group.count * group.max_power_per_server for group in fleet)
+    else:
+        servers = config.get('servers', 1000)
+        total_power_w = config.get('power_mw', 10) * 1_000_000
     
     # Calculate max power per server
-    total_power_w = power_mw * 1_000_000
     max_power_per_server = total_power_w / servers if servers > 0 else 500
     
     return DataCenterSpecs(
@@ -654,19 +1632,24 @@ def create_datacenter_specs_from_config(config: dict) -> DataCenterSpecs:
         facility_size_sqft=config.get('square_feet', 50000),
         cooling_type=config.get('cooling_type', 'air_cooled'),
         server_type=config.get('server_type', 'enterprise'),
-        datacenter_type=config.get('datacenter_type', 'enterprise')
+        datacenter_type=config.get('datacenter_type', 'enterprise'),
+        fleet=fleet or None
     )
 
 def create_grid_info_from_location(location_data: dict, region_code: str = "DEFAULT") -> GridInfo:
     """Convert location data to GridInfo"""
     population = location_data.get('population', 100000)
+    # ACS household count when the location came from the bundled table
+    households = location_data.get('households') or 0
     
     # Ensure minimum population to avoid division by zero
     if population < 1000:
         print(f"Warning: Population ({population}) is too low, using default of 100,000")
         population = 100000
+        households = 0
     
-    households = int(population / 2.5)
+    if households <= 0:
+        households = int(population / 2.5)
     
     # Estimate baseline demand (rough: 1-2 kW avg per household)
     baseline_demand_mw = (households * 1.5) / 1000
@@ -0,0 +1,282 @@
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .simulate import (
+    SERVER_POWER_CURVES,
+    ClimateData,
+    CoolingEfficiencyModel,
+    DataCenterSpecs,
+    FleetGroup,
+    GridInfo,
+    WorkloadSimulator,
+    build_calendar,
+    estimate_wet_bulb,
+    run_full_simulation,
+    simulate_fleet_it_power
+)
+
+# Precomputed simulation outputs per kW of nameplate IT power over
+# server_type x datacenter_type x cooling_type x temperature x humidity.
+# The values live in a .npy file (memory-mapped at load) and the axes in a JSON
+# sidecar; regenerate both with services/tools/surrogate_grid.py.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_SURROGATE_PATH = os.path.join(DATA_DIR, "surrogate_grid.npy")
+
+SURROGATE_OUTPUTS = ("annual_mwh_per_kw", "peak_kw_per_kw", "mean_pue")
+SURROGATE_TEMPERATURES = np.arange(-20.0, 120.0 + 1, 5.0)  # °F; cooling set points fall on the grid
+SURROGATE_HUMIDITIES = np.arange(0.0, 100.0 + 1, 5.0)      # %; the 45% humidity knee falls on the grid
+SURROGATE_WIND_SPEED = 5.0  # mph, the weather API default (no wind benefit)
+SURROGATE_SEED = 20250101
+SURROGATE_START = datetime(2025, 1, 1)
+SURROGATE_REALIZATIONS = 16
+
+
+@dataclass(eq=False)
+class SurrogateGrid:
+    # Simulation outputs per kW of nameplate over the configuration grid
+    values: np.ndarray   # servers x workloads x coolings x temperatures x humidities x outputs
+    server_types: List[str]
+    datacenter_types: List[str]
+    cooling_types: List[str]
+    temperatures: np.ndarray
+    humidities: np.ndarray
+    meta: Dict
+
+    def _category_index(self, names: Sequence[str], axis: List[str], default: str) -> np.ndarray:
+        # Unknown names fall back to the same default the simulator uses
+        lookup = {name: i for i, name in enumerate(axis)}
+        return np.array([lookup.get(name, lookup[default]) for name in names], dtype=np.intp)
+
+    @staticmethod
+    def _bracket(values: np.ndarray, axis: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Lower grid index and interpolation weight on a uniform axis (clamped to its range)
+        position = np.clip((values - axis[0]) / (axis[1] - axis[0]), 0, len(axis) - 1)
+        lower = np.minimum(position.astype(np.intp), len(axis) - 2)
+        return lower, position - lower
+
+    def score(
+        self,
+        server_types: Sequence[str],
+        datacenter_types: Sequence[str],
+        cooling_types: Sequence[str],
+        temperatures,
+        humidities,
+        nameplate_kw
+    ) -> Dict[str, np.ndarray]:
+        """
+        Annual MWh, peak kW and mean PUE for every candidate, bilinear in
+        temperature and humidity. All arguments are equal-length sequences
+        (nameplate_kw may be a scalar).
+        """
+        s = self._category_index(server_types, self.server_types, "enterprise")
+        w = self._category_index(datacenter_types, self.datacenter_types, "enterprise")
+        c = self._category_index(cooling_types, self.cooling_types, "air_cooled")
+        t, t_weight = self._bracket(np.asarray(temperatures, dtype=float), self.temperatures)
+        h, h_weight = self._bracket(np.asarray(humidities, dtype=float), self.humidities)
+
+        # Gather only the four surrounding grid points of each candidate (candidates x outputs)
+        t_weight = t_weight[:, None]
+        h_weight = h_weight[:, None]
+        low = self.values[s, w, c, t, h] * (1 - h_weight) + self.values[s, w, c, t, h + 1] * h_weight
+        high = self.values[s, w, c, t + 1, h] * (1 - h_weight) + self.values[s, w, c, t + 1, h + 1] * h_weight
+        per_kw = low * (1 - t_weight) + high * t_weight
+
+        nameplate_kw = np.asarray(nameplate_kw, dtype=float)
+        return {
+            'annual_mwh': per_kw[:, 0] * nameplate_kw,
+            'peak_kw': per_kw[:, 1] * nameplate_kw,
+            'mean_pue': per_kw[:, 2]
+        }
+
+    def score_specs(self, datacenter_specs: DataCenterSpecs, climate_data: ClimateData) -> Dict[str, float]:
+        """score() for one facility; mixed fleets sum their groups at the facility PUE"""
+        if climate_data.is_hourly:
+            raise ValueError("The surrogate grid only covers snapshot climates")
+        fleet = datacenter_specs.fleet_groups()
+        result = self.score(
+            [group.server_type for group in fleet],
+            [group.datacenter_type for group in fleet],
+            [datacenter_specs.cooling_type] * len(fleet),
+            np.full(len(fleet), float(climate_data.dry_bulb_temp)),
+            np.full(len(fleet), float(climate_data.humidity)),
+            [group.count * group.max_power_per_server / 1000 for group in fleet]
+        )
+        return {
+            'annual_mwh': float(result['annual_mwh'].sum()),
+            'peak_kw': float(result['peak_kw'].sum()),  # Sum of group peaks (upper bound for fleets)
+            'mean_pue': float(result['mean_pue'][0])
+        }
+
+
+def _meta_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
+
+
+def build_surrogate_grid(
+    realizations: int = SURROGATE_REALIZATIONS,
+    seed: int = SURROGATE_SEED,
+    start_date: datetime = SURROGATE_START
+) -> Tuple[np.ndarray, Dict]:
+    """
+    Simulate the full grid with the vectorized simulator. Each workload type
+    is drawn once for every server type as a batch of realizations over the
+    reference year; snapshot-climate PUE is evaluated over the whole
+    temperature x humidity grid in one pass per cooling type.
+    """
+    server_types = list(SERVER_POWER_CURVES)
+    datacenter_types = list(WorkloadSimulator().patterns)
+    cooling_types = list(CoolingEfficiencyModel().cooling_configs)
+    calendar = build_calendar(start_date, 8760)
+
+    # IT energy and peak per kW of nameplate (1 kW = one 1000 W server): workloads x servers
+    it_energy_mwh = np.empty((len(datacenter_types), len(server_types)))
+    it_peak_kw = np.empty_like(it_energy_mwh)
+    seeds = np.random.SeedSequence(seed).spawn(len(datacenter_types))
+    for i, datacenter_type in enumerate(datacenter_types):
+        fleet = [FleetGroup(server_type, datacenter_type, 1, 1000.0) for server_type in server_types]
+        it_power_kw, _ = simulate_fleet_it_power(
+            fleet, WorkloadSimulator(rng=np.random.default_rng(seeds[i])), calendar, realizations=realizations
+        )  # realizations x servers x hours
+        it_energy_mwh[i] = it_power_kw.sum(axis=2).mean(axis=0) / 1000
+        it_peak_kw[i] = np.median(it_power_kw.max(axis=2), axis=0)
+
+    # PUE over the climate grid: coolings x temperatures x humidities
+    temperature, humidity = np.meshgrid(SURROGATE_TEMPERATURES, SURROGATE_HUMIDITIES, indexing="ij")
+    climate = ClimateData(
+        dry_bulb_temp=temperature.ravel(),
+        wet_bulb_temp=estimate_wet_bulb(temperature.ravel(), humidity.ravel()),
+        humidity=humidity.ravel(),
+        wind_speed=np.full(temperature.size, SURROGATE_WIND_SPEED)
+    )
+    pue = np.stack([
+        CoolingEfficiencyModel(cooling_type).calculate_pue_array(climate).reshape(temperature.shape)
+        for cooling_type in cooling_types
+    ])
+
+    # Snapshot climate gives one PUE per run, so facility outputs are IT outputs x PUE
+    shape = (len(server_types), len(datacenter_types)) + pue.shape
+    values = np.empty(shape + (len(SURROGATE_OUTPUTS),), dtype=np.float32)
+    values[..., 0] = it_energy_mwh.T[:, :, None, None, None] * pue
+    values[..., 1] = it_peak_kw.T[:, :, None, None, None] * pue
+    values[..., 2] = np.broadcast_to(pue, shape)
+
+    meta = {
+        'outputs': list(SURROGATE_OUTPUTS),
+        'server_types': server_types,
+        'datacenter_types': datacenter_types,
+        'cooling_types': cooling_types,
+        'temperatures': SURROGATE_TEMPERATURES.tolist(),
+        'humidities': SURROGATE_HUMIDITIES.tolist(),
+        'wind_speed': SURROGATE_WIND_SPEED,
+        'realizations': realizations,
+        'seed': seed,
+        'start_date': start_date.isoformat(),
+        'created': datetime.utcnow().isoformat()
+    }
+    return values, meta
+
+
+def save_surrogate_grid(values: np.ndarray, meta: Dict, path: str = DEFAULT_SURROGATE_PATH) -> None:
+    """Write the grid and its axes sidecar"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(path, values)
+    with open(_meta_path(path), "w") as f:
+        json.dump(meta, f, indent=2)
+        f.write("\n")
+
+
+def load_surrogate_grid(path: Optional[str] = None) -> SurrogateGrid:
+    """Memory-map a saved grid (SURROGATE_GRID_PATH or the bundled file)"""
+    path = path or os.getenv("SURROGATE_GRID_PATH", DEFAULT_SURROGATE_PATH)
+    with open(_meta_path(path)) as f:
+        meta = json.load(f)
+    values = np.load(path, mmap_mode="r")
+    return SurrogateGrid(
+        values=values,
+        server_types=meta['server_types'],
+        datacenter_types=meta['datacenter_types'],
+        cooling_types=meta['cooling_types'],
+        temperatures=np.asarray(meta['temperatures']),
+        humidities=np.asarray(meta['humidities']),
+        meta=meta
+    )
+
+
+_surrogate_grid: Optional[SurrogateGrid] = None
+
+def get_surrogate_grid() -> SurrogateGrid:
+    # Loaded once per process on first use
+    global _surrogate_grid
+    if _surrogate_grid is None:
+        _surrogate_grid = load_surrogate_grid()
+    return _surrogate_grid
+
+
+def validate_surrogate_grid(grid: SurrogateGrid, samples: int = 50, seed: int = 0) -> Dict:
+    """
+    Compare the surrogate against seeded full simulations at random off-grid
+    configurations. Returns per-output mean/max absolute relative error and
+    the individual samples.
+    """
+    rng = np.random.default_rng(seed)
+    grid_info = GridInfo(region_code="DEFAULT", baseline_demand_mw=1000, total_households=400000)
+    start_date = datetime.fromisoformat(grid.meta['start_date'])
+
+    rows = []
+    for _ in range(samples):
+        server_type = str(rng.choice(grid.server_types))
+        datacenter_type = str(rng.choice(grid.datacenter_types))
+        cooling_type = str(rng.choice(grid.cooling_types))
+        temperature = float(rng.uniform(grid.temperatures[0], grid.temperatures[-1]))
+        humidity = float(rng.uniform(grid.humidities[0], grid.humidities[-1]))
+
+        specs = DataCenterSpecs(1000, 1000.0, 50000, cooling_type=cooling_type,
+                                server_type=server_type, datacenter_type=datacenter_type)
+        climate = ClimateData(
+            dry_bulb_temp=temperature,
+            wet_bulb_temp=float(estimate_wet_bulb(temperature, humidity)),
+            humidity=humidity,
+            wind_speed=grid.meta['wind_speed']
+        )
+        sim_result = run_full_simulation(
+            specs, climate, grid_info, seed=int(rng.integers(2**32)), start_date=start_date
+        )
+        estimate = grid.score_specs(specs, climate)
+        simulated = {
+            'annual_mwh': sim_result.annual_consumption_mwh,
+            'peak_kw': sim_result.peak_power_kw,
+            'mean_pue': sim_result.summary.pue.mean
+        }
+        rows.append({
+            'server_type': server_type,
+            'datacenter_type': datacenter_type,
+            'cooling_type': cooling_type,
+            'temperature': temperature,
+            'humidity': humidity,
+            'simulated': simulated,
+            'surrogate': estimate,
+            'relative_error': {
+                name: abs(estimate[name] - value) / value for name, value in simulated.items()
+            }
+        })
+
+    summary = {}
+    for name in ('annual_mwh', 'peak_kw', 'mean_pue'):
+        errors = np.array([row['relative_error'][name] for row in rows])
+        summary[name] = {
+            'mean_relative_error': float(errors.mean()),
+            'p95_relative_error': float(np.percentile(errors, 95)),
+            'max_relative_error': float(errors.max())
+        }
+    return {
+        'grid_created': grid.meta.get('created'),
+        'samples': samples,
+        'seed': seed,
+        'summary': summary,
+        'rows': rows
+    }
@@ -0,0 +1,173 @@
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .carbon import KG_PER_US_TON, carbon_intensity_array
+from .simulate import (
+    SERVER_POWER_CURVES,
+    ClimateData,
+    CoolingEfficiencyModel,
+    FleetGroup,
+    GridImpactCalculator,
+    GridInfo,
+    WorkloadSimulator,
+    build_calendar,
+    get_fleet_power_tables,
+    new_simulation_seed,
+    power_curve_index,
+    simulate_fleet_it_power,
+    simulate_hourly_pue
+)
+from .tariff import get_tariff, tariff_price_array
+
+# Metrics the comparison table can be ranked by (all lower-is-better)
+SWEEP_RANK_METRICS = ("annual_cost", "annual_tons_co2", "average_pue", "peak_impact_percent")
+
+
+@dataclass
+class SweepResult:
+    # Ranked comparison of every configuration evaluated at one site
+    seed: int
+    start_date: datetime
+    simulation_hours: int
+    rank_by: str
+    rows: List[Dict] = field(default_factory=list)
+
+
+def _evaluate_server_type(
+    server_type: str,
+    server_count: int,
+    max_power_per_server: float,
+    utilization: np.ndarray,
+    pue: np.ndarray,
+    prices: np.ndarray,
+    intensity: np.ndarray,
+    month_starts: np.ndarray,
+    demand_charge_per_kw: float
+) -> Dict[str, np.ndarray]:
+    # Metrics for one server type against every (workload, cooling) pair as
+    # (workloads x coolings) arrays. utilization is (workloads x hours), pue (coolings x hours);
+    # both are shared draws, so only the power-curve gather is per server type.
+    table = get_fleet_power_tables([server_type])[0]
+    power_ratio = table[power_curve_index(utilization)]
+    it_power_kw = max_power_per_server * power_ratio * server_count / 1000
+
+    power_kw = it_power_kw[:, None, :] * pue[None, :, :]  # workloads x coolings x hours
+    monthly_peak_kw = np.maximum.reduceat(power_kw, month_starts, axis=2)
+
+    return {
+        "annual_mwh": power_kw.sum(axis=2) / 1000,
+        "energy_cost": power_kw @ prices,
+        "demand_charges": monthly_peak_kw.sum(axis=2) * demand_charge_per_kw,
+        "annual_tons_co2": (power_kw @ intensity) / KG_PER_US_TON,
+        "peak_power_kw": power_kw.max(axis=2),
+        "average_power_kw": power_kw.mean(axis=2),
+        "average_pue": np.broadcast_to(pue.mean(axis=1), power_kw.shape[:2]).copy()
+    }
+
+
+def run_parameter_sweep(
+    climate_data: ClimateData,
+    grid_info: GridInfo,
+    server_count: int,
+    max_power_per_server: float,
+    cooling_types: Optional[Sequence[str]] = None,
+    server_types: Optional[Sequence[str]] = None,
+    datacenter_types: Optional[Sequence[str]] = None,
+    simulation_hours: int = 8760,
+    seed: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    demand_charge_per_kw: float = 0.0,
+    rank_by: str = "annual_cost"
+) -> SweepResult:
+    """
+    Evaluate every cooling x server x workload combination at one site.
+
+    The calendar, tariff and carbon arrays are built once, utilization is
+    drawn once per workload type (the same seeded draw run_full_simulation
+    makes for that type) and PUE once per cooling type; each combination is
+    then a broadcast product of the two. The whole default sweep (112
+    configurations, one year) takes tens of milliseconds in-process, so it
+    is not sent to the simulation pool: pickling the shared arrays to the
+    workers costs more than it saves.
+    """
+    if rank_by not in SWEEP_RANK_METRICS:
+        raise ValueError(f"rank_by must be one of {SWEEP_RANK_METRICS}, got '{rank_by}'")
+    if seed is None:
+        seed = new_simulation_seed()
+    if start_date is None:
+        start_date = datetime.now()
+    start_date = start_date.replace(minute=0, second=0, microsecond=0)
+
+    workload_patterns = WorkloadSimulator().patterns
+    cooling_configs = CoolingEfficiencyModel().cooling_configs
+    cooling_types = [c for c in (cooling_types or cooling_configs) if c in cooling_configs]
+    server_types = [s for s in (server_types or SERVER_POWER_CURVES) if s in SERVER_POWER_CURVES]
+    datacenter_types = [d for d in (datacenter_types or workload_patterns) if d in workload_patterns]
+    if not (cooling_types and server_types and datacenter_types):
+        raise ValueError("Sweep needs at least one known cooling, server and workload type")
+
+    # Shared arrays: calendar, one utilization row per workload, one PUE row per cooling type
+    calendar = build_calendar(start_date, simulation_hours)
+    utilization = np.stack([
+        simulate_fleet_it_power(
+            [FleetGroup("enterprise", datacenter_type, 1, 1.0)],
+            WorkloadSimulator(rng=np.random.default_rng(seed)), calendar
+        )[1][0]
+        for datacenter_type in datacenter_types
+    ])
+    pue = np.stack([
+        simulate_hourly_pue(CoolingEfficiencyModel(cooling_type), climate_data, calendar)
+        for cooling_type in cooling_types
+    ])
+
+    tariff = get_tariff(grid_info.region_code, demand_charge_per_kw)
+    prices = tariff_price_array(tariff, start_date, simulation_hours)
+    intensity = carbon_intensity_array(tariff.region_code, start_date, simulation_hours)
+    month_starts = np.flatnonzero(np.diff(calendar.month_index, prepend=-1))
+
+    per_server = [
+        _evaluate_server_type(server_type, server_count, max_power_per_server, utilization, pue,
+                              prices, intensity, month_starts, demand_charge_per_kw)
+        for server_type in server_types
+    ]
+
+    grid_calculator = GridImpactCalculator()
+    rows = []
+    for server_type, metrics in zip(server_types, per_server):
+        for (w, datacenter_type), (c, cooling_type) in itertools.product(
+            enumerate(datacenter_types), enumerate(cooling_types)
+        ):
+            impact = grid_calculator.calculate_grid_impact_from_stats(
+                metrics["peak_power_kw"][w, c] / 1000, metrics["average_power_kw"][w, c] / 1000, grid_info
+            )
+            rows.append({
+                'server_type': server_type,
+                'datacenter_type': datacenter_type,
+                'cooling_type': cooling_type,
+                'annual_mwh': float(metrics["annual_mwh"][w, c]),
+                'annual_cost': float(metrics["energy_cost"][w, c] + metrics["demand_charges"][w, c]),
+                'annual_tons_co2': float(metrics["annual_tons_co2"][w, c]),
+                'average_pue': float(metrics["average_pue"][w, c]),
+                'peak_mw': float(metrics["peak_power_kw"][w, c]) / 1000,
+                'peak_impact_percent': impact['peak_impact_percent'],
+                'stability_risk': impact['stability_risk']
+            })
+
+    # Rank on every metric (1 = best), then order the table by the requested one
+    for metric in SWEEP_RANK_METRICS:
+        order = np.argsort([row[metric] for row in rows], kind="stable")
+        for rank, index in enumerate(order, start=1):
+            rows[index].setdefault('ranks', {})[metric] = rank
+    rows.sort(key=lambda row: row['ranks'][rank_by])
+
+    return SweepResult(
+        seed=seed,
+        start_date=start_date,
+        simulation_hours=simulation_hours,
+        rank_by=rank_by,
+        rows=rows
+    )
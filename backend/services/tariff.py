@@ -0,0 +1,186 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .simulate import GridImpactCalculator, PowerSimulationResult, SimulationCalendar, build_calendar
+
+# Peak pricing window per region as [start, end) hour of day. Windows follow each
+# operator's system peak: CAISO's evening net-load ramp, ERCOT/SPP/WEST summer
+# afternoons, ISONE/PACNW winter-and-evening peaks.
+PEAK_HOURS = {
+    "CAISO": (16, 21),
+    "ERCOT": (15, 20),
+    "PJM": (14, 19),
+    "NYISO": (14, 19),
+    "SPP": (15, 20),
+    "ISONE": (16, 21),
+    "MISO": (14, 19),
+    "SERC": (14, 19),
+    "PACNW": (17, 21),
+    "WEST": (15, 20),
+    "DEFAULT": (14, 19)
+}
+
+# Seasonal tier multipliers, January..December. Most regions peak in summer;
+# ISONE and PACNW are winter-peaking systems.
+SUMMER_PEAKING_SEASONS = (1.0, 1.0, 0.9, 0.9, 0.95, 1.15, 1.2, 1.2, 1.1, 0.9, 0.95, 1.0)
+WINTER_PEAKING_SEASONS = (1.2, 1.15, 1.0, 0.9, 0.9, 0.95, 1.05, 1.05, 0.95, 0.9, 1.0, 1.15)
+SEASONAL_FACTORS = {
+    "ISONE": WINTER_PEAKING_SEASONS,
+    "PACNW": WINTER_PEAKING_SEASONS
+}
+
+# Prices are scaled so a flat load over this reference year pays base_rate on average
+TARIFF_REFERENCE_YEAR = datetime(2025, 1, 1)
+
+@dataclass(frozen=True)
+class Tariff:
+    # Time-of-use tariff for one grid region
+    region_code: str
+    base_rate: float                       # $/kWh averaged over a flat load
+    peak_multiplier: float                 # Peak price / off-peak price
+    peak_hours: Tuple[int, int] = (14, 19)  # [start, end) hour of day
+    peak_weekdays_only: bool = True
+    seasonal_factors: Tuple[float, ...] = SUMMER_PEAKING_SEASONS  # January..December
+    demand_charge_per_kw: float = 0.0      # $/kW of each month's peak demand
+
+@dataclass(eq=False)
+class TariffCostResult:
+    # Profile-weighted energy cost of one simulation under a Tariff
+    tariff: Tariff
+    hourly_cost: np.ndarray   # $ per simulation step
+    energy_cost: float
+    demand_charges: float
+    total_cost: float
+    flat_rate_cost: float     # Same energy at base_rate, for comparison
+    peak_energy_share: float  # Fraction of energy bought in peak windows
+    monthly_bills: List[Dict] = field(default_factory=list)
+
+    @property
+    def effective_rate(self) -> float:
+        energy_kwh = self.flat_rate_cost / self.tariff.base_rate if self.tariff.base_rate else 0.0
+        return self.total_cost / energy_kwh if energy_kwh > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'region_code': self.tariff.region_code,
+            'peak_hours': list(self.tariff.peak_hours),
+            'peak_multiplier': self.tariff.peak_multiplier,
+            'demand_charge_per_kw': self.tariff.demand_charge_per_kw,
+            'energy_cost': self.energy_cost,
+            'demand_charges': self.demand_charges,
+            'total_cost': self.total_cost,
+            'flat_rate_cost': self.flat_rate_cost,
+            'effective_rate': self.effective_rate,
+            'peak_energy_share': self.peak_energy_share,
+            'monthly_bills': self.monthly_bills
+        }
+
+
+def get_tariff(region_code: str, demand_charge_per_kw: float = 0.0) -> Tariff:
+    """Tariff built from GridImpactCalculator.grid_regions for region_code"""
+    regions = GridImpactCalculator().grid_regions
+    if region_code not in regions:
+        region_code = "DEFAULT"
+    config = regions[region_code]
+    return Tariff(
+        region_code=region_code,
+        base_rate=config["base_rate"],
+        peak_multiplier=config["peak_multiplier"],
+        peak_hours=PEAK_HOURS.get(region_code, PEAK_HOURS["DEFAULT"]),
+        seasonal_factors=SEASONAL_FACTORS.get(region_code, SUMMER_PEAKING_SEASONS),
+        demand_charge_per_kw=demand_charge_per_kw
+    )
+
+
+def _peak_mask(tariff: Tariff, calendar: SimulationCalendar) -> np.ndarray:
+    peak_start, peak_end = tariff.peak_hours
+    in_peak = (calendar.hour_of_day >= peak_start) & (calendar.hour_of_day < peak_end)
+    if tariff.peak_weekdays_only:
+        in_peak &= calendar.day_of_week < 5
+    return in_peak
+
+
+def _price_shape(tariff: Tariff, calendar: SimulationCalendar) -> np.ndarray:
+    # Relative price per step: seasonal tier times the peak multiplier in peak windows
+    shape = np.asarray(tariff.seasonal_factors)[calendar.month - 1]
+    shape[_peak_mask(tariff, calendar)] *= tariff.peak_multiplier
+    return shape
+
+
+@lru_cache(maxsize=32)
+def _price_scale(tariff: Tariff) -> float:
+    # $/kWh per unit of shape, so the reference year's flat-load average is base_rate
+    reference = _price_shape(tariff, build_calendar(TARIFF_REFERENCE_YEAR, 8760))
+    return tariff.base_rate / float(reference.mean())
+
+
+@lru_cache(maxsize=64)
+def _billing_arrays(tariff: Tariff, start_date: datetime, simulation_hours: int,
+                    step_minutes: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Price, peak-window mask, billing month and month start offsets for every step.
+    # Built once per tariff and calendar and shared read-only, so repeated forecasts
+    # in the same region only pay for the dot product.
+    calendar = build_calendar(start_date, simulation_hours, step_minutes)
+    prices = _price_shape(tariff, calendar) * _price_scale(tariff)
+    in_peak = _peak_mask(tariff, calendar)
+    month_index = calendar.month_index
+    month_starts = np.flatnonzero(np.diff(month_index, prepend=-1))
+    for array in (prices, in_peak, month_index, month_starts):
+        array.flags.writeable = False
+    return prices, in_peak, month_index, month_starts
+
+
+def tariff_price_array(tariff: Tariff, start_date: datetime, simulation_hours: int = 8760,
+                       step_minutes: int = 60) -> np.ndarray:
+    """$/kWh for every simulation step (shared, read-only)"""
+    return _billing_arrays(tariff, start_date, simulation_hours, step_minutes)[0]
+
+
+def calculate_tou_cost(sim_result: PowerSimulationResult, tariff: Tariff) -> TariffCostResult:
+    """Cost sim_result's power profile under tariff, with monthly bills"""
+    simulation_hours = len(sim_result.hourly_power_kw) // sim_result.steps_per_hour
+    prices, in_peak, month_index, month_starts = _billing_arrays(
+        tariff, sim_result.start_date, simulation_hours, sim_result.step_minutes
+    )
+
+    energy_kwh = sim_result.hourly_power_kw.astype(np.float64, copy=False) * sim_result.step_hours
+    hourly_cost = energy_kwh * prices
+    energy_cost = float(energy_kwh @ prices)
+    total_energy_kwh = float(energy_kwh.sum())
+    peak_energy_kwh = float(energy_kwh @ in_peak)
+
+    # Monthly billing periods: energy and cost by bincount, demand from each month's peak kW
+    months = len(month_starts)
+    monthly_energy = np.bincount(month_index, weights=energy_kwh, minlength=months)
+    monthly_cost = np.bincount(month_index, weights=hourly_cost, minlength=months)
+    monthly_peak_kw = np.maximum.reduceat(sim_result.hourly_power_kw, month_starts).astype(np.float64)
+    monthly_demand = monthly_peak_kw * tariff.demand_charge_per_kw
+    first_month = np.datetime64(sim_result.start_date, 'M')
+
+    monthly_bills = [
+        {
+            'month': str(first_month + i),
+            'energy_kwh': float(monthly_energy[i]),
+            'energy_cost': float(monthly_cost[i]),
+            'peak_kw': float(monthly_peak_kw[i]),
+            'demand_charge': float(monthly_demand[i]),
+            'total': float(monthly_cost[i] + monthly_demand[i])
+        }
+        for i in range(months)
+    ]
+
+    demand_charges = float(monthly_demand.sum())
+    return TariffCostResult(
+        tariff=tariff,
+        hourly_cost=hourly_cost,
+        energy_cost=energy_cost,
+        demand_charges=demand_charges,
+        total_cost=energy_cost + demand_charges,
+        flat_rate_cost=total_energy_kwh * tariff.base_rate,
+        peak_energy_share=peak_energy_kwh / total_energy_kwh if total_energy_kwh > 0 else 0.0,
+        monthly_bills=monthly_bills
+    )
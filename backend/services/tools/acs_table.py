@@ -0,0 +1,72 @@
+"""
+Refresh and inspect the bundled ACS county table (services/acs_table.py).
+
+Run from the backend directory:
+
+    python services/tools/acs_table.py refresh               # download every county, rewrite services/data/acs_county
+    python services/tools/acs_table.py refresh --year 2023
+    python services/tools/acs_table.py lookup 06 001
+
+Refresh after each ACS 5-year release (December). Needs CENSUS_API_KEY in
+config.env; the server itself never calls the Census API for counties in
+the table.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, BACKEND_DIR)
+
+from services.acs_table import (
+    ACS_TABLE_YEAR,
+    DEFAULT_ACS_TABLE_DIR,
+    fetch_acs_table,
+    load_acs_table,
+    save_acs_table
+)
+
+
+def refresh(args):
+    start = time.perf_counter()
+    arrays = fetch_acs_table(args.year)
+    save_acs_table(arrays, args.year, args.path)
+    size = sum(os.path.getsize(os.path.join(args.path, name)) for name in os.listdir(args.path))
+    print(f"Wrote {len(arrays['fips'])} counties x {len(arrays) - 2} columns ({size / 1024:.0f} KiB) "
+          f"to {args.path} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+def lookup(args):
+    table = load_acs_table(args.path)
+    if table is None:
+        return 1
+    print(json.dumps(table.lookup(args.state_fips, args.county_fips), indent=2))
+    return 0
+
+
+def main(argv=None):
+    load_dotenv(os.path.join(BACKEND_DIR, 'config.env'))
+    parser = argparse.ArgumentParser(description="Refresh or inspect the bundled ACS county table")
+    parser.add_argument("--path", default=DEFAULT_ACS_TABLE_DIR, help="table directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    update = commands.add_parser("refresh", help="download the table from the Census API")
+    update.add_argument("--year", type=int, default=ACS_TABLE_YEAR, help=f"ACS 5-year vintage (default {ACS_TABLE_YEAR})")
+    update.set_defaults(func=refresh)
+
+    find = commands.add_parser("lookup", help="print one county")
+    find.add_argument("state_fips")
+    find.add_argument("county_fips")
+    find.set_defaults(func=lookup)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
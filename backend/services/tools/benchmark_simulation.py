@@ -0,0 +1,194 @@
+"""
+Benchmark suite for the simulation and grid-impact hot paths.
+
+Times run_full_simulation across run lengths, server types, cooling types and
+the preset tiers from app.py, plus GridImpactCalculator.calculate_grid_impact
+on year-long profiles. Each case reports the best of several repeats.
+
+Run from the backend directory:
+
+    python services/tools/benchmark_simulation.py            # print timings
+    python services/tools/benchmark_simulation.py --save     # write baselines
+    python services/tools/benchmark_simulation.py --check    # fail on regressions
+
+Baselines are machine-specific; regenerate them with --save when the
+benchmark host changes.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, BACKEND_DIR)
+
+from services.simulate import (
+    SERVER_POWER_CURVES,
+    ClimateData,
+    CoolingEfficiencyModel,
+    DataCenterSpecs,
+    GridImpactCalculator,
+    GridInfo,
+    create_datacenter_specs_from_config,
+    run_full_simulation
+)
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baselines.json")
+DEFAULT_TOLERANCE = 2.0  # Fail when a case is this many times slower than its baseline
+# Cases faster than this are dominated by timer noise and only fail past this floor
+MIN_CHECK_SECONDS = 0.002
+
+SIMULATION_HOURS = (24, 168, 8760, 87600)
+BENCHMARK_SEED = 12345
+BENCHMARK_START = datetime(2025, 1, 1)
+
+CLIMATE = ClimateData(dry_bulb_temp=78, wet_bulb_temp=66, humidity=55, wind_speed=8)
+GRID = GridInfo(region_code="PJM", baseline_demand_mw=600, total_households=400000)
+BASE_SPECS = DataCenterSpecs(server_count=1000, max_power_per_server=10000, facility_size_sqft=50000)
+
+
+def load_tiers():
+    """Preset tiers from app.py (importing app requires an API key to be set)"""
+    os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+    from app import DATA_CENTER_TIERS
+    return DATA_CENTER_TIERS
+
+
+def time_call(func, repeat):
+    """Best and median wall time of `repeat` calls after one warm-up call"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), float(np.median(timings))
+
+
+def simulation_case(specs, hours):
+    return lambda: run_full_simulation(
+        specs, CLIMATE, GRID, hours, seed=BENCHMARK_SEED, start_date=BENCHMARK_START
+    )
+
+
+def build_cases(include_tiers=True):
+    """Benchmark name -> zero-argument callable"""
+    cases = {}
+
+    for hours in SIMULATION_HOURS:
+        cases[f"simulation/hours={hours}"] = simulation_case(BASE_SPECS, hours)
+
+    for server_type in SERVER_POWER_CURVES:
+        specs = DataCenterSpecs(1000, 10000, 50000, server_type=server_type)
+        cases[f"simulation/server_type={server_type}"] = simulation_case(specs, 8760)
+
+    for cooling_type in CoolingEfficiencyModel().cooling_configs:
+        specs = DataCenterSpecs(1000, 10000, 50000, cooling_type=cooling_type)
+        cases[f"simulation/cooling_type={cooling_type}"] = simulation_case(specs, 8760)
+
+    if include_tiers:
+        for tier, config in load_tiers().items():
+            cases[f"simulation/tier={tier}"] = simulation_case(create_datacenter_specs_from_config(config), 8760)
+
+    # Year-long profiles with the same shape as the tools/test_grid.py scenarios
+    calculator = GridImpactCalculator()
+    hours = np.arange(8760)
+    for name, average_kw in (("medium", 3000), ("hyperscale", 150000)):
+        profile = average_kw + np.sin(hours / 24 * 2 * np.pi) * average_kw / 6
+        cases[f"grid_impact/{name}/array"] = lambda p=profile: calculator.calculate_grid_impact(p, GRID)
+        cases[f"grid_impact/{name}/list"] = lambda p=profile.tolist(): calculator.calculate_grid_impact(p, GRID)
+
+    return cases
+
+
+def run_benchmarks(cases, repeat):
+    results = {}
+    for name, func in cases.items():
+        best, median = time_call(func, repeat)
+        results[name] = {"best_seconds": best, "median_seconds": median}
+        print(f"  {name:<50} best {best * 1000:9.3f} ms   median {median * 1000:9.3f} ms")
+    return results
+
+
+def environment_info():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def check_against_baseline(results, baseline, tolerance):
+    """Names of cases slower than tolerance x their baseline best time"""
+    regressions = []
+    for name, timing in results.items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"  {name:<50} no baseline")
+            continue
+        limit = max(reference["best_seconds"] * tolerance, MIN_CHECK_SECONDS)
+        ratio = timing["best_seconds"] / reference["best_seconds"]
+        status = "OK" if timing["best_seconds"] <= limit else "REGRESSION"
+        print(f"  {name:<50} {ratio:6.2f}x baseline  {status}")
+        if status != "OK":
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the simulation and grid-impact hot paths")
+    parser.add_argument("--repeat", type=int, default=20, help="timed calls per case (default 20)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="exit non-zero on regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed slowdown factor for --check (default {DEFAULT_TOLERANCE})")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this string")
+    parser.add_argument("--no-tiers", action="store_true", help="skip the preset tiers (avoids importing app.py)")
+    args = parser.parse_args(argv)
+
+    cases = {
+        name: func for name, func in build_cases(include_tiers=not args.no_tiers).items()
+        if args.filter in name
+    }
+
+    print(f"\n{'='*70}")
+    print(f"SIMULATION BENCHMARKS ({len(cases)} cases, best of {args.repeat})")
+    print(f"{'='*70}\n")
+    results = run_benchmarks(cases, args.repeat)
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "created": datetime.utcnow().isoformat(),
+                "repeat": args.repeat,
+                "environment": environment_info(),
+                "results": results
+            }, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.check:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\n{'='*70}")
+        print(f"BASELINE CHECK (tolerance {args.tolerance}x)")
+        print(f"{'='*70}\n")
+        regressions = check_against_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        print("\nNo regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Build and check the offline county index (services/county_resolver.py).
+
+Run from the backend directory:
+
+    python services/tools/county_index.py build                       # download TIGER boundaries and rebuild
+    python services/tools/county_index.py build --source counties.zip # from a local cartographic boundary file
+    python services/tools/county_index.py build --source cb_2016_us_county_500k.shp --exclude 09,02261
+    python services/tools/county_index.py lookup 37.80 -122.27
+    python services/tools/county_index.py check --samples 200         # compare against the Census geocoder
+
+Refresh after each annual cartographic boundary release. Accepts the zip
+as published, an unpacked .shp (with its .dbf) or a GeoJSON export.
+--exclude drops states or counties whose boundaries changed after the
+source's vintage, so their points go to the live geocoder instead.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, BACKEND_DIR)
+
+from services import http_client
+from services.county_resolver import (
+    COUNTY_BOUNDARY_URL,
+    DEFAULT_COUNTY_INDEX_PATH,
+    build_county_index,
+    census_geocode,
+    load_county_resolver,
+    save_county_index
+)
+
+
+def build(args):
+    source = args.source
+    if not source:
+        print(f"Downloading {COUNTY_BOUNDARY_URL}")
+        response = http_client.get(COUNTY_BOUNDARY_URL, timeout=120)
+        response.raise_for_status()
+        handle, source = tempfile.mkstemp(suffix=".zip")
+        with os.fdopen(handle, "wb") as f:
+            f.write(response.content)
+
+    start = time.perf_counter()
+    arrays = build_county_index(source, [prefix for prefix in args.exclude.split(",") if prefix])
+    save_county_index(arrays, args.path)
+    size = os.path.getsize(args.path)
+    print(f"Wrote {len(arrays['fips'])} counties, {len(arrays['vertices'])} vertices "
+          f"({size / 1024 / 1024:.1f} MiB) to {args.path} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+def lookup(args):
+    resolver = load_county_resolver(args.path)
+    if resolver is None:
+        return 1
+    start = time.perf_counter()
+    county = resolver.lookup(args.lat, args.lon)
+    print(f"{county or 'outside coverage'} ({(time.perf_counter() - start) * 1e6:.0f} µs)")
+    return 0
+
+
+def check(args):
+    # Sample points inside random county bounding boxes and compare with the live geocoder
+    resolver = load_county_resolver(args.path)
+    if resolver is None:
+        return 1
+    rng = np.random.default_rng(args.seed)
+    mismatches = 0
+    for county in rng.choice(resolver.counties, size=args.samples):
+        min_lon, min_lat, max_lon, max_lat = resolver.bboxes[county]
+        lat, lon = rng.uniform(min_lat, max_lat), rng.uniform(min_lon, max_lon)
+        offline, live = resolver.lookup(lat, lon), census_geocode(lat, lon)
+        offline_fips = offline and offline["state_fips"] + offline["county_fips"]
+        live_fips = live and live["state_fips"] + live["county_fips"]
+        if offline_fips != live_fips:
+            mismatches += 1
+            print(f"  {lat:.5f},{lon:.5f}: index {offline_fips}, geocoder {live_fips}")
+    print(f"{mismatches} of {args.samples} points disagree with the Census geocoder")
+    return 1 if mismatches else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or check the offline county index")
+    parser.add_argument("--path", default=DEFAULT_COUNTY_INDEX_PATH, help="index .npz path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    make = commands.add_parser("build", help="build the index from county boundaries")
+    make.add_argument("--source", default="", help="local boundary zip/.shp/.geojson (default: download)")
+    make.add_argument("--exclude", default="", help="comma-separated state or county FIPS prefixes to leave out")
+    make.set_defaults(func=build)
+
+    find = commands.add_parser("lookup", help="resolve one point")
+    find.add_argument("lat", type=float)
+    find.add_argument("lon", type=float)
+    find.set_defaults(func=lookup)
+
+    verify = commands.add_parser("check", help="compare random points against the live geocoder")
+    verify.add_argument("--samples", type=int, default=100)
+    verify.add_argument("--seed", type=int, default=0)
+    verify.set_defaults(func=check)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Preload and inspect the location lookup cache (services/location_cache.py).
+
+Run from the backend directory:
+
+    python services/tools/location_cache.py preload                 # ACS rows for every US county
+    python services/tools/location_cache.py preload --states 06,36  # only these states
+    python services/tools/location_cache.py preload --file rows.json
+    python services/tools/location_cache.py stats
+    python services/tools/location_cache.py purge                   # drop expired entries
+
+Preloading fetches whole states in one ACS request each, so the first click
+in any preloaded county skips the ACS call.
+"""
+import argparse
+import json
+import os
+import sys
+
+from dotenv import load_dotenv
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, BACKEND_DIR)
+
+from services import http_client
+from services.acs_table import acs5_url
+from services.location_cache import LocationCache
+
+DEFAULT_PATH = os.getenv('LOCATION_CACHE_PATH', os.path.join(BACKEND_DIR, 'location_cache.sqlite3'))
+
+
+def fetch_acs_counties(state_fips=None):
+    """ACS population/income rows for every county (optionally in one state)"""
+    params = {
+        "get": "NAME,B01003_001E,B19013_001E",
+        "for": "county:*",
+        "key": os.getenv('CENSUS_API_KEY')
+    }
+    if state_fips:
+        params["in"] = f"state:{state_fips}"
+    response = http_client.get(acs5_url(), params=params, timeout=60)
+    response.raise_for_status()
+
+    header, *rows = response.json()
+    columns = {name: i for i, name in enumerate(header)}
+    locations = []
+    for row in rows:
+        population, income = row[columns["B01003_001E"]], row[columns["B19013_001E"]]
+        locations.append({
+            "location_name": row[columns["NAME"]],
+            "population": int(population) if population.isdigit() else 0,
+            "median_income": int(income) if income.lstrip("-").isdigit() and int(income) > 0 else 0,
+            "state_fips": row[columns["state"]],
+            "county_fips": row[columns["county"]]
+        })
+    return locations
+
+
+def preload(args):
+    cache = LocationCache(args.path)
+    if args.file:
+        with open(args.file) as f:
+            rows = json.load(f)
+        print(f"Stored {cache.preload_acs(rows)} ACS rows from {args.file}")
+        return 0
+
+    for state_fips in (args.states.split(",") if args.states else [None]):
+        rows = fetch_acs_counties(state_fips)
+        print(f"Stored {cache.preload_acs(rows)} ACS rows for {'state ' + state_fips if state_fips else 'all states'}")
+    return 0
+
+
+def stats(args):
+    print(json.dumps(LocationCache(args.path).stats(), indent=2))
+    return 0
+
+
+def purge(args):
+    print(f"Removed {LocationCache(args.path).purge_expired()} expired entries")
+    return 0
+
+
+def main(argv=None):
+    load_dotenv(os.path.join(BACKEND_DIR, 'config.env'))
+    parser = argparse.ArgumentParser(description="Preload or inspect the location lookup cache")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="SQLite cache file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser("preload", help="bulk-load ACS county rows")
+    load.add_argument("--states", default="", help="comma-separated state FIPS codes (default: all)")
+    load.add_argument("--file", default="", help="load rows from a JSON list instead of the Census API")
+    load.set_defaults(func=preload)
+
+    commands.add_parser("stats", help="entry counts per namespace").set_defaults(func=stats)
+    commands.add_parser("purge", help="delete expired entries").set_defaults(func=purge)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
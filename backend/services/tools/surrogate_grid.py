@@ -0,0 +1,91 @@
+"""
+Regenerate and validate the surrogate lookup grid (services/surrogate.py).
+
+Run from the backend directory:
+
+    python services/tools/surrogate_grid.py regenerate             # rebuild services/data/surrogate_grid.npy
+    python services/tools/surrogate_grid.py validate               # compare against full simulations
+    python services/tools/surrogate_grid.py validate --report r.json
+
+Regenerate after any change to the power curves, workload patterns or
+cooling model, then re-run validate.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, BACKEND_DIR)
+
+from services.surrogate import (
+    DEFAULT_SURROGATE_PATH,
+    SURROGATE_REALIZATIONS,
+    SURROGATE_SEED,
+    build_surrogate_grid,
+    load_surrogate_grid,
+    save_surrogate_grid,
+    validate_surrogate_grid
+)
+
+
+def regenerate(args):
+    start = time.perf_counter()
+    values, meta = build_surrogate_grid(realizations=args.realizations, seed=args.seed)
+    save_surrogate_grid(values, meta, args.path)
+    print(f"Wrote {values.shape} grid ({values.nbytes / 1024:.0f} KiB) to {args.path} "
+          f"in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+def validate(args):
+    grid = load_surrogate_grid(args.path)
+    report = validate_surrogate_grid(grid, samples=args.samples, seed=args.seed)
+
+    print(f"\n{'='*70}")
+    print(f"SURROGATE VALIDATION ({report['samples']} full simulations)")
+    print(f"{'='*70}\n")
+    print(f"  {'output':<14} {'mean':>10} {'p95':>10} {'max':>10}")
+    for name, errors in report['summary'].items():
+        print(f"  {name:<14} {errors['mean_relative_error']:>9.3%} "
+              f"{errors['p95_relative_error']:>9.3%} {errors['max_relative_error']:>9.3%}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\nReport written to {args.report}")
+
+    worst = max(errors['max_relative_error'] for errors in report['summary'].values())
+    if worst > args.tolerance:
+        print(f"\nMax relative error {worst:.3%} exceeds {args.tolerance:.3%}")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate or validate the surrogate lookup grid")
+    parser.add_argument("--path", default=DEFAULT_SURROGATE_PATH, help="grid .npy path (axes go in a .json beside it)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("regenerate", help="simulate the grid and write it")
+    build.add_argument("--realizations", type=int, default=SURROGATE_REALIZATIONS,
+                       help=f"simulated years per configuration (default {SURROGATE_REALIZATIONS})")
+    build.add_argument("--seed", type=int, default=SURROGATE_SEED, help="simulation seed")
+    build.set_defaults(func=regenerate)
+
+    check = commands.add_parser("validate", help="compare the grid against seeded full simulations")
+    check.add_argument("--samples", type=int, default=50, help="random configurations to simulate (default 50)")
+    check.add_argument("--seed", type=int, default=0, help="sampling seed")
+    check.add_argument("--tolerance", type=float, default=0.02,
+                       help="exit non-zero when any relative error exceeds this (default 0.02)")
+    check.add_argument("--report", default="", help="write the full report as JSON")
+    check.set_defaults(func=validate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
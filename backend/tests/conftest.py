@@ -0,0 +1,41 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.simulate import (
+    GridInfo,
+    create_climate_data_from_api,
+    create_datacenter_specs_from_config
+)
+
+START = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def specs():
+    return create_datacenter_specs_from_config({
+        'servers': 2000, 'power_mw': 1, 'cooling_type': 'air_cooled',
+        'server_type': 'enterprise', 'datacenter_type': 'enterprise'
+    })
+
+
+@pytest.fixture
+def mixed_specs():
+    return create_datacenter_specs_from_config({'fleet': [
+        {'server_type': 'nvidia_h100', 'datacenter_type': 'ai_training', 'count': 200, 'max_power_per_server': 3000},
+        {'server_type': 'enterprise', 'datacenter_type': 'enterprise', 'count': 1000, 'max_power_per_server': 500}
+    ]})
+
+
+@pytest.fixture
+def climate():
+    return create_climate_data_from_api({'temperature': 78, 'humidity': 55})
+
+
+@pytest.fixture
+def grid_info():
+    return GridInfo(region_code='CAISO', baseline_demand_mw=3000, total_households=1_000_000)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from services.acs_table import ACS_COLUMNS, load_acs_table, save_acs_table
+
+
+@pytest.fixture
+def table(tmp_path):
+    # Three-county table in the on-disk layout written by services/tools/acs_table.py refresh
+    arrays = {
+        "fips": np.array([6001, 6075, 51540], dtype=np.int32),
+        "names": np.array(["Alameda County, California", "San Francisco County, California",
+                           "Charlottesville city, Virginia"])
+    }
+    for i, name in enumerate(ACS_COLUMNS):
+        arrays[name] = np.array([1000 + i, 2000 + i, 3000 + i], dtype=np.int64)
+    save_acs_table(arrays, 2022, str(tmp_path))
+    return load_acs_table(str(tmp_path))
+
+
+def test_lookup(table):
+    assert len(table) == 3 and table.year == 2022
+    assert table.lookup("06", "075") == {
+        "location_name": "San Francisco County, California",
+        "population": 2000,
+        "median_income": 2002,
+        "households": 2001,
+        "state_fips": "06",
+        "county_fips": "075"
+    }
+    assert table.lookup("06", "003") is None
+    assert table.lookup("6", "001") is None
+
+
+def test_rows_and_column_share_the_five_digit_rule(table):
+    codes = ["51540", "06001", "6001", "99999", "0600a", "060010"]
+    np.testing.assert_array_equal(table.rows(codes), [2, 0, -1, -1, -1, -1])
+    np.testing.assert_array_equal(table.column("population", codes), [3000, 1000, 0, 0, 0, 0])
+
+
+def test_census_row_matches_api_shape(table):
+    variables = ["B19013_001E", "NAME", "B99999_001E", "B01003_001E"]
+    assert table.census_row("51", "540", variables) == [
+        ["B19013_001E", "NAME", "B99999_001E", "B01003_001E", "state", "county"],
+        ["3002", "Charlottesville city, Virginia", None, "3000", "51", "540"]
+    ]
+    assert table.census_row("51", "003", variables) is None
+
+
+def test_missing_table(tmp_path):
+    assert load_acs_table(str(tmp_path / "missing")) is None
+
+
+def test_missing_table_warns(tmp_path, capsys):
+    assert load_acs_table(str(tmp_path / "missing")) is None
+    assert "not found" in capsys.readouterr().err
@@ -0,0 +1,92 @@
+import numpy as np
+
+from services.cache import SimulationCache, run_cached_simulation, simulation_cache_key
+from services.simulate import run_full_simulation
+
+from conftest import START
+
+
+def test_round_trip(tmp_path, specs, climate, grid_info):
+    cache = SimulationCache(str(tmp_path))
+    result = run_full_simulation(specs, climate, grid_info, 48, seed=5, start_date=START)
+    key = simulation_cache_key(specs, climate, grid_info, 48, 5, START)
+
+    assert cache.get(key) is None
+    cache.put(key, result)
+    cached = cache.get(key)
+
+    np.testing.assert_array_equal(cached.hourly_power_kw, result.hourly_power_kw)
+    np.testing.assert_array_equal(cached.hourly_pue, result.hourly_pue)
+    assert cached.peak_power_kw == result.peak_power_kw
+    assert cached.community_impact == result.community_impact
+    assert cached.start_date == result.start_date
+    assert not cached.hourly_power_kw.flags.writeable
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_key_depends_on_inputs(specs, climate, grid_info):
+    key = simulation_cache_key(specs, climate, grid_info, 48, 5, START)
+    assert key == simulation_cache_key(specs, climate, grid_info, 48, 5, START)
+    assert key != simulation_cache_key(specs, climate, grid_info, 48, 6, START)
+    assert key != simulation_cache_key(specs, climate, grid_info, 72, 5, START)
+
+
+def test_run_cached_simulation_reuses_entry(tmp_path, specs, climate, grid_info):
+    cache = SimulationCache(str(tmp_path))
+    first = run_cached_simulation(cache, specs, climate, grid_info, 48, seed=5, start_date=START)
+    second = run_cached_simulation(cache, specs, climate, grid_info, 48, seed=5, start_date=START)
+    np.testing.assert_array_equal(first.hourly_power_kw, second.hourly_power_kw)
+    assert cache.stats()['hits'] == 1
+
+
+def test_eviction_keeps_most_recent(tmp_path, specs, climate, grid_info):
+    result = run_full_simulation(specs, climate, grid_info, 48, seed=5, start_date=START)
+    probe = SimulationCache(str(tmp_path / "probe"))
+    probe.put("probe", result)
+    entry_bytes = probe.stats()['size_bytes']
+
+    cache = SimulationCache(str(tmp_path / "cache"), max_bytes=int(entry_bytes * 2.5))
+    for key in ("a", "b", "c"):
+        cache.put(key, result)
+
+    assert cache.stats()['evictions'] == 1
+    assert cache.get("a") is None
+    assert cache.get("b") is not None and cache.get("c") is not None
+    assert cache.stats()['size_bytes'] <= cache.max_bytes
+
+
+def test_incomplete_entries_are_dropped(tmp_path):
+    (tmp_path / "partial").mkdir()
+    (tmp_path / "partial" / "power_kw.npy").write_bytes(b"")
+    cache = SimulationCache(str(tmp_path))
+    assert cache.stats()['entries'] == 0
+    assert not (tmp_path / "partial").exists()
+
+
+def test_unseeded_runs_are_fresh_draws(tmp_path, specs, climate, grid_info):
+    cache = SimulationCache(str(tmp_path))
+    first = run_cached_simulation(cache, specs, climate, grid_info, 48, start_date=START)
+    second = run_cached_simulation(cache, specs, climate, grid_info, 48, start_date=START)
+    assert first.seed != second.seed
+    assert not np.array_equal(first.hourly_power_kw, second.hourly_power_kw)
+    assert cache.stats()['entries'] == 0
+
+
+def test_eviction_sees_entries_from_other_workers(tmp_path, specs, climate, grid_info):
+    result = run_full_simulation(specs, climate, grid_info, 48, seed=5, start_date=START)
+    probe = SimulationCache(str(tmp_path / "probe"))
+    probe.put("probe", result)
+    entry_bytes = probe.stats()['size_bytes']
+
+    # Two caches over one directory stand in for two server processes
+    directory = str(tmp_path / "shared")
+    first = SimulationCache(directory, max_bytes=int(entry_bytes * 2.5))
+    second = SimulationCache(directory, max_bytes=int(entry_bytes * 2.5))
+    first.put("a", result)
+    first.put("b", result)
+    second.put("c", result)
+
+    assert second.stats()['evictions'] == 1
+    assert first.get("a") is None
+    assert second.get("b") is not None and second.get("c") is not None
+    assert second.stats()['size_bytes'] <= second.max_bytes
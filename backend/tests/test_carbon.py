@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from services.carbon import (
+    CARBON_REGION_INDEX,
+    DAYS_PER_MONTH,
+    KG_PER_US_TON,
+    _load_profile_csv,
+    calculate_hourly_emissions,
+    carbon_intensity_array,
+    carbon_intensity_profile
+)
+from services.simulate import GridImpactCalculator, PowerSimulationResult
+
+YEAR_START = datetime(2023, 1, 1)  # Non-leap, so 8760 hours cover each month's days exactly
+
+
+def flat_result(hours=8760, kw=1000.0, step_minutes=60):
+    steps = hours * 60 // step_minutes
+    return PowerSimulationResult(
+        hourly_power_kw=np.full(steps, kw), hourly_utilization=np.full(steps, 50.0),
+        hourly_pue=np.full(steps, 1.5), peak_power_kw=kw, average_power_kw=kw,
+        annual_consumption_mwh=kw * hours / 1000, community_impact={},
+        start_date=YEAR_START, step_minutes=step_minutes
+    )
+
+
+@pytest.mark.parametrize("region", sorted(CARBON_REGION_INDEX))
+def test_profile_mean_matches_egrid_intensity(region):
+    profile = carbon_intensity_profile(region)
+    assert profile.shape == (12, 24) and (profile > 0).all()
+    annual_mean = (profile.mean(axis=1) * DAYS_PER_MONTH).sum() / DAYS_PER_MONTH.sum()
+    expected = GridImpactCalculator().grid_regions[region]["carbon_intensity"]
+    assert annual_mean == pytest.approx(expected, rel=1e-5)
+
+
+@pytest.mark.parametrize("region", ["CAISO", "ERCOT", "PACNW"])
+def test_flat_load_emits_at_the_annual_mean(region):
+    carbon = calculate_hourly_emissions(flat_result(), region)
+    assert carbon.annual_tons_co2 == pytest.approx(carbon.flat_rate_tons_co2, rel=1e-5)
+    assert len(carbon.monthly_tons_co2) == 12
+    assert sum(m['tons_co2'] for m in carbon.monthly_tons_co2) == pytest.approx(carbon.annual_tons_co2)
+    assert carbon.hourly_co2_kg.sum() / KG_PER_US_TON == pytest.approx(carbon.annual_tons_co2)
+
+
+def test_solar_region_shifts_the_cleanest_hours_to_midday():
+    carbon = calculate_hourly_emissions(flat_result(hours=48), "CAISO")
+    assert all(9 <= hour <= 15 for hour in carbon.optimal_hours)
+    assert len(carbon.optimal_hours_by_month) == 12
+
+
+def test_sub_hourly_steps_match_hourly():
+    hourly = calculate_hourly_emissions(flat_result(hours=240), "PJM")
+    quarter_hourly = calculate_hourly_emissions(flat_result(hours=240, step_minutes=15), "PJM")
+    assert quarter_hourly.annual_tons_co2 == pytest.approx(hourly.annual_tons_co2, rel=1e-9)
+    np.testing.assert_array_equal(
+        carbon_intensity_array("PJM", YEAR_START, 24, 15)[::4], carbon_intensity_array("PJM", YEAR_START, 24)
+    )
+
+
+def test_unknown_region_uses_default():
+    assert calculate_hourly_emissions(flat_result(hours=24), "NOWHERE").region_code == "DEFAULT"
+    np.testing.assert_array_equal(carbon_intensity_profile("NOWHERE"), carbon_intensity_profile("DEFAULT"))
+
+
+def test_measured_profile_csv(tmp_path):
+    path = tmp_path / "profiles.csv"
+    rows = ["region,month,hour,kg_per_kwh"]
+    rows += [f"ERCOT,{month},{hour},{0.3 + hour / 100}" for month in range(1, 13) for hour in range(24)]
+    rows += ["CAISO,1,0,0.2"]  # Incomplete regions are ignored
+    path.write_text("\n".join(rows) + "\n")
+    profiles = _load_profile_csv(str(path), ["ERCOT", "CAISO"])
+    assert list(profiles) == ["ERCOT"]
+    assert profiles["ERCOT"][5, 10] == pytest.approx(0.4)
@@ -0,0 +1,104 @@
+import os
+
+import numpy as np
+import pytest
+
+from services.county_resolver import (
+    CountyResolver,
+    _read_shapefile,
+    DEFAULT_COUNTY_INDEX_PATH,
+    build_county_index,
+    load_county_resolver,
+    save_county_index
+)
+
+# Four records clipped verbatim from the Census cartographic boundary file
+# cb_2016_us_county_500k: Albemarle VA (ring with a hole for Charlottesville),
+# Alameda CA, San Francisco CA (five parts incl. the Farallon Islands) and
+# Charlottesville city VA
+TIGER_CLIP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cb_2016_us_county_500k_clip")
+
+
+def _tiger_bytes():
+    with open(TIGER_CLIP + ".shp", "rb") as f_shp, open(TIGER_CLIP + ".dbf", "rb") as f_dbf:
+        return f_shp.read(), f_dbf.read()
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    return CountyResolver(**build_county_index(TIGER_CLIP + ".shp"))
+
+
+@pytest.fixture(scope="module")
+def bundled():
+    return load_county_resolver(DEFAULT_COUNTY_INDEX_PATH)
+
+
+def test_read_tiger_shapefile():
+    counties = _read_shapefile(*_tiger_bytes())
+    assert [row["GEOID"] for row, _ in counties] == ["51003", "06001", "06075", "51540"]
+    assert [len(rings) for _, rings in counties] == [2, 1, 5, 1]
+    row, rings = counties[1]
+    assert (row["STATEFP"], row["COUNTYFP"], row["NAME"]) == ("06", "001", "Alameda")
+    assert all(np.array_equal(ring[0], ring[-1]) for ring in rings)
+
+
+def test_deleted_dbf_records_are_skipped():
+    shp, dbf = _tiger_bytes()
+    header_length = int.from_bytes(dbf[8:10], "little")
+    record_length = int.from_bytes(dbf[10:12], "little")
+    dbf = bytearray(dbf)
+    dbf[header_length + record_length] = ord("*")  # Delete Alameda
+    counties = _read_shapefile(shp, bytes(dbf))
+    assert [row["GEOID"] for row, _ in counties] == ["51003", "06075", "51540"]
+    assert [len(rings) for _, rings in counties] == [2, 5, 1]
+
+
+@pytest.mark.parametrize("lat, lon, fips", [
+    (37.80, -122.27, "06001"),   # Oakland
+    (37.77, -122.42, "06075"),   # San Francisco mainland
+    (37.698, -123.00, "06075"),  # Southeast Farallon Island (separate part)
+    (38.03, -78.48, "51540"),    # Charlottesville, inside Albemarle's hole
+    (38.00, -78.60, "51003"),    # Albemarle outside the hole
+    (37.50, -122.80, None)       # Pacific, outside every county
+])
+def test_lookup(resolver, lat, lon, fips):
+    county = resolver.lookup(lat, lon)
+    assert (county["state_fips"] + county["county_fips"] if county else None) == fips
+
+
+def test_saved_index_round_trip(tmp_path, resolver):
+    path = str(tmp_path / "county_index.npz")
+    save_county_index(build_county_index(TIGER_CLIP + ".shp"), path)
+    loaded = load_county_resolver(path)
+    assert loaded.lookup(38.03, -78.48) == resolver.lookup(38.03, -78.48)
+    assert loaded.vertices.dtype == np.float64
+    for county in range(loaded.counties):
+        start, end = loaded.vertex_offsets[county], loaded.vertex_offsets[county + 1]
+        points = loaded.vertices[start:end]
+        assert (points.min(axis=0) >= loaded.bboxes[county, :2]).all()
+        assert (points.max(axis=0) <= loaded.bboxes[county, 2:]).all()
+
+
+def test_missing_index_warns(tmp_path, capsys):
+    assert load_county_resolver(str(tmp_path / "missing.npz")) is None
+    assert "county index" in capsys.readouterr().err
+
+
+def test_excluded_counties_fall_through(resolver):
+    index = build_county_index(TIGER_CLIP + ".shp", exclude=["06", "51540"])
+    assert list(index["fips"]) == ["51003"]
+    # Charlottesville sits in Albemarle's hole, so it is outside every remaining county
+    assert CountyResolver(**index).lookup(38.03, -78.48) is None
+
+
+@pytest.mark.parametrize("lat, lon, fips", [
+    (37.80, -122.27, "06001"),   # Oakland
+    (40.71, -74.006, "36061"),   # Manhattan
+    (21.30, -157.85, "15003"),   # Honolulu
+    (41.76, -72.67, None),       # Hartford: Connecticut is left to the geocoder
+    (61.13, -146.35, None)       # Valdez: Valdez-Cordova was split in 2019
+])
+def test_bundled_index(bundled, lat, lon, fips):
+    county = bundled.lookup(lat, lon)
+    assert (county["state_fips"] + county["county_fips"] if county else None) == fips
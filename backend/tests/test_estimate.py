@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from services.simulate import ClimateData, estimate_annual_power, run_full_simulation
+
+from conftest import START
+
+SEEDS = range(8)
+
+
+def hourly_climate():
+    hours = np.arange(8760)
+    return ClimateData(
+        dry_bulb_temp=70 + 20 * np.sin(2 * np.pi * hours / 24), wet_bulb_temp=60.0,
+        humidity=50 + 10 * np.cos(2 * np.pi * hours / 8760), wind_speed=5.0
+    )
+
+
+@pytest.mark.parametrize("fleet", ["specs", "mixed_specs"])
+@pytest.mark.parametrize("hourly", [False, True])
+@pytest.mark.parametrize("hours, resolution_minutes", [(24 * 28, 60), (24 * 7, 15)])
+def test_estimate_brackets_seeded_runs(request, fleet, hourly, hours, resolution_minutes, climate, grid_info):
+    specs = request.getfixturevalue(fleet)
+    climate = hourly_climate() if hourly else climate
+    estimate = estimate_annual_power(specs, climate, grid_info, hours, START, resolution_minutes)
+    runs = [
+        run_full_simulation(specs, climate, grid_info, hours, seed=seed, start_date=START,
+                            resolution_minutes=resolution_minutes)
+        for seed in SEEDS
+    ]
+
+    # Every seeded run's energy falls inside the 3-sigma band around the expectation
+    energy = np.array([run.annual_consumption_mwh for run in runs])
+    assert (np.abs(energy - estimate.expected_annual_mwh) <= estimate.annual_mwh_error).all()
+    assert estimate.annual_mwh_error < 0.02 * estimate.expected_annual_mwh
+
+    assert np.mean([run.hourly_utilization.mean() for run in runs]) == pytest.approx(
+        estimate.expected_utilization, rel=0.01
+    )
+    assert np.mean([run.hourly_pue.mean() for run in runs]) == pytest.approx(estimate.expected_pue, rel=1e-6)
+
+    # The median peak sits inside the 5-95% range; mixed fleets and hourly
+    # climate (highest PUE of the run) estimate an upper bound
+    low, high = estimate.peak_kw_range
+    median_peak = float(np.median([run.peak_power_kw for run in runs]))
+    assert low <= estimate.approximate_peak_kw <= high
+    assert median_peak <= high
+    if fleet == "specs" and not hourly:
+        assert low <= median_peak
+        assert median_peak == pytest.approx(estimate.approximate_peak_kw, rel=0.05)
@@ -0,0 +1,69 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import services.http_client as http_client
+from services.http_client import UpstreamClient
+
+
+class _Unavailable(BaseHTTPRequestHandler):
+    # Answers every request with 503 and counts them per method
+    def _reply(self):
+        self.server.calls[self.command] = self.server.calls.get(self.command, 0) + 1
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(http_client, "BACKOFF_BASE", 0)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Unavailable)
+    httpd.calls = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(httpd):
+    return f"http://127.0.0.1:{httpd.server_address[1]}/"
+
+
+def test_get_retries_server_errors(server):
+    response = UpstreamClient(max_retries=2).get(_url(server))
+    assert response.status_code == 503
+    assert server.calls == {"GET": 3}
+
+
+def test_post_is_not_retried_after_a_response(server):
+    response = UpstreamClient(max_retries=2).post(_url(server), data={"q": "1"})
+    assert response.status_code == 503
+    assert server.calls == {"POST": 1}
+
+
+def test_post_retries_when_marked_idempotent(server):
+    UpstreamClient(max_retries=2).post(_url(server), data={"q": "1"}, idempotent=True)
+    assert server.calls == {"POST": 3}
+
+
+def test_post_retries_refused_connections(monkeypatch):
+    monkeypatch.setattr(http_client, "BACKOFF_BASE", 0)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    client = UpstreamClient(max_retries=2)
+    with pytest.raises(requests.ConnectionError):
+        client.post(f"http://127.0.0.1:{port}/", data={"q": "1"})
+    stats = client.stats()[f"127.0.0.1:{port}"]
+    assert stats["errors"] == 3 and stats["retries"] == 2
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+import services.location_cache as location_cache
+from services.location_cache import LocationCache
+
+ALAMEDA = {"state_fips": "06", "county_fips": "001", "population": 1650000}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(location_cache, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache" / "locations.sqlite")
+
+
+def test_memory_and_disk_hits(clock, path):
+    cache = LocationCache(path)
+    assert cache.get_fips(37.8044, -122.2712) is None
+    cache.put_fips(37.8044, -122.2712, {"state_fips": "06", "county_fips": "001"})
+    # Clicks within the same 0.01 degree cell share the entry
+    assert cache.get_fips(37.8012, -122.2689) == {"state_fips": "06", "county_fips": "001"}
+    assert cache.stats()["fips"]["memory_hits"] == 1
+
+    # A second process on the host starts cold and reads through to SQLite, then memory
+    other = LocationCache(path)
+    assert other.get_fips(37.80, -122.27) == {"state_fips": "06", "county_fips": "001"}
+    assert other.get_fips(37.80, -122.27) is not None
+    stats = other.stats()["fips"]
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 0)
+    assert stats["disk_entries"] == 1 and stats["hit_ratio"] == 1.0
+
+
+def test_entries_expire_per_namespace(clock, path):
+    cache = LocationCache(path, ttl_seconds={"acs": 60})
+    cache.put_acs(ALAMEDA)
+    cache.put_fips(37.80, -122.27, {"state_fips": "06", "county_fips": "001"})
+
+    clock.now += 59
+    assert cache.get_acs("06", "001") == ALAMEDA
+    clock.now += 2
+    assert cache.get_acs("06", "001") is None
+    assert LocationCache(path).get_acs("06", "001") is None  # Expired on disk too
+    assert cache.get_fips(37.80, -122.27) is not None       # fips keeps its yearly TTL
+
+    assert cache.purge_expired() == 1
+    assert cache.stats()["acs"]["disk_entries"] == 0
+
+
+def test_memory_tier_evicts_least_recently_used(clock, path):
+    cache = LocationCache(path, memory_entries=2)
+    rows = [dict(ALAMEDA, county_fips=f"{county:03d}") for county in (1, 3, 5)]
+    assert cache.preload_acs(rows[:2]) == 2
+    assert cache.get_acs("06", "001") is not None  # 001 becomes most recent
+    cache.put_acs(rows[2])                         # Evicts 003 from memory
+
+    assert cache.stats()["acs"]["memory_entries"] == 2
+    assert cache.get_acs("06", "003") == rows[1]   # Still on disk
+    stats = cache.stats()["acs"]
+    assert stats["disk_hits"] == 1 and stats["disk_entries"] == 3
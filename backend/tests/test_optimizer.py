@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from services.optimizer import flexible_power_profile, optimize_load_shifting, shift_power_profile
+from services.representative_days import run_representative_simulation
+from services.simulate import run_full_simulation
+from services.tariff import get_tariff
+
+from conftest import START
+
+
+def test_shift_conserves_energy_per_window():
+    rng = np.random.default_rng(0)
+    power = rng.uniform(500, 1000, 24 * 7)
+    flexible = power * 0.3
+    score = rng.uniform(0, 1, 24 * 7)
+    shifted, cap = shift_power_profile(power, flexible, score, 24)
+
+    np.testing.assert_allclose(shifted.reshape(7, 24).sum(axis=1), power.reshape(7, 24).sum(axis=1))
+    assert shifted.max() <= cap + 1e-9
+    assert cap <= power.max() + 1e-9
+    assert (shifted >= (power - flexible) - 1e-9).all()
+
+
+@pytest.mark.parametrize("objective", ["cost", "carbon", "blended"])
+@pytest.mark.parametrize("window", ["daily", "weekly"])
+def test_optimizer_conserves_energy_and_does_not_raise_cost(mixed_specs, climate, grid_info, objective, window):
+    result = run_full_simulation(mixed_specs, climate, grid_info, 24 * 14, seed=2, start_date=START)
+    shift = optimize_load_shifting(result, grid_info, get_tariff("CAISO"), flexible_fraction=0.5,
+                                   window=window, objective=objective)
+
+    assert shift.shifted_power_kw.sum() == pytest.approx(result.hourly_power_kw.sum(), rel=1e-9)
+    assert shift.shifted_peak_kw <= shift.original_peak_kw + 1e-6
+    if objective == "cost":
+        assert shift.shifted_cost.energy_cost <= shift.original_cost.energy_cost + 1e-6
+
+
+def test_no_flexible_load_leaves_profile_unchanged(specs, climate, grid_info):
+    result = run_full_simulation(specs, climate, grid_info, 48, seed=2, start_date=START)
+    shift = optimize_load_shifting(result, grid_info, get_tariff("CAISO"))
+    np.testing.assert_allclose(shift.shifted_power_kw, result.hourly_power_kw)
+    assert shift.flexible_share == 0.0
+
+
+def test_flexible_load_follows_the_flexible_groups(mixed_specs, climate, grid_info):
+    result = run_full_simulation(mixed_specs, climate, grid_info, 24 * 7, seed=3, start_date=START,
+                                 progress_callback=lambda _: None)
+    training_kw = flexible_power_profile(result)
+    enterprise_kw = flexible_power_profile(result, ("enterprise",))
+    np.testing.assert_allclose(training_kw + enterprise_kw, result.hourly_power_kw)
+    np.testing.assert_allclose(flexible_power_profile(result, ("nvidia_h100/ai_training",)), training_kw)
+
+    # Only the training group's own draw moves; the enterprise load stays in place
+    shift = optimize_load_shifting(result, grid_info, get_tariff("CAISO"), flexible_fraction=1.0)
+    assert (shift.shifted_power_kw >= enterprise_kw - 1e-6).all()
+    assert shift.flexible_types == ("ai_training",)
+
+
+def test_representative_runs_keep_group_series(mixed_specs, climate, grid_info):
+    result = run_representative_simulation(mixed_specs, climate, grid_info, 24 * 28, seed=3, start_date=START)
+    np.testing.assert_allclose(
+        flexible_power_profile(result, ("ai_training", "enterprise")), result.hourly_power_kw, rtol=1e-6
+    )
+
+
+def test_unreachable_capacity_is_reported(mixed_specs, climate, grid_info):
+    result = run_full_simulation(mixed_specs, climate, grid_info, 48, seed=2, start_date=START)
+    shift = optimize_load_shifting(result, grid_info, get_tariff("CAISO"), capacity_kw=1.0)
+    assert not shift.capacity_met and shift.requested_capacity_kw == 1.0
+    assert shift.capacity_kw > 1.0
+    assert optimize_load_shifting(result, grid_info, get_tariff("CAISO"),
+                                  capacity_kw=result.peak_power_kw).capacity_met
@@ -0,0 +1,74 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.pipeline import StagePipeline
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def test_stages_run_after_their_dependencies(executor):
+    events = []
+    lock = threading.Lock()
+    both_started = threading.Barrier(2, timeout=5)
+
+    def stage(name, value, wait=False):
+        def run(*inputs):
+            with lock:
+                events.append(("start", name))
+            if wait:
+                both_started.wait()  # Only passes if the two middle stages overlap
+            with lock:
+                events.append(("end", name))
+            return value + sum(inputs)
+        return run
+
+    pipeline = (StagePipeline(executor)
+                .add("geocode", stage("geocode", 1))
+                .add("location", stage("location", 10, wait=True), depends_on=["geocode"])
+                .add("energy", stage("energy", 100, wait=True), depends_on=["geocode"])
+                .add("report", stage("report", 1000), depends_on=["location", "energy"]))
+    results = pipeline.run(timeout=5)
+
+    assert results == {"geocode": 1, "location": 11, "energy": 101, "report": 1112}
+    for stage_name, dependencies in [("location", ["geocode"]), ("energy", ["geocode"]),
+                                     ("report", ["location", "energy"])]:
+        for dependency in dependencies:
+            assert events.index(("end", dependency)) < events.index(("start", stage_name))
+    assert set(pipeline.timings) == set(results)
+
+
+def test_failures_propagate_downstream_only(executor):
+    calls = []
+
+    def failing():
+        raise ConnectionError("geocoder unavailable")
+
+    pipeline = (StagePipeline(executor)
+                .add("climate", lambda: "sunny")
+                .add("geocode", failing)
+                .add("location", lambda geo: calls.append("location"), depends_on=["geocode"])
+                .add("report", lambda climate, location: calls.append("report"),
+                     depends_on=["climate", "location"]))
+
+    assert pipeline.result("climate", timeout=5) == "sunny"
+    for name in ("geocode", "location", "report"):
+        with pytest.raises(ConnectionError, match="geocoder unavailable"):
+            pipeline.result(name, timeout=5)
+    assert calls == []
+    with pytest.raises(ConnectionError):
+        pipeline.run(timeout=5)
+
+
+def test_graph_is_checked_when_built(executor):
+    pipeline = StagePipeline(executor).add("geocode", lambda: 1)
+    with pytest.raises(ValueError):
+        pipeline.add("location", lambda geo: geo, depends_on=["geocoder"])
+    pipeline.start()
+    with pytest.raises(RuntimeError):
+        pipeline.add("energy", lambda geo: geo, depends_on=["geocode"])
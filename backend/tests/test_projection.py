@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import pytest
+
+from services.projection import ProjectionSchedule, run_projection
+
+
+def test_aware_phase_dates_are_converted_to_utc():
+    schedule = ProjectionSchedule(phases=[
+        {'date': '2025-03-01T02:00:00+05:00', 'server_count': 100},
+        {'date': datetime(2025, 1, 1), 'server_count': 50}
+    ])
+    assert [p.date for p in schedule.phases] == [datetime(2025, 1, 1), datetime(2025, 2, 28, 21)]
+    assert all(p.date.tzinfo is None for p in schedule.phases)
+
+
+def test_months_without_servers_report_no_averages(specs, climate, grid_info):
+    schedule = ProjectionSchedule(phases=[{'date': '2025-03-01', 'server_count': 1000}])
+    result = run_projection(specs, climate, grid_info, schedule, years=1, seed=1, start_date=datetime(2025, 1, 1))
+    assert [m['servers_online'] for m in result.monthly[:3]] == [0, 0, 1000]
+    for month in result.monthly[:2]:
+        assert month['energy_mwh'] == 0
+        assert month['average_pue'] is None and month['average_utilization'] is None
+    assert result.monthly[2]['average_pue'] > 1
+    assert result.yearly[0]['average_pue'] > 1
+
+
+@pytest.mark.parametrize("server_count", [-1, 2001])
+def test_phases_outside_the_facility_are_rejected(specs, climate, grid_info, server_count):
+    schedule = ProjectionSchedule(phases=[{'date': '2025-03-01', 'server_count': server_count}])
+    with pytest.raises(ValueError, match="server_count"):
+        run_projection(specs, climate, grid_info, schedule, years=1, seed=1)
+
+
+def test_years_are_aligned_to_a_mid_month_start(specs, climate, grid_info):
+    result = run_projection(specs, climate, grid_info, ProjectionSchedule(), years=2, seed=1,
+                            start_date=datetime(2025, 1, 31))
+    assert [m['start'] for m in result.monthly[:4]] == ['2025-01-31', '2025-02-28', '2025-03-31', '2025-04-30']
+    assert [y['start'] for y in result.yearly] == ['2025-01-31', '2026-01-31']
+    hours = [m['energy_mwh'] / m['average_mw'] for m in result.monthly]
+    assert sum(hours[:12]) == 365 * 24 and sum(hours[12:]) == 365 * 24
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import services.representative_days as representative_days
+from services.representative_days import _pairwise_distance, run_representative_simulation, simulate_representative_days
+from services.simulate import ClimateData
+
+from conftest import START
+
+
+def test_peak_matches_series(mixed_specs, climate, grid_info):
+    result = run_representative_simulation(mixed_specs, climate, grid_info, 24 * 60, 6, seed=3, start_date=START)
+    assert result.peak_power_kw == pytest.approx(float(result.hourly_power_kw.max()))
+    assert result.summary.load_factor == pytest.approx(result.average_power_kw / result.peak_power_kw)
+    assert result.corrected_peak_kw >= result.peak_power_kw
+    assert len(result.hourly_power_kw) == 24 * 60
+
+
+def test_chunked_pairwise_distance_is_exact(monkeypatch):
+    features = np.random.default_rng(0).normal(size=(300, 5))
+    dense = np.sqrt(((features[:, None, :] - features[None, :, :]) ** 2).sum(axis=2))
+    monkeypatch.setattr(representative_days, "PAIRWISE_CHUNK_ELEMENTS", 1000)
+    np.testing.assert_array_equal(_pairwise_distance(features), dense)
+
+
+@pytest.mark.parametrize("hourly", [False, True])
+@pytest.mark.parametrize("hours, resolution_minutes", [(24 * 60, 60), (24 * 30 + 7, 60), (24 * 14, 15)])
+def test_weighted_statistics_match_rebuilt_series(mixed_specs, climate, grid_info, hourly, hours, resolution_minutes):
+    if hourly:
+        steps = np.arange(8760)
+        climate = ClimateData(
+            dry_bulb_temp=70 + 20 * np.sin(2 * np.pi * steps / 24),
+            wet_bulb_temp=60 + 5 * np.sin(2 * np.pi * steps / 24),
+            humidity=50 + 10 * np.cos(2 * np.pi * steps / 8760), wind_speed=5.0
+        )
+    lazy = simulate_representative_days(mixed_specs, climate, grid_info, hours, 6, seed=3, start_date=START,
+                                        resolution_minutes=resolution_minutes, dtype=np.float64)
+    assert "_simulation_result" not in lazy.__dict__
+    series = lazy.to_simulation_result()
+    assert lazy.to_simulation_result() is series
+
+    assert len(series.hourly_power_kw) == hours * 60 // resolution_minutes
+    assert lazy.peak_power_kw == pytest.approx(float(series.hourly_power_kw.max()), rel=1e-12)
+    assert lazy.average_power_kw == pytest.approx(float(series.hourly_power_kw.mean()), rel=1e-12)
+    assert lazy.average_utilization == pytest.approx(series.summary.utilization.mean, rel=1e-12)
+    assert lazy.average_pue == pytest.approx(series.summary.pue.mean, rel=1e-12)
+    assert (lazy.day_power_kw.ravel() @ lazy.step_weights) * series.step_hours / 1000 == pytest.approx(
+        lazy.annual_consumption_mwh, rel=1e-12
+    )
+    assert lazy.day_weights.sum() == -(-hours // 24)
+    for group, group_series in zip(lazy.fleet_breakdown, series.group_it_power_kw):
+        assert group['peak_it_power_kw'] == pytest.approx(float(group_series.max()), rel=1e-12)
+        assert group['average_it_power_kw'] == pytest.approx(float(group_series.mean()), rel=1e-12)
+
+    full = run_representative_simulation(mixed_specs, climate, grid_info, hours, 6, seed=3, start_date=START,
+                                         resolution_minutes=resolution_minutes, dtype=np.float64)
+    np.testing.assert_array_equal(full.hourly_power_kw, series.hourly_power_kw)
@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from services.simulate import (
+    ClimateData,
+    GridInfo,
+    PowerSimulationResult,
+    ServerPowerModel,
+    assemble_simulation_result,
+    iter_simulation_chunks,
+    naive_utc,
+    run_full_simulation,
+    simulate_sites
+)
+
+from conftest import START
+
+
+def test_aggregates_match_hourly_series(specs, climate, grid_info):
+    result = run_full_simulation(specs, climate, grid_info, 240)
+    power = np.asarray(result.hourly_power_kw)
+    assert len(power) == len(result.hourly_utilization) == len(result.hourly_pue) == 240
+    assert result.peak_power_kw == pytest.approx(power.max())
+    assert result.average_power_kw == pytest.approx(power.mean())
+    assert result.annual_consumption_mwh == pytest.approx(power.sum() / 1000)
+    assert np.all(np.asarray(result.hourly_pue) >= 1)
+    assert 0 <= min(result.hourly_utilization) and max(result.hourly_utilization) <= 100
+
+
+def test_power_ratio_clamps_out_of_range_utilization():
+    model = ServerPowerModel("enterprise")
+    np.testing.assert_array_equal(model.power_ratio([-5, 0, 100, 130]), model.power_ratio([0, 0, 100, 100]))
+    assert model.get_power_consumption(500, 150) == model.get_power_consumption(500, 100)
+    assert model.power_ratio(0) < model.power_ratio(50) < model.power_ratio(100)
+
+
+def test_start_date_offsets_convert_to_utc():
+    assert naive_utc("2025-01-01T00:00-08:00") == datetime(2025, 1, 1, 8)
+    assert naive_utc("2025-01-01T00:00Z") == datetime(2025, 1, 1)
+    assert naive_utc(datetime(2025, 1, 1, tzinfo=timezone.utc)).tzinfo is None
+    assert naive_utc(datetime(2025, 1, 1, 5)) == datetime(2025, 1, 1, 5)
+
+
+def test_seeded_runs_are_identical(specs, climate, grid_info):
+    first = run_full_simulation(specs, climate, grid_info, 240, seed=7, start_date=START)
+    second = run_full_simulation(specs, climate, grid_info, 240, seed=7, start_date=START)
+    np.testing.assert_array_equal(first.hourly_power_kw, second.hourly_power_kw)
+    np.testing.assert_array_equal(first.hourly_utilization, second.hourly_utilization)
+    assert first.peak_power_kw == second.peak_power_kw
+    assert first.seed == 7
+
+
+def test_different_seeds_differ(specs, climate, grid_info):
+    first = run_full_simulation(specs, climate, grid_info, 240, seed=7, start_date=START)
+    second = run_full_simulation(specs, climate, grid_info, 240, seed=8, start_date=START)
+    assert not np.array_equal(first.hourly_power_kw, second.hourly_power_kw)
+
+
+@pytest.mark.parametrize("chunk_hours", [1, 24, 100])
+def test_chunked_run_matches_full_run(specs, climate, grid_info, chunk_hours):
+    full = run_full_simulation(specs, climate, grid_info, 240, seed=3, start_date=START)
+    chunks = list(iter_simulation_chunks(specs, climate, 240, chunk_hours=chunk_hours,
+                                         seed=3, start_date=START))
+    chunked = assemble_simulation_result(chunks, grid_info)
+    np.testing.assert_array_equal(chunked.hourly_power_kw, full.hourly_power_kw)
+    np.testing.assert_array_equal(chunked.hourly_pue, full.hourly_pue)
+    assert chunked.peak_power_kw == full.peak_power_kw
+    assert chunked.annual_consumption_mwh == pytest.approx(full.annual_consumption_mwh, rel=1e-12)
+    assert chunks[-1].hours_completed == 240
+
+
+def test_empty_runs_are_rejected(specs, climate, grid_info):
+    with pytest.raises(ValueError):
+        run_full_simulation(specs, climate, grid_info, 0, seed=1, start_date=START)
+    with pytest.raises(ValueError):
+        assemble_simulation_result([], grid_info)
+
+
+def test_mixed_fleet_chunked_matches_full_run(mixed_specs, climate, grid_info):
+    full = run_full_simulation(mixed_specs, climate, grid_info, 120, seed=3, start_date=START)
+    chunks = list(iter_simulation_chunks(mixed_specs, climate, 120, chunk_hours=50, seed=3, start_date=START))
+    chunked = assemble_simulation_result(chunks, grid_info)
+    np.testing.assert_array_equal(chunked.hourly_power_kw, full.hourly_power_kw)
+    assert chunked.fleet_breakdown == full.fleet_breakdown
+    assert [group['count'] for group in full.fleet_breakdown] == [200, 1000]
+
+
+def test_sites_match_single_site_runs(specs, climate, grid_info):
+    hours = np.arange(8760)
+    hourly = ClimateData(
+        dry_bulb_temp=70 + 20 * np.sin(2 * np.pi * hours / 24), wet_bulb_temp=60.0,
+        humidity=50 + 10 * np.cos(2 * np.pi * hours / 8760), wind_speed=5.0
+    )
+    small_grid = GridInfo(region_code='ERCOT', baseline_demand_mw=300, total_households=50_000)
+    sites = [(climate, grid_info), (hourly, small_grid)]
+    batched = simulate_sites(specs, sites, 96, seed=11, start_date=START)
+    assert len(batched) == 2
+    for result, (site_climate, site_grid) in zip(batched, sites):
+        single = run_full_simulation(specs, site_climate, site_grid, 96, seed=11, start_date=START)
+        np.testing.assert_allclose(result.hourly_power_kw, single.hourly_power_kw, rtol=1e-12)
+        np.testing.assert_allclose(result.hourly_pue, single.hourly_pue, rtol=1e-12)
+        assert result.peak_power_kw == pytest.approx(single.peak_power_kw, rel=1e-12)
+        for key in ('peak_impact_percent', 'average_impact_percent', 'stability_risk'):
+            assert result.community_impact[key] == pytest.approx(single.community_impact[key])
+    assert simulate_sites(specs, [], 96, seed=11) == []
+
+
+def test_downsample_buckets():
+    power = np.arange(48, dtype=float)
+    result = PowerSimulationResult(
+        hourly_power_kw=power, hourly_utilization=power / 2, hourly_pue=np.full(48, 1.5),
+        peak_power_kw=47.0, average_power_kw=23.5, annual_consumption_mwh=0.0, community_impact={}
+    )
+    daily = result.downsample('daily')
+    np.testing.assert_allclose(daily['power_kw']['mean'], [11.5, 35.5])
+    np.testing.assert_array_equal(daily['power_kw']['min'], [0, 24])
+    np.testing.assert_array_equal(daily['power_kw']['max'], [23, 47])
+    assert len(result.downsample('hourly')['pue']['mean']) == 48
+    # Partial trailing bucket averages only the steps it holds
+    np.testing.assert_allclose(result.downsample('weekly')['power_kw']['mean'], [23.5])
+    with pytest.raises(ValueError):
+        result.downsample('monthly')
+
+
+def test_downsample_sub_hourly(specs, climate, grid_info):
+    result = run_full_simulation(specs, climate, grid_info, 48, seed=1, start_date=START, resolution_minutes=15)
+    daily = result.downsample('daily')
+    assert len(result.hourly_power_kw) == 48 * 4
+    assert len(daily['power_kw']['mean']) == 2
+    assert daily['power_kw']['max'].max() == pytest.approx(result.hourly_power_kw.max())
+
+
+@pytest.mark.parametrize("resolution_minutes", [60, 15])
+def test_ensemble_matches_deterministic_resolution(specs, climate, grid_info, resolution_minutes):
+    from services.simulate import run_ensemble_simulation
+    single = run_full_simulation(specs, climate, grid_info, 168, seed=4, start_date=START,
+                                 resolution_minutes=resolution_minutes)
+    ensemble = run_ensemble_simulation(specs, climate, grid_info, 32, 168, seed=4, start_date=START,
+                                       parallel=False, resolution_minutes=resolution_minutes)
+    assert ensemble.step_minutes == resolution_minutes
+    energy = ensemble.bands['annual_consumption_mwh']
+    assert energy['p50'] == pytest.approx(single.annual_consumption_mwh, rel=0.05)
@@ -0,0 +1,82 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from services.simulate import ClimateData, DataCenterSpecs, create_datacenter_specs_from_config, estimate_wet_bulb
+from services.surrogate import load_surrogate_grid, save_surrogate_grid
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return load_surrogate_grid()
+
+
+def score_one(grid, server_type, datacenter_type, cooling_type, temperature, humidity, nameplate_kw=1.0):
+    result = grid.score([server_type], [datacenter_type], [cooling_type], [temperature], [humidity], nameplate_kw)
+    return np.array([result['annual_mwh'][0], result['peak_kw'][0], result['mean_pue'][0]])
+
+
+def test_grid_points_return_stored_values(grid):
+    # Every category at a spread of climate points, including both ends of each axis
+    temperature_indices = [0, 1, 14, len(grid.temperatures) - 2, len(grid.temperatures) - 1]
+    humidity_indices = [0, 9, len(grid.humidities) - 1]
+    for (s, server_type), (w, datacenter_type), (c, cooling_type) in itertools.product(
+        enumerate(grid.server_types), enumerate(grid.datacenter_types), enumerate(grid.cooling_types)
+    ):
+        for t, h in itertools.product(temperature_indices, humidity_indices):
+            np.testing.assert_allclose(
+                score_one(grid, server_type, datacenter_type, cooling_type,
+                          grid.temperatures[t], grid.humidities[h]),
+                grid.values[s, w, c, t, h], rtol=1e-6
+            )
+
+
+def test_bilinear_between_grid_points_and_clamped_outside(grid):
+    corners = grid.values[0, 0, 0, 3:5, 6:8].astype(float)
+    temperature = (grid.temperatures[3] + grid.temperatures[4]) / 2
+    humidity = (grid.humidities[6] + grid.humidities[7]) / 2
+    args = (grid.server_types[0], grid.datacenter_types[0], grid.cooling_types[0])
+    np.testing.assert_allclose(score_one(grid, *args, temperature, humidity), corners.mean(axis=(0, 1)), rtol=1e-6)
+
+    np.testing.assert_allclose(score_one(grid, *args, 500.0, -10.0), grid.values[0, 0, 0, -1, 0], rtol=1e-6)
+
+
+def test_nameplate_scales_energy_and_peak_not_pue(grid):
+    single = score_one(grid, "nvidia_h100", "ai_training", "liquid_cooling", 72.0, 40.0)
+    scaled = score_one(grid, "nvidia_h100", "ai_training", "liquid_cooling", 72.0, 40.0, nameplate_kw=2500.0)
+    np.testing.assert_allclose(scaled, single * [2500, 2500, 1], rtol=1e-6)
+
+
+def test_unknown_names_fall_back_to_simulator_defaults(grid):
+    np.testing.assert_allclose(
+        score_one(grid, "quantum", "mining", "peltier", 60.0, 50.0),
+        score_one(grid, "enterprise", "enterprise", "air_cooled", 60.0, 50.0)
+    )
+
+
+def test_score_specs_sums_fleet_groups(grid):
+    climate = ClimateData(dry_bulb_temp=80.0, wet_bulb_temp=float(estimate_wet_bulb(80.0, 30.0)),
+                          humidity=30.0, wind_speed=5.0)
+    specs = create_datacenter_specs_from_config({'cooling_type': 'water_cooled', 'fleet': [
+        {'server_type': 'nvidia_h100', 'datacenter_type': 'ai_training', 'count': 100, 'max_power_per_server': 3000},
+        {'server_type': 'enterprise', 'datacenter_type': 'cloud_compute', 'count': 400, 'max_power_per_server': 500}
+    ]})
+    fleet = grid.score_specs(specs, climate)
+    training = score_one(grid, "nvidia_h100", "ai_training", "water_cooled", 80.0, 30.0, 300.0)
+    cloud = score_one(grid, "enterprise", "cloud_compute", "water_cooled", 80.0, 30.0, 200.0)
+    assert fleet['annual_mwh'] == pytest.approx(training[0] + cloud[0], rel=1e-6)
+    assert fleet['peak_kw'] == pytest.approx(training[1] + cloud[1], rel=1e-6)
+    assert fleet['mean_pue'] == pytest.approx(training[2], rel=1e-6)
+
+    hourly = ClimateData(dry_bulb_temp=np.full(24, 80.0), wet_bulb_temp=70.0, humidity=30.0, wind_speed=5.0)
+    with pytest.raises(ValueError):
+        grid.score_specs(DataCenterSpecs(10, 500.0, 1000), hourly)
+
+
+def test_saved_grid_round_trip(tmp_path, grid):
+    path = str(tmp_path / "grid.npy")
+    save_surrogate_grid(np.asarray(grid.values), grid.meta, path)
+    loaded = load_surrogate_grid(path)
+    assert loaded.server_types == grid.server_types and loaded.cooling_types == grid.cooling_types
+    np.testing.assert_array_equal(loaded.values, grid.values)
@@ -0,0 +1,60 @@
+import pytest
+
+from services.carbon import calculate_hourly_emissions
+from services.simulate import DataCenterSpecs, run_full_simulation
+from services.sweep import SWEEP_RANK_METRICS, run_parameter_sweep
+from services.tariff import calculate_tou_cost, get_tariff
+
+from conftest import START
+
+SWEEP = dict(server_count=500, max_power_per_server=800, simulation_hours=24 * 10, seed=6, start_date=START)
+
+
+@pytest.fixture
+def sweep(climate, grid_info):
+    return run_parameter_sweep(
+        climate, grid_info, cooling_types=["air_cooled", "liquid_cooling"],
+        server_types=["enterprise", "nvidia_h100"], datacenter_types=["cloud_compute", "ai_training"],
+        demand_charge_per_kw=12.0, **SWEEP
+    )
+
+
+def test_every_configuration_is_ranked(sweep):
+    assert len(sweep.rows) == 8
+    assert [row['ranks']['annual_cost'] for row in sweep.rows] == list(range(1, 9))
+    costs = [row['annual_cost'] for row in sweep.rows]
+    assert costs == sorted(costs)
+    for metric in SWEEP_RANK_METRICS:
+        assert sorted(row['ranks'][metric] for row in sweep.rows) == list(range(1, 9))
+
+
+@pytest.mark.parametrize("index", range(8))
+def test_rows_match_single_configuration_runs(sweep, climate, grid_info, index):
+    row = sweep.rows[index]
+    specs = DataCenterSpecs(
+        server_count=SWEEP['server_count'], max_power_per_server=SWEEP['max_power_per_server'],
+        facility_size_sqft=50000, cooling_type=row['cooling_type'],
+        server_type=row['server_type'], datacenter_type=row['datacenter_type']
+    )
+    result = run_full_simulation(specs, climate, grid_info, SWEEP['simulation_hours'],
+                                 seed=SWEEP['seed'], start_date=START)
+    tariff = get_tariff('CAISO', 12.0)
+
+    assert row['annual_mwh'] == pytest.approx(result.annual_consumption_mwh, rel=1e-9)
+    assert row['peak_mw'] == pytest.approx(result.peak_power_kw / 1000, rel=1e-9)
+    assert row['average_pue'] == pytest.approx(float(result.hourly_pue.mean()), rel=1e-9)
+    assert row['annual_cost'] == pytest.approx(calculate_tou_cost(result, tariff).total_cost, rel=1e-9)
+    assert row['annual_tons_co2'] == pytest.approx(
+        calculate_hourly_emissions(result, 'CAISO').annual_tons_co2, rel=1e-9
+    )
+    assert row['peak_impact_percent'] == pytest.approx(result.community_impact['peak_impact_percent'])
+
+
+def test_unknown_types_are_dropped_and_rank_is_checked(climate, grid_info):
+    sweep = run_parameter_sweep(climate, grid_info, cooling_types=["air_cooled", "peltier"],
+                                server_types=["enterprise"], datacenter_types=["gaming", "mining"], **SWEEP)
+    assert [(row['cooling_type'], row['datacenter_type']) for row in sweep.rows] == [("air_cooled", "gaming")]
+    with pytest.raises(ValueError):
+        run_parameter_sweep(climate, grid_info, cooling_types=["peltier"], **SWEEP)
+    with pytest.raises(ValueError):
+        run_parameter_sweep(climate, grid_info, rank_by="square_feet", **SWEEP)
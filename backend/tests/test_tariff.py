@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from services.simulate import PowerSimulationResult
+from services.tariff import TARIFF_REFERENCE_YEAR, calculate_tou_cost, get_tariff, tariff_price_array
+
+
+def flat_result(hours=8760, kw=1000.0, start=TARIFF_REFERENCE_YEAR, step_minutes=60):
+    steps = hours * 60 // step_minutes
+    return PowerSimulationResult(
+        hourly_power_kw=np.full(steps, kw), hourly_utilization=np.full(steps, 50.0),
+        hourly_pue=np.full(steps, 1.5), peak_power_kw=kw, average_power_kw=kw,
+        annual_consumption_mwh=kw * hours / 1000, community_impact={},
+        start_date=start, step_minutes=step_minutes
+    )
+
+
+@pytest.mark.parametrize("region", ["CAISO", "ERCOT", "DEFAULT"])
+def test_flat_load_pays_base_rate(region):
+    tariff = get_tariff(region)
+    cost = calculate_tou_cost(flat_result(), tariff)
+    assert cost.energy_cost == pytest.approx(cost.flat_rate_cost, rel=1e-9)
+    assert cost.effective_rate == pytest.approx(tariff.base_rate, rel=1e-9)
+
+
+def test_sub_hourly_flat_load_pays_base_rate():
+    tariff = get_tariff("CAISO")
+    cost = calculate_tou_cost(flat_result(step_minutes=15), tariff)
+    assert cost.effective_rate == pytest.approx(tariff.base_rate, rel=1e-9)
+
+
+def test_peak_hours_cost_more_and_demand_charges_bill_monthly_peaks():
+    tariff = get_tariff("CAISO", demand_charge_per_kw=10.0)
+    prices = tariff_price_array(tariff, TARIFF_REFERENCE_YEAR, 24 * 7)
+    assert prices.max() / prices.min() >= tariff.peak_multiplier * 0.99
+
+    cost = calculate_tou_cost(flat_result(), tariff)
+    assert len(cost.monthly_bills) == 12
+    assert cost.demand_charges == pytest.approx(12 * 1000.0 * 10.0)
+    assert cost.total_cost == pytest.approx(cost.energy_cost + cost.demand_charges)